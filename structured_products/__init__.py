@@ -8,7 +8,12 @@ and fetch historical prices for those dates from Yahoo Finance.
 __version__ = "0.5.0"
 
 from .parser import extract_symbols, extract_dates
-from .fetcher import fetch_historical_prices, fetch_prices_for_multiple_symbols
+from .fetcher import (
+    fetch_historical_prices,
+    fetch_prices_for_multiple_symbols,
+    fetch_prices_for_multiple_symbols_batched,
+    clear_invalid_symbols
+)
 from .validation import (
     validate_dates,
     validate_symbols,
@@ -24,6 +29,7 @@ from .cache import PriceCache, get_cache, clear_global_cache
 from .calendar import (
     Market,
     is_trading_day,
+    are_trading_days,
     next_trading_day,
     previous_trading_day,
     get_settlement_date,
@@ -35,6 +41,7 @@ from .identifiers import (
     extract_cusip,
     extract_isin,
     validate_cusip,
+    validate_cusips,
     validate_isin
 )
 from .pdf import (
@@ -46,6 +53,7 @@ from .analytics import (
     calculate_realized_volatility,
     calculate_rolling_volatilities,
     calculate_greeks,
+    calculate_greeks_grid,
     analyze_structured_product_greeks,
     calculate_breakeven_levels,
     calculate_risk_metrics,
@@ -59,6 +67,7 @@ from .table_extractor import (
 )
 from .filing_parser import (
     parse_filing,
+    parse_filings_batch,
     ParsedFiling,
     detect_issuer,
     ISSUER_CONFIGS,
@@ -69,6 +78,8 @@ __all__ = [
     "extract_dates",
     "fetch_historical_prices",
     "fetch_prices_for_multiple_symbols",
+    "fetch_prices_for_multiple_symbols_batched",
+    "clear_invalid_symbols",
     "validate_dates",
     "validate_symbols",
     "validate_extraction_results",
@@ -81,6 +92,7 @@ __all__ = [
     "clear_global_cache",
     "Market",
     "is_trading_day",
+    "are_trading_days",
     "next_trading_day",
     "previous_trading_day",
     "get_settlement_date",
@@ -90,6 +102,7 @@ __all__ = [
     "extract_cusip",
     "extract_isin",
     "validate_cusip",
+    "validate_cusips",
     "validate_isin",
     "is_pdf_supported",
     "extract_text_from_pdf",
@@ -97,6 +110,7 @@ __all__ = [
     "calculate_realized_volatility",
     "calculate_rolling_volatilities",
     "calculate_greeks",
+    "calculate_greeks_grid",
     "analyze_structured_product_greeks",
     "calculate_breakeven_levels",
     "calculate_risk_metrics",
@@ -106,6 +120,7 @@ __all__ = [
     "parse_value",
     "LABEL_MAP",
     "parse_filing",
+    "parse_filings_batch",
     "ParsedFiling",
     "detect_issuer",
     "ISSUER_CONFIGS",
@@ -9,7 +9,7 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
-from .parser import extract_symbols, extract_dates
+from .parser import extract_symbols, extract_dates, extract_text_from_html
 from .fetcher import fetch_historical_prices
 from .validation import validate_extraction_results
 from .terms import extract_product_terms, summarize_product_terms
@@ -146,7 +146,7 @@ Examples:
     parser.add_argument(
         "--no-cache",
         action="store_true",
-        help="Disable price caching"
+        help="Disable price and PDF text caching"
     )
 
     parser.add_argument(
@@ -243,12 +243,13 @@ Examples:
         try:
             content, is_html = read_filing_content(
                 str(input_path),
-                max_pdf_pages=args.max_pdf_pages
+                max_pdf_pages=args.max_pdf_pages,
+                use_cache=not args.no_cache
             )
         except ImportError as e:
             logger.error(f"PDF support not available: {e}")
             print(f"Error: {e}", file=sys.stderr)
-            print("Install pdfplumber for PDF support: pip install pdfplumber", file=sys.stderr)
+            print("Install PyMuPDF for PDF support: pip install pymupdf", file=sys.stderr)
             sys.exit(1)
         except Exception as e:
             logger.error(f"Error reading file: {e}", exc_info=True)
@@ -270,8 +271,12 @@ Examples:
 
     # Extract symbols and dates
     try:
-        symbol_data = extract_symbols(content, is_html=is_html, additional_symbols=args.symbols)
-        date_data = extract_dates(content, is_html=is_html)
+        # Convert HTML once and share the text with every extractor
+        text = extract_text_from_html(content) if is_html else content
+        symbol_data = extract_symbols(
+            content, is_html=is_html, additional_symbols=args.symbols, text=text
+        )
+        date_data = extract_dates(content, is_html=is_html, text=text)
     except Exception as e:
         logger.error(f"Error during extraction: {e}", exc_info=True)
         print(f"Error: Extraction failed: {e}", file=sys.stderr)
@@ -283,7 +288,7 @@ Examples:
     if args.extract_terms:
         try:
             logger.info("Extracting product terms")
-            product_terms = extract_product_terms(content, is_html=is_html)
+            product_terms = extract_product_terms(content, is_html=is_html, text=text)
             terms_summary = summarize_product_terms(product_terms)
             logger.info(f"Extracted {len(product_terms)} product terms")
         except Exception as e:
@@ -295,7 +300,7 @@ Examples:
     if args.extract_identifiers:
         try:
             logger.info("Extracting security identifiers")
-            identifiers = extract_all_identifiers(content, is_html=is_html)
+            identifiers = extract_all_identifiers(content, is_html=is_html, text=text)
             if identifiers:
                 logger.info(f"Found identifiers: {', '.join(identifiers.keys())}")
             else:
@@ -10,13 +10,65 @@ Provides:
 
 import math
 import logging
+import functools
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
-from scipy import stats
+from datetime import date, datetime, timedelta
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Try to import numba (optional dependency)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+    logger.debug("numba available - JIT greeks grid enabled")
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba not available - using NumPy greeks grid")
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+_SQRT_2 = math.sqrt(2.0)
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF for scalars (avoids importing scipy.stats)."""
+    return 0.5 * math.erfc(-x / _SQRT_2)
+
+
+def _norm_pdf(x: float) -> float:
+    """Standard normal PDF for scalars."""
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+# Output precision per field, applied once when results leave the module
+_VOLATILITY_PRECISION = {
+    "realized_vol_annualized": 4,
+    "realized_vol_daily": 6,
+    "mean_return_daily": 6,
+}
+_GREEKS_PRECISION = {"delta": 4, "gamma": 6, "theta": 4, "vega": 4, "rho": 4}
+_RISK_PRECISION = {
+    "sharpe_ratio": 4,
+    "max_drawdown": 4,
+    "value_at_risk_95": 6,
+    "value_at_risk_99": 6,
+    "mean_daily_return": 6,
+    "std_daily_return": 6,
+}
+
+
+def _round_dict(values: Dict[str, Any], precisions: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Round numeric fields of a result dict in a single pass.
+
+    Fields missing from precisions and None values are passed through.
+    """
+    for key, digits in precisions.items():
+        value = values.get(key)
+        if value is not None:
+            values[key] = round(float(value), digits)
+    return values
+
 
 def calculate_log_returns(prices: List[float]) -> List[float]:
     """
@@ -42,7 +94,8 @@ def calculate_log_returns(prices: List[float]) -> List[float]:
 def calculate_realized_volatility(
     prices: List[float],
     periods: int = 252,
-    method: str = "close_to_close"
+    method: str = "close_to_close",
+    round_output: bool = True
 ) -> Dict[str, float]:
     """
     Calculate historical volatility metrics.
@@ -51,6 +104,7 @@ def calculate_realized_volatility(
         prices: List of prices (chronologically ordered, most recent last)
         periods: Annualization factor (252 for daily, 52 for weekly, 12 for monthly)
         method: Calculation method ('close_to_close', 'parkinson', 'garman_klass')
+        round_output: Round values for display (disable for internal use)
 
     Returns:
         Dictionary with volatility metrics:
@@ -82,13 +136,18 @@ def calculate_realized_volatility(
     # Annualize
     annualized_vol = std_dev * math.sqrt(periods)
 
-    return {
-        "realized_vol_annualized": round(annualized_vol, 4),
-        "realized_vol_daily": round(std_dev, 6),
+    result = {
+        "realized_vol_annualized": annualized_vol,
+        "realized_vol_daily": std_dev,
         "sample_size": len(returns),
-        "mean_return_daily": round(np.mean(returns), 6) if returns else None
+        "mean_return_daily": np.mean(returns)
     }
 
+    if round_output:
+        _round_dict(result, _VOLATILITY_PRECISION)
+
+    return result
+
 
 def calculate_rolling_volatilities(
     prices: List[float],
@@ -112,8 +171,11 @@ def calculate_rolling_volatilities(
         key = f"vol_{window}d"
         if len(prices) >= window + 1:  # Need window+1 prices for window returns
             window_prices = prices[-window-1:]
-            vol_data = calculate_realized_volatility(window_prices, periods)
-            result[key] = vol_data["realized_vol_annualized"]
+            vol_data = calculate_realized_volatility(
+                window_prices, periods, round_output=False
+            )
+            vol = vol_data["realized_vol_annualized"]
+            result[key] = round(float(vol), 4) if vol is not None else None
         else:
             result[key] = None
             logger.warning(f"Insufficient data for {window}-day volatility")
@@ -121,6 +183,60 @@ def calculate_rolling_volatilities(
     return result
 
 
+def _bs_kernel(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Shared Black-Scholes intermediates for pricers and Greeks.
+
+    Requires T > 0 and sigma > 0.
+
+    Returns:
+        Tuple of (d1, d2, N(d1), N(d2), discount factor, sqrt(T))
+    """
+    sqrt_T = math.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    return d1, d2, _norm_cdf(d1), _norm_cdf(d2), math.exp(-r * T), sqrt_T
+
+
+def black_scholes_prices(
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float
+) -> Tuple[float, float]:
+    """
+    Calculate Black-Scholes call and put prices in one pass.
+
+    Args:
+        S: Spot price
+        K: Strike price
+        T: Time to maturity (years)
+        r: Risk-free rate
+        sigma: Volatility (annualized)
+
+    Returns:
+        Tuple of (call price, put price)
+    """
+    if T <= 0 or sigma <= 0:
+        return max(S - K, 0), max(K - S, 0)  # Intrinsic values
+
+    _, _, nd1, nd2, disc, _ = _bs_kernel(S, K, T, r, sigma)
+    k_disc = K * disc
+
+    call_price = S * nd1 - k_disc * nd2
+    put_price = k_disc * (1 - nd2) - S * (1 - nd1)
+
+    return call_price, put_price
+
+
 def black_scholes_call_price(
     S: float,
     K: float,
@@ -144,12 +260,9 @@ def black_scholes_call_price(
     if T <= 0 or sigma <= 0:
         return max(S - K, 0)  # Intrinsic value
 
-    d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-    d2 = d1 - sigma * math.sqrt(T)
-
-    call_price = S * stats.norm.cdf(d1) - K * math.exp(-r * T) * stats.norm.cdf(d2)
+    _, _, nd1, nd2, disc, _ = _bs_kernel(S, K, T, r, sigma)
 
-    return call_price
+    return S * nd1 - K * disc * nd2
 
 
 def black_scholes_put_price(
@@ -175,12 +288,10 @@ def black_scholes_put_price(
     if T <= 0 or sigma <= 0:
         return max(K - S, 0)  # Intrinsic value
 
-    d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-    d2 = d1 - sigma * math.sqrt(T)
+    _, _, nd1, nd2, disc, _ = _bs_kernel(S, K, T, r, sigma)
 
-    put_price = K * math.exp(-r * T) * stats.norm.cdf(-d2) - S * stats.norm.cdf(-d1)
-
-    return put_price
+    # N(-x) = 1 - N(x)
+    return K * disc * (1 - nd2) - S * (1 - nd1)
 
 
 def calculate_greeks(
@@ -189,7 +300,8 @@ def calculate_greeks(
     T: float,
     r: float,
     sigma: float,
-    option_type: str = "call"
+    option_type: str = "call",
+    round_output: bool = True
 ) -> Dict[str, float]:
     """
     Calculate Black-Scholes Greeks.
@@ -201,6 +313,7 @@ def calculate_greeks(
         r: Risk-free rate (annualized)
         sigma: Volatility (annualized)
         option_type: 'call' or 'put'
+        round_output: Round values for display (disable for internal use)
 
     Returns:
         Dictionary with Greeks:
@@ -235,48 +348,199 @@ def calculate_greeks(
             "rho": None
         }
 
-    # Calculate d1 and d2
-    d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
-    d2 = d1 - sigma * math.sqrt(T)
+    # Calculate d1, d2 and their CDFs
+    d1, _, nd1, nd2, disc, sqrt_T = _bs_kernel(S, K, T, r, sigma)
+    k_disc = K * disc
 
-    # Standard normal PDF and CDF
-    pdf_d1 = stats.norm.pdf(d1)
+    # Standard normal PDF
+    pdf_d1 = _norm_pdf(d1)
 
     # Delta
     if option_type == "call":
-        delta = stats.norm.cdf(d1)
+        delta = nd1
     else:
-        delta = stats.norm.cdf(d1) - 1
+        delta = nd1 - 1
 
     # Gamma (same for call and put)
-    gamma = pdf_d1 / (S * sigma * math.sqrt(T))
+    gamma = pdf_d1 / (S * sigma * sqrt_T)
 
     # Vega (same for call and put) - per 1% change in volatility
-    vega = S * pdf_d1 * math.sqrt(T) / 100
+    vega = S * pdf_d1 * sqrt_T / 100
 
     # Theta - per day
+    time_decay = -(S * pdf_d1 * sigma) / (2 * sqrt_T)
     if option_type == "call":
-        theta = (-(S * pdf_d1 * sigma) / (2 * math.sqrt(T))
-                 - r * K * math.exp(-r * T) * stats.norm.cdf(d2)) / 365
+        theta = (time_decay - r * k_disc * nd2) / 365
     else:
-        theta = (-(S * pdf_d1 * sigma) / (2 * math.sqrt(T))
-                 + r * K * math.exp(-r * T) * stats.norm.cdf(-d2)) / 365
+        theta = (time_decay + r * k_disc * (1 - nd2)) / 365
 
     # Rho - per 1% change in interest rate
     if option_type == "call":
-        rho = K * T * math.exp(-r * T) * stats.norm.cdf(d2) / 100
+        rho = k_disc * T * nd2 / 100
     else:
-        rho = -K * T * math.exp(-r * T) * stats.norm.cdf(-d2) / 100
+        rho = -k_disc * T * (1 - nd2) / 100
+
+    greeks = {
+        "delta": delta,
+        "gamma": gamma,
+        "theta": theta,
+        "vega": vega,
+        "rho": rho
+    }
+
+    if round_output:
+        _round_dict(greeks, _GREEKS_PRECISION)
+
+    return greeks
+
+
+# Serial on purpose: numba's parallel threading layer is not fork-safe, and
+# callers may fork worker processes after computing a grid
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _greeks_grid_numba(S, K, T, r, sigma, is_call,
+                           out_delta, out_gamma, out_vega, out_theta, out_rho):
+        """Fill the output arrays with Black-Scholes Greeks for each strike."""
+        sqrt_T = math.sqrt(T)
+        sig_sqrt_T = sigma * sqrt_T
+        drift = (r + 0.5 * sigma * sigma) * T
+        discount = math.exp(-r * T)
+
+        for i in range(K.size):
+            d1 = (math.log(S / K[i]) + drift) / sig_sqrt_T
+            d2 = d1 - sig_sqrt_T
+            pdf_d1 = math.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+            cdf_d1 = 0.5 * math.erfc(-d1 / _SQRT_2)
+            cdf_d2 = 0.5 * math.erfc(-d2 / _SQRT_2)
+            k_disc = K[i] * discount
+            time_decay = -(S * pdf_d1 * sigma) / (2.0 * sqrt_T)
+
+            out_gamma[i] = pdf_d1 / (S * sig_sqrt_T)
+            out_vega[i] = S * pdf_d1 * sqrt_T / 100.0
+            if is_call[i]:
+                out_delta[i] = cdf_d1
+                out_theta[i] = (time_decay - r * k_disc * cdf_d2) / 365.0
+                out_rho[i] = k_disc * T * cdf_d2 / 100.0
+            else:
+                out_delta[i] = cdf_d1 - 1.0
+                cdf_neg_d2 = 0.5 * math.erfc(d2 / _SQRT_2)
+                out_theta[i] = (time_decay + r * k_disc * cdf_neg_d2) / 365.0
+                out_rho[i] = -k_disc * T * cdf_neg_d2 / 100.0
+
+
+def _greeks_grid_numpy(
+    S: float,
+    K: np.ndarray,
+    T: float,
+    r: float,
+    sigma: float,
+    is_call: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Vectorized NumPy fallback for calculate_greeks_grid."""
+    from scipy.special import ndtr
+
+    sqrt_T = math.sqrt(T)
+    sig_sqrt_T = sigma * sqrt_T
+
+    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / sig_sqrt_T
+    d2 = d1 - sig_sqrt_T
+    pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+    cdf_d1 = ndtr(d1)
+    cdf_d2 = ndtr(d2)
+    cdf_neg_d2 = ndtr(-d2)
+    k_disc = K * math.exp(-r * T)
+    time_decay = -(S * pdf_d1 * sigma) / (2 * sqrt_T)
 
     return {
-        "delta": round(delta, 4),
-        "gamma": round(gamma, 6),
-        "theta": round(theta, 4),
-        "vega": round(vega, 4),
-        "rho": round(rho, 4)
+        "delta": np.where(is_call, cdf_d1, cdf_d1 - 1),
+        "gamma": pdf_d1 / (S * sig_sqrt_T),
+        "theta": np.where(
+            is_call,
+            time_decay - r * k_disc * cdf_d2,
+            time_decay + r * k_disc * cdf_neg_d2
+        ) / 365,
+        "vega": S * pdf_d1 * sqrt_T / 100,
+        "rho": np.where(is_call, k_disc * cdf_d2, -k_disc * cdf_neg_d2) * T / 100
     }
 
 
+def calculate_greeks_grid(
+    S: float,
+    K_arr: Any,
+    T: float,
+    r: float,
+    sigma: float,
+    is_call_arr: Any = True
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate Black-Scholes Greeks across a grid of strikes.
+
+    Intended for sensitivity scans (e.g. strikes from 50% to 150% of spot).
+    Uses a compiled numba kernel when numba is installed, otherwise a
+    vectorized NumPy implementation. Values match calculate_greeks but
+    are returned unrounded.
+
+    Args:
+        S: Spot price
+        K_arr: Array-like of strike prices
+        T: Time to maturity (years)
+        r: Risk-free rate (annualized)
+        sigma: Volatility (annualized)
+        is_call_arr: Bool or array-like of bools (True = call, False = put)
+
+    Returns:
+        Dictionary mapping 'delta', 'gamma', 'theta', 'vega', 'rho' to arrays
+        aligned with K_arr
+    """
+    K = np.ascontiguousarray(K_arr, dtype=np.float64)
+    is_call = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(is_call_arr, dtype=np.bool_), K.shape)
+    )
+
+    if T <= 0:
+        # At expiration
+        delta = np.where(is_call, (S > K).astype(np.float64), -(S < K).astype(np.float64))
+        zeros = np.zeros_like(K)
+        return {
+            "delta": delta,
+            "gamma": zeros,
+            "theta": zeros.copy(),
+            "vega": zeros.copy(),
+            "rho": zeros.copy()
+        }
+
+    if sigma <= 0:
+        logger.warning("Volatility must be positive for Greeks calculation")
+        nans = np.full_like(K, np.nan)
+        return {
+            "delta": nans,
+            "gamma": nans.copy(),
+            "theta": nans.copy(),
+            "vega": nans.copy(),
+            "rho": nans.copy()
+        }
+
+    if not NUMBA_AVAILABLE:
+        return _greeks_grid_numpy(S, K, T, r, sigma, is_call)
+
+    out = {name: np.empty_like(K) for name in ("delta", "gamma", "theta", "vega", "rho")}
+    _greeks_grid_numba(
+        float(S), K, float(T), float(r), float(sigma), is_call,
+        out["delta"], out["gamma"], out["vega"], out["theta"], out["rho"]
+    )
+    return out
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string, caching results for repeated dates."""
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        # Fall back to strptime for non-padded forms like 2024-1-5
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
 def estimate_time_to_maturity(
     maturity_date_str: str,
     pricing_date_str: Optional[str] = None
@@ -292,12 +556,12 @@ def estimate_time_to_maturity(
         Time to maturity in years (using 365-day convention)
     """
     try:
-        maturity_date = datetime.strptime(maturity_date_str, "%Y-%m-%d")
+        maturity_date = _parse_date(maturity_date_str)
 
         if pricing_date_str:
-            pricing_date = datetime.strptime(pricing_date_str, "%Y-%m-%d")
+            pricing_date = _parse_date(pricing_date_str)
         else:
-            pricing_date = datetime.now()
+            pricing_date = date.today()
 
         days_to_maturity = (maturity_date - pricing_date).days
 
@@ -407,16 +671,17 @@ def analyze_structured_product_greeks(
         T=T,
         r=risk_free_rate,
         sigma=volatility,
-        option_type="call"
+        option_type="call",
+        round_output=False
     )
 
-    result["atm_greeks"] = atm_call_greeks
-
     # Participation-adjusted Greeks
     result["effective_delta"] = round(
-        atm_call_greeks["delta"] * participation_rate, 4
+        float(atm_call_greeks["delta"]) * participation_rate, 4
     )
 
+    result["atm_greeks"] = _round_dict(atm_call_greeks, _GREEKS_PRECISION)
+
     return result
 
 
@@ -503,7 +768,8 @@ def calculate_breakeven_levels(
 
 def calculate_risk_metrics(
     prices: List[float],
-    returns_data: Optional[List[float]] = None
+    returns_data: Optional[List[float]] = None,
+    round_output: bool = True
 ) -> Dict[str, float]:
     """
     Calculate risk metrics from price/return series.
@@ -511,18 +777,19 @@ def calculate_risk_metrics(
     Args:
         prices: List of prices
         returns_data: Optional pre-calculated returns
+        round_output: Round values for display (disable for internal use)
 
     Returns:
         Dictionary with risk metrics:
         - sharpe_ratio: Risk-adjusted return (assuming rf=0)
         - max_drawdown: Maximum peak-to-trough decline
-        - value_at_risk_95: 95% VaR (daily)
-        - value_at_risk_99: 99% VaR (daily)
+        - value_at_risk_95: 95% VaR (daily, lower 5th percentile return)
+        - value_at_risk_99: 99% VaR (daily, lower 1st percentile return)
     """
     if returns_data is None:
         returns_data = calculate_log_returns(prices)
 
-    if not returns_data:
+    if len(returns_data) == 0:
         return {
             "sharpe_ratio": None,
             "max_drawdown": None,
@@ -530,9 +797,11 @@ def calculate_risk_metrics(
             "value_at_risk_99": None
         }
 
+    returns_arr = np.asarray(returns_data, dtype=np.float64)
+
     # Sharpe ratio (annualized, assuming rf=0)
-    mean_return = np.mean(returns_data)
-    std_return = np.std(returns_data, ddof=1)
+    mean_return = np.mean(returns_arr)
+    std_return = np.std(returns_arr, ddof=1)
 
     if std_return > 0:
         sharpe_ratio = (mean_return / std_return) * math.sqrt(252)
@@ -540,24 +809,34 @@ def calculate_risk_metrics(
         sharpe_ratio = None
 
     # Maximum drawdown
-    cumulative = np.cumprod(1 + np.array(returns_data))
+    cumulative = np.cumprod(1 + returns_arr)
     running_max = np.maximum.accumulate(cumulative)
     drawdown = (cumulative - running_max) / running_max
     max_drawdown = np.min(drawdown)
 
-    # Value at Risk
-    var_95 = np.percentile(returns_data, 5)  # 5th percentile
-    var_99 = np.percentile(returns_data, 1)  # 1st percentile
-
-    return {
-        "sharpe_ratio": round(sharpe_ratio, 4) if sharpe_ratio is not None else None,
-        "max_drawdown": round(max_drawdown, 4),
-        "value_at_risk_95": round(var_95, 6),
-        "value_at_risk_99": round(var_99, 6),
-        "mean_daily_return": round(mean_return, 6),
-        "std_daily_return": round(std_return, 6)
+    # Value at Risk - both order statistics from one partial sort
+    # (equivalent to np.percentile(..., method="lower"))
+    last = returns_arr.size - 1
+    k99 = int(0.01 * last)
+    k95 = int(0.05 * last)
+    partitioned = np.partition(returns_arr, [k99, k95])
+    var_95 = partitioned[k95]  # 5th percentile
+    var_99 = partitioned[k99]  # 1st percentile
+
+    metrics = {
+        "sharpe_ratio": sharpe_ratio,
+        "max_drawdown": max_drawdown,
+        "value_at_risk_95": var_95,
+        "value_at_risk_99": var_99,
+        "mean_daily_return": mean_return,
+        "std_daily_return": std_return
     }
 
+    if round_output:
+        _round_dict(metrics, _RISK_PRECISION)
+
+    return metrics
+
 
 def generate_analytics_summary(
     prices_data: Dict[str, Any],
@@ -605,8 +884,11 @@ def generate_analytics_summary(
     )
 
     # Add overall realized volatility
-    full_vol = calculate_realized_volatility(adj_close_prices)
-    result["volatility"]["realized_vol_annualized"] = full_vol["realized_vol_annualized"]
+    full_vol = calculate_realized_volatility(adj_close_prices, round_output=False)
+    full_annualized = full_vol["realized_vol_annualized"]
+    result["volatility"]["realized_vol_annualized"] = (
+        round(float(full_annualized), 4) if full_annualized is not None else None
+    )
     result["volatility"]["sample_size"] = full_vol["sample_size"]
 
     # Risk metrics
@@ -614,7 +896,7 @@ def generate_analytics_summary(
 
     # Greeks and product analysis (if product terms provided)
     if product_terms and dates and "maturity_date" in dates:
-        pricing_date = dates.get("pricing_date", datetime.now().strftime("%Y-%m-%d"))
+        pricing_date = dates.get("pricing_date", date.today().isoformat())
 
         # Use the most recent volatility available
         vol_to_use = None
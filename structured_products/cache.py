@@ -105,6 +105,87 @@ class PriceCache:
         """
         return self.cache_dir / f"{cache_key}.json"
 
+    def _scan_cache_files(self) -> List[os.DirEntry]:
+        """
+        List cache entry files with a single directory scan.
+
+        Returns:
+            DirEntry objects for cache files (stat results are cached by scandir)
+        """
+        with os.scandir(self.cache_dir) as it:
+            return [
+                entry for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+
+    def _make_date_key(
+        self,
+        symbol: str,
+        date_str: str,
+        lookback_days: int
+    ) -> str:
+        """
+        Generate cache key for a single (symbol, date, lookback) entry.
+
+        Args:
+            symbol: Yahoo Finance symbol
+            date_str: Date string
+            lookback_days: Lookback days parameter
+
+        Returns:
+            Hash string to use as cache key
+        """
+        return hashlib.md5(f"{symbol}:{date_str}:{lookback_days}".encode()).hexdigest()
+
+    def _load_entry(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load a cache entry if it exists and has not expired.
+
+        Args:
+            cache_file: Path of the cache file
+
+        Returns:
+            Cache entry dictionary or None if not found/expired
+        """
+        # One stat call covers both existence and freshness
+        try:
+            cache_stat = cache_file.stat()
+        except FileNotFoundError:
+            return None
+
+        # Check expiration from the file mtime (set by the atomic rename
+        # in _store_entry()), so expired entries are never opened or parsed
+        age_seconds = time.time() - cache_stat.st_mtime
+
+        if age_seconds > self.ttl_seconds:
+            logger.debug(
+                f"Cache expired: {cache_file.name} age {age_seconds:.0f}s > TTL {self.ttl_seconds}s"
+            )
+            # Delete expired cache file
+            try:
+                cache_file.unlink()
+            except Exception as e:
+                logger.warning(f"Failed to delete expired cache file: {e}")
+            return None
+
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+
+    def _store_entry(self, cache_file: Path, cache_entry: Dict[str, Any]) -> None:
+        """
+        Write a cache entry atomically using temp file + rename.
+
+        Args:
+            cache_file: Path of the cache file
+            cache_entry: Entry to serialize
+        """
+        temp_file = cache_file.with_suffix('.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(cache_entry, f, indent=2)
+
+        # Atomic rename
+        temp_file.replace(cache_file)
+
     def get(
         self,
         symbol: str,
@@ -127,40 +208,58 @@ class PriceCache:
 
         try:
             cache_key = self._make_cache_key(symbol, dates, lookback_days)
-            cache_file = self._get_cache_file_path(cache_key)
+            cache_entry = self._load_entry(self._get_cache_file_path(cache_key))
 
-            if not cache_file.exists():
-                logger.debug(f"Cache miss for {symbol}: file not found")
+            if cache_entry is None:
+                logger.debug(f"Cache miss for {symbol}")
                 return None
 
-            # Read cache file
-            with open(cache_file, 'r') as f:
-                cache_entry = json.load(f)
-
-            # Check expiration
-            cached_time = cache_entry.get("timestamp", 0)
-            age_seconds = time.time() - cached_time
-
-            if age_seconds > self.ttl_seconds:
-                logger.debug(
-                    f"Cache expired for {symbol}: age {age_seconds:.0f}s > TTL {self.ttl_seconds}s"
-                )
-                # Delete expired cache file
-                try:
-                    cache_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to delete expired cache file: {e}")
-                return None
-
-            logger.info(
-                f"Cache hit for {symbol}: age {age_seconds:.0f}s, {len(cache_entry['data'])} dates"
-            )
+            logger.info(f"Cache hit for {symbol}: {len(cache_entry['data'])} dates")
             return cache_entry["data"]
 
         except Exception as e:
             logger.error(f"Error reading cache for {symbol}: {e}", exc_info=True)
             return None
 
+    def get_many(
+        self,
+        symbol: str,
+        dates: List[str],
+        lookback_days: int
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get cached price data for individual dates.
+
+        Each date is cached separately, so calls with overlapping date
+        lists can reuse each other's entries.
+
+        Args:
+            symbol: Yahoo Finance symbol
+            dates: List of date strings
+            lookback_days: Lookback days parameter
+
+        Returns:
+            Dictionary mapping cached dates to their price data (dates that
+            are not cached or have expired are omitted)
+        """
+        if not self.enabled:
+            return {}
+
+        hits = {}
+        for date_str in dict.fromkeys(dates):
+            try:
+                cache_key = self._make_date_key(symbol, date_str, lookback_days)
+                cache_entry = self._load_entry(self._get_cache_file_path(cache_key))
+            except Exception as e:
+                logger.error(f"Error reading cache for {symbol} {date_str}: {e}", exc_info=True)
+                continue
+
+            if cache_entry is not None:
+                hits[date_str] = cache_entry["data"]
+
+        logger.debug(f"Cache lookup for {symbol}: {len(hits)}/{len(dates)} dates hit")
+        return hits
+
     def set(
         self,
         symbol: str,
@@ -185,7 +284,6 @@ class PriceCache:
 
         try:
             cache_key = self._make_cache_key(symbol, dates, lookback_days)
-            cache_file = self._get_cache_file_path(cache_key)
 
             cache_entry = {
                 "symbol": symbol,
@@ -194,14 +292,7 @@ class PriceCache:
                 "timestamp": time.time(),
                 "data": data
             }
-
-            # Write atomically using temp file + rename
-            temp_file = cache_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(cache_entry, f, indent=2)
-
-            # Atomic rename
-            temp_file.replace(cache_file)
+            self._store_entry(self._get_cache_file_path(cache_key), cache_entry)
 
             logger.debug(f"Cached price data for {symbol}: {len(data)} dates")
             return True
@@ -210,6 +301,46 @@ class PriceCache:
             logger.error(f"Error writing cache for {symbol}: {e}", exc_info=True)
             return False
 
+    def set_many(
+        self,
+        symbol: str,
+        lookback_days: int,
+        data: Dict[str, Optional[Dict[str, Any]]]
+    ) -> int:
+        """
+        Store price data as one cache entry per date.
+
+        Args:
+            symbol: Yahoo Finance symbol
+            lookback_days: Lookback days parameter
+            data: Mapping of date strings to price data
+
+        Returns:
+            Number of dates successfully cached
+        """
+        if not self.enabled:
+            return 0
+
+        stored = 0
+        timestamp = time.time()
+        for date_str, price_data in data.items():
+            try:
+                cache_key = self._make_date_key(symbol, date_str, lookback_days)
+                cache_entry = {
+                    "symbol": symbol,
+                    "dates": [date_str],
+                    "lookback_days": lookback_days,
+                    "timestamp": timestamp,
+                    "data": price_data
+                }
+                self._store_entry(self._get_cache_file_path(cache_key), cache_entry)
+                stored += 1
+            except Exception as e:
+                logger.error(f"Error writing cache for {symbol} {date_str}: {e}", exc_info=True)
+
+        logger.debug(f"Cached price data for {symbol}: {stored} dates")
+        return stored
+
     def clear(self, older_than_seconds: Optional[int] = None) -> int:
         """
         Clear cache entries.
@@ -227,23 +358,20 @@ class PriceCache:
         try:
             current_time = time.time()
 
-            for cache_file in self.cache_dir.glob("*.json"):
+            for entry in self._scan_cache_files():
                 try:
                     if older_than_seconds is not None:
-                        # Check age before deleting
-                        with open(cache_file, 'r') as f:
-                            cache_entry = json.load(f)
-                        cached_time = cache_entry.get("timestamp", 0)
-                        age = current_time - cached_time
+                        # File mtime is the write time (set by the atomic rename)
+                        age = current_time - entry.stat().st_mtime
 
                         if age < older_than_seconds:
                             continue
 
-                    cache_file.unlink()
+                    os.unlink(entry.path)
                     cleared += 1
 
                 except Exception as e:
-                    logger.warning(f"Error deleting cache file {cache_file}: {e}")
+                    logger.warning(f"Error deleting cache file {entry.path}: {e}")
 
             logger.info(f"Cleared {cleared} cache entries")
             return cleared
@@ -267,33 +395,32 @@ class PriceCache:
             }
 
         try:
-            cache_files = list(self.cache_dir.glob("*.json"))
-            total_size = sum(f.stat().st_size for f in cache_files)
-
-            # Count expired entries
+            # Single stat-only pass: sizes and ages come from the directory scan
             current_time = time.time()
+            total_entries = 0
+            total_size = 0
             expired = 0
             valid = 0
 
-            for cache_file in cache_files:
+            for entry in self._scan_cache_files():
                 try:
-                    with open(cache_file, 'r') as f:
-                        cache_entry = json.load(f)
-                    cached_time = cache_entry.get("timestamp", 0)
-                    age = current_time - cached_time
-
-                    if age > self.ttl_seconds:
-                        expired += 1
-                    else:
-                        valid += 1
-                except Exception:
-                    pass
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                total_entries += 1
+                total_size += st.st_size
+
+                if current_time - st.st_mtime > self.ttl_seconds:
+                    expired += 1
+                else:
+                    valid += 1
 
             return {
                 "enabled": True,
                 "cache_dir": str(self.cache_dir),
                 "ttl_seconds": self.ttl_seconds,
-                "total_entries": len(cache_files),
+                "total_entries": total_entries,
                 "valid_entries": valid,
                 "expired_entries": expired,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
@@ -5,13 +5,25 @@ Handles trading day validation, settlement date calculation,
 and market-specific holiday calendars.
 """
 
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, List, Set
+from datetime import date as date_type, datetime, timedelta
+from typing import Any, Dict, Optional, List, Set, FrozenSet, Tuple, Sequence, Union
 from enum import Enum
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Try to import numba (optional dependency)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+    logger.debug("numba available - JIT trading day kernel enabled")
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba not available - using NumPy trading day checks")
+
 
 class Market(Enum):
     """Supported market calendars."""
@@ -30,6 +42,13 @@ US_FIXED_HOLIDAYS = {
     (12, 25): "Christmas Day",
 }
 
+# UK bank holidays (fixed dates)
+UK_FIXED_HOLIDAYS = frozenset({
+    (1, 1),    # New Year's Day
+    (12, 25),  # Christmas Day
+    (12, 26),  # Boxing Day
+})
+
 
 def is_weekend(date: datetime) -> bool:
     """
@@ -44,6 +63,98 @@ def is_weekend(date: datetime) -> bool:
     return date.weekday() >= 5  # 5=Saturday, 6=Sunday
 
 
+MONDAY = 0
+THURSDAY = 3
+FRIDAY = 4
+SUNDAY = 6
+
+# Indexed by date.weekday(); avoids a locale-aware strftime('%A')
+_WEEKDAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date_type:
+    """Return the nth occurrence (1-based) of weekday in the given month."""
+    first = date_type(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date_type:
+    """Return the last occurrence of weekday in the given month."""
+    if month == 12:
+        last = date_type(year, 12, 31)
+    else:
+        last = date_type(year, month + 1, 1) - timedelta(days=1)
+    offset = (last.weekday() - weekday) % 7
+    return last - timedelta(days=offset)
+
+
+def _us_holidays(year: int) -> Set[date_type]:
+    """Build the US market holidays for a year."""
+    holidays = {date_type(year, month, day) for month, day in US_FIXED_HOLIDAYS}
+
+    # New Year's Day observed (Monday after New Year's on Sunday)
+    if date_type(year, 1, 2).weekday() == MONDAY:
+        holidays.add(date_type(year, 1, 2))
+
+    holidays.update([
+        _nth_weekday(year, 1, MONDAY, 3),     # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, MONDAY, 3),     # Presidents Day
+        _last_weekday(year, 5, MONDAY),       # Memorial Day
+        _nth_weekday(year, 9, MONDAY, 1),     # Labor Day
+        _nth_weekday(year, 11, THURSDAY, 4),  # Thanksgiving
+    ])
+
+    # Christmas observed (Monday after Christmas on Sunday)
+    if date_type(year, 12, 26).weekday() == MONDAY:
+        holidays.add(date_type(year, 12, 26))
+    # Christmas observed (Friday before Christmas on Saturday)
+    if date_type(year, 12, 24).weekday() == FRIDAY:
+        holidays.add(date_type(year, 12, 24))
+
+    return holidays
+
+
+def _uk_holidays(year: int) -> Set[date_type]:
+    """Build the UK market holidays for a year."""
+    holidays = {date_type(year, month, day) for month, day in UK_FIXED_HOLIDAYS}
+    holidays.update([
+        _nth_weekday(year, 5, MONDAY, 1),  # Early May Bank Holiday
+        _last_weekday(year, 5, MONDAY),    # Spring Bank Holiday
+        _last_weekday(year, 8, MONDAY),    # Summer Bank Holiday
+    ])
+
+    return holidays
+
+
+# Markets with a holiday calendar (others are treated as weekday-only)
+_HOLIDAY_BUILDERS = {
+    Market.NYSE: _us_holidays,
+    Market.LSE: _uk_holidays,
+}
+
+
+def _as_date(value: datetime) -> date_type:
+    """Return the calendar date of a date or datetime."""
+    return value.date() if isinstance(value, datetime) else value
+
+
+@functools.lru_cache(maxsize=128)
+def _holidays_for_year(market: Market, year: int) -> FrozenSet[date_type]:
+    """
+    All holiday dates for a market and year.
+
+    Computed once per (market, year) so holiday checks become a set lookup.
+    """
+    build_holidays = _HOLIDAY_BUILDERS.get(market)
+    if build_holidays is None:
+        return frozenset()
+
+    return frozenset(build_holidays(year))
+
+
 def is_us_holiday(date: datetime) -> bool:
     """
     Check if date is a US market holiday.
@@ -58,49 +169,7 @@ def is_us_holiday(date: datetime) -> bool:
     Returns:
         True if US holiday
     """
-    # Check fixed holidays
-    if (date.month, date.day) in US_FIXED_HOLIDAYS:
-        return True
-
-    # New Year's Day observed (if Jan 1 is weekend)
-    if date.month == 1 and date.day == 2 and date.weekday() == 0:
-        # Monday after New Year's on Sunday
-        return True
-
-    # Martin Luther King Jr. Day (3rd Monday of January)
-    if date.month == 1 and date.weekday() == 0:
-        if 15 <= date.day <= 21:
-            return True
-
-    # Presidents Day (3rd Monday of February)
-    if date.month == 2 and date.weekday() == 0:
-        if 15 <= date.day <= 21:
-            return True
-
-    # Memorial Day (last Monday of May)
-    if date.month == 5 and date.weekday() == 0:
-        if date.day >= 25:
-            return True
-
-    # Labor Day (1st Monday of September)
-    if date.month == 9 and date.weekday() == 0:
-        if date.day <= 7:
-            return True
-
-    # Thanksgiving (4th Thursday of November)
-    if date.month == 11 and date.weekday() == 3:
-        if 22 <= date.day <= 28:
-            return True
-
-    # Christmas observed (if Dec 25 is weekend)
-    if date.month == 12 and date.day == 26 and date.weekday() == 0:
-        # Monday after Christmas on Sunday
-        return True
-    if date.month == 12 and date.day == 24 and date.weekday() == 4:
-        # Friday before Christmas on Saturday
-        return True
-
-    return False
+    return _as_date(date) in _holidays_for_year(Market.NYSE, date.year)
 
 
 def is_uk_holiday(date: datetime) -> bool:
@@ -113,23 +182,7 @@ def is_uk_holiday(date: datetime) -> bool:
     Returns:
         True if UK holiday
     """
-    # Fixed holidays
-    if (date.month, date.day) in [(1, 1), (12, 25), (12, 26)]:
-        return True
-
-    # Early May Bank Holiday (1st Monday of May)
-    if date.month == 5 and date.weekday() == 0 and date.day <= 7:
-        return True
-
-    # Spring Bank Holiday (last Monday of May)
-    if date.month == 5 and date.weekday() == 0 and date.day >= 25:
-        return True
-
-    # Summer Bank Holiday (last Monday of August)
-    if date.month == 8 and date.weekday() == 0 and date.day >= 25:
-        return True
-
-    return False
+    return _as_date(date) in _holidays_for_year(Market.LSE, date.year)
 
 
 def is_trading_day(date: datetime, market: Market = Market.NYSE) -> bool:
@@ -161,6 +214,18 @@ def is_trading_day(date: datetime, market: Market = Market.NYSE) -> bool:
         return True
 
 
+def _forward_step(weekday: int) -> int:
+    """Days from a weekday to the next weekday (Mon-Fri)."""
+    return 1 if weekday < FRIDAY else 7 - weekday
+
+
+def _backward_step(weekday: int) -> int:
+    """Days from a weekday back to the previous weekday (Mon-Fri)."""
+    if weekday == MONDAY:
+        return 3
+    return 2 if weekday == SUNDAY else 1
+
+
 def next_trading_day(
     date: datetime,
     market: Market = Market.NYSE,
@@ -177,16 +242,16 @@ def next_trading_day(
     Returns:
         Next trading day or None if not found within max_days
     """
-    current = date + timedelta(days=1)
-    days_checked = 0
+    # Step past weekends in one jump (Fri -> Mon, Sat -> Mon)
+    offset = _forward_step(date.weekday())
 
-    while days_checked < max_days:
+    while offset <= max_days:
+        current = date + timedelta(days=offset)
         if is_trading_day(current, market):
             return current
-        current += timedelta(days=1)
-        days_checked += 1
+        offset += _forward_step(current.weekday())
 
-    logger.warning(f"No trading day found within {max_days} days of {date.date()}")
+    logger.warning(f"No trading day found within {max_days} days of {_as_date(date)}")
     return None
 
 
@@ -206,16 +271,16 @@ def previous_trading_day(
     Returns:
         Previous trading day or None if not found within max_days
     """
-    current = date - timedelta(days=1)
-    days_checked = 0
+    # Step past weekends in one jump (Mon -> Fri, Sun -> Fri)
+    offset = _backward_step(date.weekday())
 
-    while days_checked < max_days:
+    while offset <= max_days:
+        current = date - timedelta(days=offset)
         if is_trading_day(current, market):
             return current
-        current -= timedelta(days=1)
-        days_checked += 1
+        offset += _backward_step(current.weekday())
 
-    logger.warning(f"No trading day found within {max_days} days before {date.date()}")
+    logger.warning(f"No trading day found within {max_days} days before {_as_date(date)}")
     return None
 
 
@@ -237,6 +302,20 @@ def get_settlement_date(
     Returns:
         Settlement date
     """
+    if settlement_days <= 0:
+        return trade_date
+
+    # Fast path: integer offset into the precomputed trading-day index
+    trade_day = _as_date(trade_date)
+    if _INDEX_START <= trade_day <= _INDEX_END:
+        index = _trading_day_index(market)
+        trade_day64 = np.datetime64(trade_day, "D")
+        position = int(np.searchsorted(index, trade_day64, side="right")) + settlement_days - 1
+
+        if position < index.size:
+            calendar_days = int((index[position] - trade_day64) // np.timedelta64(1, "D"))
+            return trade_date + timedelta(days=calendar_days)
+
     current = trade_date
     days_added = 0
 
@@ -251,6 +330,155 @@ def get_settlement_date(
     return current
 
 
+@functools.lru_cache(maxsize=128)
+def _holiday_array(market: Market, year: int) -> np.ndarray:
+    """
+    Weekday holidays for a market and year as a datetime64[D] array.
+    """
+    return np.array(
+        sorted(d for d in _holidays_for_year(market, year) if d.weekday() < 5),
+        dtype="datetime64[D]"
+    )
+
+
+def _trading_day_mask(
+    start_date: datetime,
+    end_date: datetime,
+    market: Market
+) -> np.ndarray:
+    """
+    Boolean mask of trading days for each calendar day in [start_date, end_date].
+
+    Weekends are masked by weekday arithmetic and holidays with one
+    vectorized membership test, instead of a per-day is_trading_day call.
+    """
+    num_days = (end_date - start_date).days + 1
+    offsets = np.arange(num_days)
+    mask = (start_date.weekday() + offsets) % 7 < 5
+
+    if market not in _HOLIDAY_BUILDERS:
+        if market != Market.GENERIC:
+            logger.warning(f"No holiday calendar for {market.value}, using weekday check")
+        return mask
+
+    holidays = np.concatenate([
+        _holiday_array(market, year)
+        for year in range(start_date.year, end_date.year + 1)
+    ])
+    if holidays.size:
+        start_day = np.datetime64(_as_date(start_date), "D")
+        mask &= ~np.isin(start_day + offsets, holidays)
+
+    return mask
+
+
+# Proleptic Gregorian ordinal of the datetime64 epoch (1970-01-01)
+_EPOCH_ORDINAL = date_type(1970, 1, 1).toordinal()
+
+
+def _holiday_ordinals(market: Market, start_year: int, end_year: int) -> np.ndarray:
+    """Sorted int64 ordinals of weekday holidays in [start_year, end_year]."""
+    if market not in _HOLIDAY_BUILDERS:
+        if market != Market.GENERIC:
+            logger.warning(f"No holiday calendar for {market.value}, using weekday check")
+        return np.empty(0, dtype=np.int64)
+
+    holidays = np.concatenate([
+        _holiday_array(market, year) for year in range(start_year, end_year + 1)
+    ])
+    return holidays.astype(np.int64) + _EPOCH_ORDINAL
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _is_trading_day_int(ordinal, holidays):
+        """Weekday check plus binary search of the sorted holiday ordinals."""
+        # Ordinal 1 (0001-01-01) is a Monday
+        if (ordinal - 1) % 7 >= 5:
+            return False
+        lo, hi = 0, len(holidays)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = holidays[mid]
+            if value < ordinal:
+                lo = mid + 1
+            elif value > ordinal:
+                hi = mid
+            else:
+                return False
+        return True
+
+    @njit(cache=True)
+    def _trading_day_flags_numba(ordinals, holidays):
+        flags = np.empty(ordinals.shape[0], dtype=np.bool_)
+        for i in range(ordinals.shape[0]):
+            flags[i] = _is_trading_day_int(ordinals[i], holidays)
+        return flags
+
+
+def _trading_day_flags_numpy(ordinals: np.ndarray, holidays: np.ndarray) -> np.ndarray:
+    """Vectorized fallback for _trading_day_flags_numba."""
+    flags = (ordinals - 1) % 7 < 5
+    if holidays.size:
+        pos = np.minimum(np.searchsorted(holidays, ordinals), holidays.size - 1)
+        flags &= holidays[pos] != ordinals
+    return flags
+
+
+def are_trading_days(
+    dates: Union[Sequence[datetime], np.ndarray],
+    market: Market = Market.NYSE
+) -> np.ndarray:
+    """
+    Check many dates at once for the specified market.
+
+    Bulk counterpart of is_trading_day for backtests and simulations that
+    make large numbers of calendar lookups. Uses a numba kernel when numba
+    is installed, otherwise NumPy.
+
+    Args:
+        dates: Dates/datetimes, or an integer array of date ordinals
+            (as returned by date.toordinal())
+        market: Market calendar to use
+
+    Returns:
+        Boolean array, True where the date is a trading day
+    """
+    ordinals = np.asarray(dates)
+    if ordinals.dtype.kind not in "iu":
+        ordinals = np.fromiter(
+            (d.toordinal() for d in dates), dtype=np.int64, count=len(dates)
+        )
+    ordinals = ordinals.astype(np.int64, copy=False)
+    if ordinals.size == 0:
+        return np.zeros(0, dtype=bool)
+
+    first = date_type.fromordinal(int(ordinals.min()))
+    last = date_type.fromordinal(int(ordinals.max()))
+    holidays = _holiday_ordinals(market, first.year, last.year)
+
+    if NUMBA_AVAILABLE:
+        return _trading_day_flags_numba(ordinals, holidays)
+    return _trading_day_flags_numpy(ordinals, holidays)
+
+
+# Date range covered by the precomputed trading-day index
+_INDEX_START = date_type(1990, 1, 1)
+_INDEX_END = date_type(2050, 12, 31)
+
+
+@functools.lru_cache(maxsize=None)
+def _trading_day_index(market: Market) -> np.ndarray:
+    """
+    Sorted datetime64[D] array of all trading days in the index range.
+
+    Lets settlement-date offsets be resolved with a binary search instead
+    of repeated next_trading_day calls.
+    """
+    mask = _trading_day_mask(_INDEX_START, _INDEX_END, market)
+    return np.datetime64(_INDEX_START, "D") + np.flatnonzero(mask)
+
+
 def get_trading_days_between(
     start_date: datetime,
     end_date: datetime,
@@ -270,15 +498,9 @@ def get_trading_days_between(
     if start_date > end_date:
         start_date, end_date = end_date, start_date
 
-    trading_days = []
-    current = start_date
+    mask = _trading_day_mask(start_date, end_date, market)
 
-    while current <= end_date:
-        if is_trading_day(current, market):
-            trading_days.append(current)
-        current += timedelta(days=1)
-
-    return trading_days
+    return [start_date + timedelta(days=int(offset)) for offset in np.flatnonzero(mask)]
 
 
 def count_trading_days_between(
@@ -297,7 +519,10 @@ def count_trading_days_between(
     Returns:
         Number of trading days
     """
-    return len(get_trading_days_between(start_date, end_date, market))
+    if start_date > end_date:
+        start_date, end_date = end_date, start_date
+
+    return int(np.count_nonzero(_trading_day_mask(start_date, end_date, market)))
 
 
 def adjust_to_trading_day(
@@ -323,43 +548,102 @@ def adjust_to_trading_day(
     if is_trading_day(date, market):
         return date
 
+    if convention not in ("following", "preceding", "modified_following", "nearest"):
+        logger.warning(f"Unknown convention '{convention}', using 'following'")
+        convention = "following"
+
+    prev_day, next_day = _neighbor_trading_days(date, market)
+
     if convention == "following":
-        result = next_trading_day(date, market)
-        return result if result else date
+        return next_day if next_day else date
 
     elif convention == "preceding":
-        result = previous_trading_day(date, market)
-        return result if result else date
+        return prev_day if prev_day else date
 
     elif convention == "modified_following":
-        next_day = next_trading_day(date, market)
         if next_day and next_day.month == date.month:
             return next_day
         else:
             # If next trading day is in different month, use preceding
-            result = previous_trading_day(date, market)
-            return result if result else date
-
-    elif convention == "nearest":
-        next_day = next_trading_day(date, market)
-        prev_day = previous_trading_day(date, market)
-
-        if next_day is None and prev_day is None:
-            return date
-        elif next_day is None:
-            return prev_day
-        elif prev_day is None:
-            return next_day
-        else:
-            # Choose nearest, prefer previous if equidistant
-            days_to_next = (next_day - date).days
-            days_to_prev = (date - prev_day).days
-            return prev_day if days_to_prev <= days_to_next else next_day
+            return prev_day if prev_day else date
 
+    # "nearest"
+    if next_day is None and prev_day is None:
+        return date
+    elif next_day is None:
+        return prev_day
+    elif prev_day is None:
+        return next_day
     else:
-        logger.warning(f"Unknown convention '{convention}', using 'following'")
-        result = next_trading_day(date, market)
-        return result if result else date
+        # Choose nearest, prefer previous if equidistant
+        days_to_next = (next_day - date).days
+        days_to_prev = (date - prev_day).days
+        return prev_day if days_to_prev <= days_to_next else next_day
+
+
+def _neighbor_trading_days(
+    date: datetime,
+    market: Market,
+    max_days: int = 30
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Find the trading days immediately before and after a non-trading date.
+
+    Uses one binary search in the precomputed trading-day index, falling
+    back to previous_trading_day/next_trading_day outside its range.
+
+    Returns:
+        Tuple of (previous trading day, next trading day); either is None
+        if not found within max_days
+    """
+    day = _as_date(date)
+    index = _trading_day_index(market)
+    day64 = np.datetime64(day, "D")
+    pos = int(np.searchsorted(index, day64, side="left"))
+
+    # Both neighbours must lie inside the index to be trusted
+    if day < _INDEX_START or day > _INDEX_END or pos == 0 or pos >= index.size:
+        return (
+            previous_trading_day(date, market, max_days),
+            next_trading_day(date, market, max_days)
+        )
+
+    one_day = np.timedelta64(1, "D")
+    days_back = int((day64 - index[pos - 1]) // one_day)
+    days_forward = int((index[pos] - day64) // one_day)
+
+    prev_day = date - timedelta(days=days_back) if days_back <= max_days else None
+    next_day = date + timedelta(days=days_forward) if days_forward <= max_days else None
+
+    return prev_day, next_day
+
+
+# Exact symbol -> market lookups for known indices
+_SYMBOL_MARKETS = {
+    # US indices
+    "^GSPC": Market.NYSE,
+    "^DJI": Market.NYSE,
+    "^IXIC": Market.NYSE,
+    "^NDX": Market.NYSE,
+    "^RUT": Market.NYSE,
+    "^VIX": Market.NYSE,
+    # UK indices
+    "^FTSE": Market.LSE,
+    # Japan indices
+    "^N225": Market.TSE,
+    # Hong Kong indices
+    "^HSI": Market.HKEX,
+    # China indices
+    "^FTXIN9": Market.SSE,
+}
+
+# Yahoo Finance exchange suffix -> market
+_SUFFIX_MARKETS = {
+    ".SS": Market.SSE,
+    ".HK": Market.HKEX,
+    ".L": Market.LSE,
+    ".T": Market.TSE,
+}
 
 
 def infer_market_from_symbol(symbol: str) -> Market:
@@ -374,32 +658,19 @@ def infer_market_from_symbol(symbol: str) -> Market:
     """
     symbol_upper = symbol.upper()
 
-    # US indices
-    if symbol_upper.startswith("^") and symbol_upper in ["^GSPC", "^DJI", "^IXIC", "^NDX", "^RUT", "^VIX"]:
-        return Market.NYSE
+    market = _SYMBOL_MARKETS.get(symbol_upper)
+    if market is not None:
+        return market
 
-    # UK indices
-    if symbol_upper in ["^FTSE"]:
-        return Market.LSE
+    # Exchange suffix (e.g. 600000.SS, 0700.HK, VOD.L, 7203.T)
+    dot = symbol_upper.rfind(".")
+    if dot != -1:
+        market = _SUFFIX_MARKETS.get(symbol_upper[dot:])
+        if market is not None:
+            return market
 
-    # Japan indices
-    if symbol_upper in ["^N225"]:
-        return Market.TSE
-
-    # Hong Kong indices
-    if symbol_upper in ["^HSI"]:
-        return Market.HKEX
-
-    # China indices
-    if ".SS" in symbol_upper or symbol_upper in ["^FTXIN9"]:
-        return Market.SSE
-
-    # Default to NYSE for US stocks and US sector ETFs
-    if not symbol_upper.startswith("^") and ".SS" not in symbol_upper and ".HK" not in symbol_upper:
-        return Market.NYSE
-
-    # Generic for everything else
-    return Market.GENERIC
+    # Default to NYSE for US stocks and US sector ETFs, generic for other indices
+    return Market.GENERIC if symbol_upper.startswith("^") else Market.NYSE
 
 
 def validate_date_business_day(
@@ -418,11 +689,56 @@ def validate_date_business_day(
     Returns:
         List of warning messages (empty if valid)
     """
+    return list(_business_day_warnings(date.toordinal(), market, date_type))
+
+
+def validate_settlement_date(
+    trade_date: datetime,
+    settlement_date: datetime,
+    settlement_days: int = 2,
+    market: Market = Market.NYSE
+) -> Dict[str, Any]:
+    """
+    Validate a settlement date against the trade date's T+N settlement.
+
+    Args:
+        trade_date: Trade date
+        settlement_date: Settlement date to validate
+        settlement_days: Number of trading days to settlement (default: T+2)
+        market: Market calendar to use
+
+    Returns:
+        Dictionary with 'is_valid' and 'expected_settlement', plus an
+        'error' message when the dates do not match
+    """
+    expected = get_settlement_date(trade_date, settlement_days, market)
+    result: Dict[str, Any] = {
+        "is_valid": _as_date(settlement_date) == _as_date(expected),
+        "expected_settlement": expected,
+    }
+
+    if not result["is_valid"]:
+        result["error"] = (
+            f"settlement_date ({_as_date(settlement_date).isoformat()}) is not "
+            f"T+{settlement_days} ({_as_date(expected).isoformat()})"
+        )
+
+    return result
+
+
+@functools.lru_cache(maxsize=4096)
+def _business_day_warnings(ordinal: int, market: Market, label: str) -> Tuple[str, ...]:
+    """
+    Business-day warnings for a date given by its ordinal.
+
+    Cached because the same dates are validated across many products.
+    """
+    date = date_type.fromordinal(ordinal)
     warnings = []
 
     if is_weekend(date):
         warnings.append(
-            f"{date_type} ({date.strftime('%Y-%m-%d')}) falls on {date.strftime('%A')} (weekend)"
+            f"{label} ({date.isoformat()}) falls on {_WEEKDAY_NAMES[date.weekday()]} (weekend)"
         )
 
     if not is_trading_day(date, market):
@@ -434,7 +750,7 @@ def validate_date_business_day(
             holiday_name = "a holiday"
 
         warnings.append(
-            f"{date_type} ({date.strftime('%Y-%m-%d')}) falls on {holiday_name}"
+            f"{label} ({date.isoformat()}) falls on {holiday_name}"
         )
 
-    return warnings
+    return tuple(warnings)
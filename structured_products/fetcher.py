@@ -3,13 +3,16 @@ Yahoo Finance price fetcher for structured products.
 """
 
 import logging
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import date, datetime, timedelta
 
+import requests
 import yfinance as yf
+from pandas import Timestamp
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -22,50 +25,155 @@ from .cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Requested dates may be ISO strings or already-parsed date/datetime objects
+DateLike = Union[str, date, datetime]
 
-def rate_limit(calls_per_second: float = 2.0):
+# Network failures worth retrying; anything else (bad symbol, malformed
+# response) fails fast instead of burning the backoff schedule
+_TRANSIENT_ERRORS: Tuple[type, ...] = (
+    requests.exceptions.Timeout,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+)
+try:
+    from curl_cffi.requests import exceptions as _curl_exceptions
+    _TRANSIENT_ERRORS += (_curl_exceptions.Timeout, _curl_exceptions.ConnectionError)
+except ImportError:
+    pass
+# YFRateLimitError only exists in newer yfinance releases
+_rate_limit_error = getattr(getattr(yf, "exceptions", None), "YFRateLimitError", None)
+if _rate_limit_error is not None:
+    _TRANSIENT_ERRORS += (_rate_limit_error,)
+
+# Errors from a malformed response: not worth retrying, but no proof the
+# symbol is bad either
+_MALFORMED_RESPONSE_ERRORS: Tuple[type, ...] = (ValueError, KeyError)
+
+# yfinance's "ticker has no data" errors (raised only when yfinance is
+# configured to raise; otherwise it returns an empty history)
+_ticker_missing_error = getattr(getattr(yf, "exceptions", None), "YFTickerMissingError", None)
+_INVALID_SYMBOL_ERRORS: Tuple[type, ...] = (
+    (_ticker_missing_error,) if _ticker_missing_error is not None else ()
+)
+
+# Symbols yfinance reported as missing (negative cache, consulted and
+# filled only when caching is enabled).  An empty history is no proof: valid
+# symbols have none for future dates, holidays or dates before listing.
+_INVALID_SYMBOLS: set = set()
+
+# Connection pool size for the shared HTTP session
+HTTP_POOL_SIZE = 20
+
+# Shared HTTP session for all Yahoo Finance requests (created lazily)
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """
+    Get the HTTP session shared by all yfinance calls.
+
+    Reusing one keep-alive session avoids a TCP+TLS handshake per symbol.
+    Uses a browser-impersonating curl_cffi session when available (required
+    by recent Yahoo endpoints), otherwise a pooled requests.Session.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            try:
+                from curl_cffi import requests as curl_requests
+                _session = curl_requests.Session(impersonate="chrome")
+            except ImportError:
+                from requests.adapters import HTTPAdapter
+
+                _session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=0  # Retries are handled by tenacity
+                )
+                _session.mount("https://", adapter)
+                _session.mount("http://", adapter)
+            logger.debug("Created shared HTTP session: %s", type(_session).__name__)
+
+        return _session
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to `capacity` calls, refilling at `rate` tokens
+    per second. Callers reserve a token under the lock and sleep outside
+    it, so concurrent workers wait only for their own slot instead of
+    serializing on a shared timestamp.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            logger.debug("Rate limiting: sleeping %.2fs", wait_time)
+            time.sleep(wait_time)
+
+        return wait_time
+
+
+def rate_limit(calls_per_second: float = 2.0, burst: int = 5):
     """
     Rate limiting decorator to avoid API throttling.
 
     Yahoo Finance has rate limits. This ensures we don't exceed them.
+    Uses a token bucket shared by all threads calling the decorated function.
 
     Args:
-        calls_per_second: Maximum number of calls per second (default: 2.0)
+        calls_per_second: Sustained number of calls per second (default: 2.0)
+        burst: Number of calls allowed back-to-back before throttling (default: 5)
     """
-    min_interval = 1.0 / calls_per_second
-    last_call = [0.0]
+    bucket = TokenBucket(rate=calls_per_second, capacity=burst)
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Calculate time since last call
-            elapsed = time.time() - last_call[0]
-
-            # Sleep if we're calling too fast
-            if elapsed < min_interval:
-                sleep_time = min_interval - elapsed
-                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-
-            # Update last call time and execute
-            last_call[0] = time.time()
+            bucket.acquire()
             return func(*args, **kwargs)
 
         return wrapper
     return decorator
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type((Exception,)),
-    before_sleep=before_sleep_log(logger, logging.WARNING),
-    reraise=True
-)
-@rate_limit(calls_per_second=2.0)
 def fetch_historical_prices(
     symbol: str,
-    dates: List[str],
+    dates: List[DateLike],
     lookback_days: int = 7,
     use_cache: bool = True
 ) -> Dict[str, Optional[Dict[str, float]]]:
@@ -73,11 +181,15 @@ def fetch_historical_prices(
     Fetch historical prices for a symbol on or prior to specified dates.
 
     Uses adjusted close prices which account for stock splits and dividends.
-    Includes automatic retry logic with exponential backoff and optional caching.
+    Includes automatic retry logic with exponential backoff for network
+    errors and optional caching. Symbols Yahoo has no history for return
+    None for every date and, when caching, are skipped on later calls
+    (see clear_invalid_symbols).
 
     Args:
         symbol: Yahoo Finance symbol (e.g., "^GSPC")
-        dates: List of ISO-formatted date strings (YYYY-MM-DD)
+        dates: List of ISO-formatted date strings (YYYY-MM-DD) or date/datetime
+            objects (results are keyed by their YYYY-MM-DD string)
         lookback_days: Number of days to look back if no data on exact date
         use_cache: Whether to use caching (default: True)
 
@@ -99,86 +211,280 @@ def fetch_historical_prices(
         logger.warning("No dates provided for fetching")
         return {}
 
-    # Check cache first
-    if use_cache:
-        cache = get_cache()
-        cached_data = cache.get(symbol, dates, lookback_days)
-        if cached_data is not None:
-            logger.info(f"Using cached prices for {symbol}")
-            return cached_data
-
-    logger.info(f"Fetching prices for {symbol} on {len(dates)} dates")
-    results = {}
+    date_objects, results = _parse_dates(dates)
 
-    # Parse all dates
-    date_objects = []
-    for date_str in dates:
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            date_objects.append((date_str, date_obj))
-        except ValueError as e:
-            logger.error(f"Invalid date format '{date_str}': {e}")
+    if use_cache and symbol in _INVALID_SYMBOLS:
+        logger.warning("Skipping known invalid symbol %s", symbol)
+        for date_str, _ in date_objects:
             results[date_str] = None
-            continue
+        return results
+
+    # Check cache first (per date, so overlapping requests share entries).
+    # Cache hits never reach the rate limiter or retry machinery.
+    if use_cache and date_objects:
+        cached = get_cache().get_many(
+            symbol, [date_str for date_str, _ in date_objects], lookback_days
+        )
+        if cached:
+            results.update(cached)
+            date_objects = [
+                (date_str, date_obj) for date_str, date_obj in date_objects
+                if date_str not in cached
+            ]
+            if not date_objects:
+                logger.info("Using cached prices for %s", symbol)
+                return results
 
     if not date_objects:
         logger.error("No valid dates to fetch")
         return results
 
-    # Find the date range to fetch
-    min_date = min(dt for _, dt in date_objects)
-    max_date = max(dt for _, dt in date_objects)
+    fetched = _fetch_historical_prices_uncached(symbol, date_objects, lookback_days)
+    if not fetched:
+        # Invalid symbol, empty window or unreadable response: nothing
+        # worth caching, and only the first proves the symbol is bad
+        if fetched is None and use_cache:
+            _INVALID_SYMBOLS.add(symbol)
+        for date_str, _ in date_objects:
+            results[date_str] = None
+        return results
 
-    # Add lookback buffer
-    start_date = min_date - timedelta(days=lookback_days)
-    end_date = max_date + timedelta(days=1)  # yfinance end date is exclusive
+    results.update(fetched)
 
-    logger.debug(f"Fetching data from {start_date.date()} to {end_date.date()}")
+    # Store newly fetched dates in cache if enabled
+    if use_cache:
+        get_cache().set_many(symbol, lookback_days, fetched)
+
+    return results
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+@rate_limit(calls_per_second=2.0)
+def _fetch_historical_prices_uncached(
+    symbol: str,
+    date_objects: List[Tuple[str, datetime]],
+    lookback_days: int
+) -> Optional[Dict[str, Optional[Dict[str, float]]]]:
+    """
+    Download a symbol's history and look up prices for parsed dates.
+
+    Rate limited and retried on transient network errors.
+
+    Returns:
+        Prices keyed by date string; None if yfinance reports the symbol
+        missing; an empty dict if there is no history in the requested
+        window or the response could not be read
+    """
+    logger.info("Fetching prices for %s on %s dates", symbol, len(date_objects))
+    start_date, end_date = _fetch_window(date_objects, lookback_days)
+
+    logger.debug("Fetching data from %s to %s", start_date.date(), end_date.date())
 
     try:
         # Fetch historical data
-        ticker = yf.Ticker(symbol)
+        ticker = yf.Ticker(symbol, session=_get_session())
         hist = ticker.history(start=start_date, end=end_date)
 
         if hist.empty:
-            # No data available for this symbol
-            logger.warning(f"No historical data available for {symbol}")
-            for date_str, _ in date_objects:
-                results[date_str] = None
-            return results
+            # No trading days in the window (future dates, holidays, or
+            # before listing): the symbol itself may be fine
+            logger.warning("No historical data available for %s", symbol)
+            return {}
 
-        logger.info(f"Retrieved {len(hist)} trading days for {symbol}")
+        logger.info("Retrieved %s trading days for %s", len(hist), symbol)
 
         # For each requested date, find the closest prior trading day
-        for date_str, target_date in date_objects:
-            price_data = find_price_on_or_before(hist, target_date, lookback_days)
-            if price_data:
-                logger.debug(f"Found price for {date_str}: actual date {price_data['actual_date']}")
-            else:
-                logger.warning(f"No price data found for {date_str} within {lookback_days} day lookback")
-            results[date_str] = price_data
+        results: Dict[str, Optional[Dict[str, float]]] = {}
+        _collect_prices(hist, date_objects, lookback_days, results)
+        return results
+
+    except _INVALID_SYMBOL_ERRORS as e:
+        # yfinance reports the symbol has no data: not worth retrying
+        logger.error("Invalid symbol %s: %s", symbol, e)
+        return None
+
+    except _MALFORMED_RESPONSE_ERRORS as e:
+        # Unexpected response shape: fail fast, but the symbol may be fine
+        logger.error("Unreadable response for %s: %s", symbol, e)
+        return {}
 
     except Exception as e:
-        # Handle any errors (invalid symbol, network issues, etc.)
+        # Network issues and other unexpected errors
         logger.error(
-            f"Error fetching data for {symbol}: {e}",
+            "Error fetching data for %s: %s",
+            symbol,
+            e,
             extra={
                 "symbol": symbol,
-                "dates": dates,
+                "dates": [date_str for date_str, _ in date_objects],
                 "lookback_days": lookback_days
             },
             exc_info=True
         )
-        for date_str, _ in date_objects:
-            results[date_str] = None
-        raise  # Re-raise for retry logic
+        raise  # Re-raise; transient errors are retried
 
-    # Store in cache if enabled
-    if use_cache:
-        cache = get_cache()
-        cache.set(symbol, dates, lookback_days, results)
 
-    return results
+def clear_invalid_symbols() -> int:
+    """
+    Forget symbols skipped as invalid, so later fetches try them again.
+
+    Returns:
+        Number of symbols cleared
+    """
+    cleared = len(_INVALID_SYMBOLS)
+    _INVALID_SYMBOLS.clear()
+    return cleared
+
+
+def _parse_dates(
+    dates: List[DateLike]
+) -> Tuple[List[Tuple[str, datetime]], Dict[str, None]]:
+    """
+    Parse ISO date strings; date/datetime objects skip parsing.
+
+    Returns:
+        Tuple of (list of (date_str, datetime) pairs, results dict with
+        None entries for dates that failed to parse)
+    """
+    fromisoformat = datetime.fromisoformat
+    date_objects = []
+    results = {}
+    for value in dates:
+        if isinstance(value, datetime):
+            date_objects.append((value.date().isoformat(), value))
+        elif isinstance(value, date):
+            date_objects.append(
+                (value.isoformat(), datetime(value.year, value.month, value.day))
+            )
+        else:
+            try:
+                date_objects.append((value, fromisoformat(value)))
+            except ValueError as e:
+                logger.error("Invalid date format '%s': %s", value, e)
+                results[value] = None
+
+    return date_objects, results
+
+
+def _fetch_window(
+    date_objects: List[Tuple[str, datetime]],
+    lookback_days: int
+) -> Tuple[datetime, datetime]:
+    """
+    Compute the [start, end) download window covering all requested dates.
+    """
+    # Materialize once so min/max each run as a single C-level pass
+    parsed = [dt for _, dt in date_objects]
+    min_date = min(parsed)
+    max_date = max(parsed)
+
+    # Add lookback buffer
+    start_date = min_date - timedelta(days=lookback_days)
+    end_date = max_date + timedelta(days=1)  # yfinance end date is exclusive
+
+    return start_date, end_date
+
+
+def _collect_prices(
+    hist,
+    date_objects: List[Tuple[str, datetime]],
+    lookback_days: int,
+    results: Dict[str, Optional[Dict[str, float]]]
+) -> None:
+    """
+    Fill results with the closest prior trading day for each requested date.
+    """
+    arrays = _price_arrays(hist)
+    for date_str, target_date in date_objects:
+        price_data = _find_price_in_arrays(arrays, target_date, lookback_days)
+        if price_data:
+            logger.debug("Found price for %s: actual date %s", date_str, price_data['actual_date'])
+        else:
+            logger.warning("No price data found for %s within %s day lookback", date_str, lookback_days)
+        results[date_str] = price_data
+
+
+def _align_timestamp(value: datetime, index) -> Timestamp:
+    """
+    Convert a naive datetime to a Timestamp comparable with the index.
+
+    yfinance histories may carry an exchange timezone; naive targets are
+    interpreted as wall-clock dates in that timezone.
+    """
+    ts = Timestamp(value)
+    tz = getattr(index, "tz", None)
+    if tz is not None and ts.tzinfo is None:
+        ts = ts.tz_localize(tz)
+    return ts
+
+
+# (result key, yfinance column) pairs for float-valued price fields
+_PRICE_FIELDS = (
+    ("open", "Open"),
+    ("high", "High"),
+    ("low", "Low"),
+    ("close", "Close"),
+    ("adj_close", "Adj Close"),
+)
+
+
+def _price_arrays(hist_data) -> Dict[str, Any]:
+    """
+    Extract the price columns of a history as NumPy arrays.
+
+    Done once per history so repeated lookups index plain arrays instead
+    of going through pandas row/label access.
+    """
+    arrays = {
+        key: hist_data[column].to_numpy(dtype=float)
+        for key, column in _PRICE_FIELDS
+    }
+    arrays["volume"] = hist_data["Volume"].to_numpy()
+    arrays["index"] = hist_data.index
+    return arrays
+
+
+def _find_price_in_arrays(
+    arrays: Dict[str, Any],
+    target_date: datetime,
+    max_lookback: int
+) -> Optional[Dict[str, float]]:
+    """
+    Find price data on or before the target date in pre-extracted arrays.
+    """
+    # Binary search for the last row on or before target (no mask copies)
+    index = arrays["index"]
+    target = _align_timestamp(target_date, index)
+    pos = index.searchsorted(target, side="right") - 1
+
+    if pos < 0:
+        logger.debug("No data on or before %s", target_date.date())
+        return None
+
+    # Get the most recent date within lookback window
+    actual_date = index[pos]
+    if actual_date < target - timedelta(days=max_lookback):
+        logger.debug("No data within %s days of %s", max_lookback, target_date.date())
+        return None
+
+    # CRITICAL: Use Adj Close for financial calculations
+    # This accounts for stock splits and dividends
+    # Constant-key literal: built in one step rather than key-by-key inserts
+    return {
+        "actual_date": actual_date.isoformat()[:10],
+        "open": float(arrays["open"][pos]),
+        "high": float(arrays["high"][pos]),
+        "low": float(arrays["low"][pos]),
+        "close": float(arrays["close"][pos]),
+        "adj_close": float(arrays["adj_close"][pos]),  # Use this for calculations!
+        "volume": int(arrays["volume"][pos]),
+    }
 
 
 def find_price_on_or_before(
@@ -197,36 +503,7 @@ def find_price_on_or_before(
     Returns:
         Dictionary with price data including adj_close for calculations
     """
-    # Filter to dates on or before target
-    valid_dates = hist_data[hist_data.index <= target_date]
-
-    if valid_dates.empty:
-        logger.debug(f"No data on or before {target_date.date()}")
-        return None
-
-    # Get the most recent date within lookback window
-    earliest_date = target_date - timedelta(days=max_lookback)
-    valid_dates = valid_dates[valid_dates.index >= earliest_date]
-
-    if valid_dates.empty:
-        logger.debug(f"No data within {max_lookback} days of {target_date.date()}")
-        return None
-
-    # Get the most recent row
-    most_recent = valid_dates.iloc[-1]
-    actual_date = most_recent.name
-
-    # CRITICAL: Use Adj Close for financial calculations
-    # This accounts for stock splits and dividends
-    return {
-        "actual_date": actual_date.strftime("%Y-%m-%d"),
-        "open": float(most_recent["Open"]),
-        "high": float(most_recent["High"]),
-        "low": float(most_recent["Low"]),
-        "close": float(most_recent["Close"]),
-        "adj_close": float(most_recent["Adj Close"]),  # Use this for calculations!
-        "volume": int(most_recent["Volume"]),
-    }
+    return _find_price_in_arrays(_price_arrays(hist_data), target_date, max_lookback)
 
 
 def fetch_prices_for_multiple_symbols(
@@ -240,7 +517,7 @@ def fetch_prices_for_multiple_symbols(
     Fetch historical prices for multiple symbols concurrently.
 
     Uses ThreadPoolExecutor for parallel fetching, significantly improving
-    performance for multiple symbols.
+    performance for multiple symbols. Results are keyed in input order.
 
     Args:
         symbols: List of Yahoo Finance symbols
@@ -256,30 +533,136 @@ def fetch_prices_for_multiple_symbols(
         logger.warning("No symbols provided for fetching")
         return {}
 
-    logger.info(f"Fetching prices for {len(symbols)} symbols concurrently (max_workers={max_workers})")
+    logger.info("Fetching prices for %s symbols concurrently (max_workers=%s)", len(symbols), max_workers)
     results = {}
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_symbol = {
-            executor.submit(
+        # Submit all tasks, keeping input order
+        futures = [
+            (symbol, executor.submit(
                 fetch_historical_prices,
                 symbol,
                 dates,
                 lookback_days,
                 use_cache
-            ): symbol
+            ))
             for symbol in symbols
-        }
+        ]
 
-        # Collect results as they complete
-        for future in as_completed(future_to_symbol):
-            symbol = future_to_symbol[future]
+        # Collect results in input order (deterministic output)
+        for symbol, future in futures:
             try:
                 results[symbol] = future.result()
-                logger.info(f"Successfully fetched prices for {symbol}")
+                logger.info("Successfully fetched prices for %s", symbol)
             except Exception as e:
-                logger.error(f"Failed to fetch prices for {symbol}: {e}", exc_info=True)
+                logger.error("Failed to fetch prices for %s: %s", symbol, e, exc_info=True)
                 results[symbol] = {date: None for date in dates}
 
     return results
+
+
+def fetch_prices_for_multiple_symbols_batched(
+    symbols: List[str],
+    dates: List[DateLike],
+    lookback_days: int = 7,
+    use_cache: bool = True
+) -> Dict[str, Dict[str, Optional[Dict[str, float]]]]:
+    """
+    Fetch historical prices for multiple symbols with one download request.
+
+    Cached symbols are served from the cache; the remaining symbols are
+    fetched together with a single yf.download call covering all dates.
+    Falls back to fetch_prices_for_multiple_symbols if the batch download
+    fails.
+
+    Args:
+        symbols: List of Yahoo Finance symbols
+        dates: List of ISO-formatted date strings or date/datetime objects
+        lookback_days: Number of days to look back if no data on exact date
+        use_cache: Whether to use caching (default: True)
+
+    Returns:
+        Dictionary mapping symbols to their price data
+    """
+    if not symbols:
+        logger.warning("No symbols provided for fetching")
+        return {}
+
+    if not dates:
+        logger.warning("No dates provided for fetching")
+        return {symbol: {} for symbol in symbols}
+
+    results = {}
+    misses = []
+
+    date_objects, invalid_results = _parse_dates(dates)
+    date_keys = [date_str for date_str, _ in date_objects]
+    if not date_objects:
+        logger.error("No valid dates to fetch")
+        return {symbol: dict(invalid_results) for symbol in symbols}
+
+    # Serve fully cached symbols first
+    cache = get_cache() if use_cache else None
+    for symbol in dict.fromkeys(symbols):
+        cached = cache.get_many(symbol, date_keys, lookback_days) if cache else {}
+        if all(date_str in cached for date_str in date_keys):
+            logger.info("Using cached prices for %s", symbol)
+            results[symbol] = {**invalid_results, **cached}
+        else:
+            misses.append(symbol)
+
+    if not misses:
+        return results
+
+    start_date, end_date = _fetch_window(date_objects, lookback_days)
+    logger.info("Batch fetching prices for %s symbols on %s dates", len(misses), len(dates))
+
+    try:
+        hist = yf.download(
+            misses,
+            start=start_date,
+            end=end_date,
+            group_by="ticker",
+            auto_adjust=False,
+            threads=True,
+            progress=False,
+            session=_get_session()
+        )
+    except Exception as e:
+        logger.warning("Batch download failed (%s), falling back to per-symbol fetch", e)
+        results.update(fetch_prices_for_multiple_symbols(
+            misses, dates, lookback_days, use_cache=use_cache
+        ))
+        return results
+
+    for symbol in misses:
+        symbol_results = dict(invalid_results)
+
+        if hist is None or hist.empty:
+            symbol_hist = None
+        elif hist.columns.nlevels > 1:
+            symbol_hist = hist[symbol] if symbol in hist.columns.get_level_values(0) else None
+        else:
+            symbol_hist = hist
+
+        if symbol_hist is not None:
+            # Rows are the union of all symbols' trading days
+            symbol_hist = symbol_hist.dropna(how="all")
+
+        if symbol_hist is None or symbol_hist.empty:
+            logger.warning("No historical data available for %s", symbol)
+            for date_str, _ in date_objects:
+                symbol_results[date_str] = None
+        else:
+            _collect_prices(symbol_hist, date_objects, lookback_days, symbol_results)
+            if cache:
+                cache.set_many(
+                    symbol,
+                    lookback_days,
+                    {date_str: symbol_results[date_str] for date_str, _ in date_objects}
+                )
+
+        results[symbol] = symbol_results
+
+    # Preserve the caller's symbol order
+    return {symbol: results[symbol] for symbol in dict.fromkeys(symbols)}
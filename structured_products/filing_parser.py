@@ -10,20 +10,298 @@ After extraction, derives computed fields (threshold_pct, contingent_payment_pct
 cross-validates values, and tracks where each value came from for debugging.
 """
 
+import copy
+import hashlib
 import logging
+import os
 import re
+import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .table_extractor import (
     extract_table_key_value_pairs,
     match_labels_to_fields,
     LABEL_MAP,
+    _required_literal,
 )
 from .parser import extract_text_from_html
+from .workers import process_pool
 
 logger = logging.getLogger(__name__)
 
+# Try to import hyperscan (optional dependency)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+    logger.debug("hyperscan available - multi-pattern prefilter enabled")
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    logger.debug("hyperscan not available - using re for every pattern")
+
+# Try to import pyahocorasick (optional dependency)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+    logger.debug("pyahocorasick available - one-pass literal prefilter enabled")
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.debug("pyahocorasick not available - literals checked one by one")
+
+
+# ---------------------------------------------------------------------------
+# Hyperscan prefilter
+#
+# Filings are scanned with dozens of independent regexes and most of them
+# never match.  When hyperscan is installed, one SIMD multi-pattern pass
+# over a large text tells us which patterns *can* match; the rest skip
+# their full-text `re` scan.  Patterns that may match still run through
+# `re`, so capture groups and match semantics are unchanged.
+# ---------------------------------------------------------------------------
+# Texts shorter than this are cheaper to scan with re directly
+_PREFILTER_MIN_CHARS = 100_000
+
+# Without a hyperscan verdict, texts at least this long are first checked
+# for each pattern's required literal (a C-level substring search).  When
+# it cannot change the result, such texts are also scanned with an re.ASCII
+# compile of each pattern; case-insensitive patterns are lower-cased and
+# run case-sensitively over the lower-cased text, which has the same
+# offsets and digits.
+_LITERAL_MIN_CHARS = 1_000
+_LITERAL_MIN_LEN = 4
+
+_prefilter_patterns: List["_PrefilteredPattern"] = []
+_prefilter_db = None
+_prefilter_failed = False
+_literal_automaton = None
+_prefilter_lock = threading.Lock()
+_prefilter_local = threading.local()
+
+
+class _PrefilteredPattern:
+    """Compiled regex whose full-text scans consult the hyperscan prefilter."""
+
+    __slots__ = (
+        "regex", "ascii_regex", "ascii_folded", "pattern", "groups", "literal", "_id",
+    )
+
+    def __init__(self, pattern: str, flags: int = re.I):
+        self.regex = re.compile(pattern, flags)
+        self.ascii_folded = bool(flags & re.I)
+        if self.ascii_folded:
+            self.ascii_regex = re.compile(
+                _fold_pattern(pattern), (flags & ~re.I) | re.ASCII
+            )
+        else:
+            self.ascii_regex = re.compile(pattern, flags | re.ASCII)
+        self.pattern = pattern
+        self.groups = self.regex.groups
+        self.literal = _required_literal(pattern, _LITERAL_MIN_LEN)
+        self._id = len(_prefilter_patterns)
+        _prefilter_patterns.append(self)
+
+    # The length test is inlined so short texts (the common case) pay no
+    # extra Python calls over a bare compiled pattern
+    def search(self, text: str) -> Optional[re.Match]:
+        if len(text) < _LITERAL_MIN_CHARS:
+            return self.regex.search(text)
+        target = _scan_target(self, text)
+        if target is None:
+            return None
+        m = target[0].search(target[1])
+        if m is None or target[1] is text:
+            return m
+        return self._on_original(m, text)
+
+    def finditer(self, text: str) -> Iterator[re.Match]:
+        if len(text) < _LITERAL_MIN_CHARS:
+            return self.regex.finditer(text)
+        target = _scan_target(self, text)
+        if target is None:
+            return iter(())
+        if target[1] is text:
+            return target[0].finditer(text)
+        return (self._on_original(m, text) for m in target[0].finditer(target[1]))
+
+    def _on_original(self, m: re.Match, text: str) -> re.Match:
+        """
+        Redo a match found in the folded copy of *text* on *text* itself.
+
+        The folded copy has the same offsets, so anchoring the original
+        pattern at the match start gives the same span, with groups and
+        m.string taken from the caller's text.
+        """
+        return self.regex.match(text, m.start())
+
+
+def _fold_pattern(pattern: str) -> str:
+    """Lower-case the literal characters of *pattern*, leaving escapes alone."""
+    return re.sub(r"\\.|[A-Z]+", lambda m: m[0] if m[0][0] == "\\" else m[0].lower(), pattern)
+
+
+def _get_prefilter_db():
+    """Build the hyperscan database on first use (compiling takes ~1s)."""
+    global _prefilter_db, _prefilter_failed
+
+    with _prefilter_lock:
+        if _prefilter_db is None and not _prefilter_failed:
+            # PREFILTER: may over-report but never misses a match
+            flags = (
+                hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+                | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                | hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_ALLOWEMPTY
+            )
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=[p.pattern.encode("utf-8") for p in _prefilter_patterns],
+                    ids=list(range(len(_prefilter_patterns))),
+                    elements=len(_prefilter_patterns),
+                    flags=[flags] * len(_prefilter_patterns),
+                )
+                _prefilter_db = db
+            except Exception as e:
+                logger.warning("hyperscan compile failed, prefilter disabled: %s", e)
+                _prefilter_failed = True
+        return _prefilter_db
+
+
+# Characters re matches where hyperscan's UCP tables do not: \s also covers
+# \x1c-\x1f, and case-insensitive "i" also covers dotted/dotless "İ"/"ı"
+_HYPERSCAN_BLIND_RE = re.compile(r"[\x1c-\x1f\u0130\u0131]")
+
+
+def _prefilter_hits(text: str) -> Optional[Set[int]]:
+    """
+    Ids of patterns that may match *text*, or None if not prefiltered.
+
+    Texts containing characters hyperscan and re disagree on are not
+    prefiltered.  The last two scanned texts are remembered per thread,
+    which covers parse_filing alternating between the full text and its
+    Tier 3 window.
+    """
+    if not HYPERSCAN_AVAILABLE or len(text) < _PREFILTER_MIN_CHARS:
+        return None
+
+    recent = getattr(_prefilter_local, "recent", None)
+    if recent is None:
+        recent = _prefilter_local.recent = []
+    for scanned, hits in recent:
+        if scanned is text:
+            return hits
+
+    db = _get_prefilter_db()
+    if db is None:
+        return None
+
+    hits: Optional[Set[int]] = None
+    if _HYPERSCAN_BLIND_RE.search(text) is None:
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+
+        db.scan(text.encode("utf-8", "replace"), match_event_handler=on_match)
+    recent.insert(0, (text, hits))
+    del recent[2:]
+    return hits
+
+
+# ASCII characters that Unicode \s matches but re.ASCII \s does not
+_UNICODE_ONLY_SPACE_RE = re.compile(r"[\x1c-\x1f]")
+
+
+def _get_literal_automaton():
+    """Build the Aho-Corasick automaton over all required literals on first use."""
+    global _literal_automaton
+
+    with _prefilter_lock:
+        if _literal_automaton is None:
+            automaton = ahocorasick.Automaton()
+            for literal in {p.literal for p in _prefilter_patterns if p.literal}:
+                automaton.add_word(literal, literal)
+            automaton.make_automaton()
+            _literal_automaton = automaton
+        return _literal_automaton
+
+
+class _TextProfile:
+    """Facts about one text shared by every pattern scan of it."""
+
+    __slots__ = ("folded", "ascii_safe", "_literals")
+
+    def __init__(self, text: str):
+        folded = text.casefold()
+        if not folded.isascii():
+            # re.I also lets "i" match dotless "ı" and dotted "İ" (folds to "i̇")
+            folded = folded.replace("\u0131", "i").replace("\u0307", "")
+        # Case-folded text for required-literal checks
+        self.folded = folded
+        # Whether re.ASCII patterns match the text exactly as Unicode ones do
+        self.ascii_safe = (
+            text.isascii() and _UNICODE_ONLY_SPACE_RE.search(text) is None
+        )
+        self._literals: Optional[Set[str]] = None
+
+    @property
+    def literals(self) -> Set[str]:
+        """Required literals present in the text (found on first use)."""
+        if self._literals is None:
+            if AHOCORASICK_AVAILABLE:
+                # One pass over the text instead of one per literal
+                self._literals = {
+                    literal for _, literal in _get_literal_automaton().iter(self.folded)
+                }
+            else:
+                self._literals = {
+                    p.literal for p in _prefilter_patterns
+                    if p.literal and p.literal in self.folded
+                }
+        return self._literals
+
+
+def _text_profile(text: str) -> _TextProfile:
+    """
+    Profile of *text* for literal checks and ASCII scans.
+
+    The last two profiled texts are remembered per thread, like
+    _prefilter_hits.
+    """
+    recent = getattr(_prefilter_local, "profiles", None)
+    if recent is None:
+        recent = _prefilter_local.profiles = []
+    for original, profile in recent:
+        if original is text:
+            return profile
+
+    profile = _TextProfile(text)
+    recent.insert(0, (text, profile))
+    del recent[2:]
+    return profile
+
+
+def _ruled_out(pattern: "_PrefilteredPattern", text: str) -> bool:
+    """True if the prefilter or a missing literal proves *pattern* cannot match."""
+    hits = _prefilter_hits(text)
+    if hits is not None:
+        return pattern._id not in hits
+    literal = pattern.literal
+    return literal is not None and literal not in _text_profile(text).literals
+
+
+def _scan_target(
+    pattern: "_PrefilteredPattern", text: str
+) -> Optional[Tuple[re.Pattern, str]]:
+    """(compiled regex, string) to scan for *pattern* in *text*, or None if it cannot match."""
+    if _ruled_out(pattern, text):
+        return None
+    profile = _text_profile(text)
+    if not profile.ascii_safe:
+        return pattern.regex, text
+    return pattern.ascii_regex, profile.folded if pattern.ascii_folded else text
+
 
 # ---------------------------------------------------------------------------
 # Regex helpers (shared by Tier 2 and Tier 3)
@@ -34,6 +312,11 @@ MONEY_RE = re.compile(
 PCT_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*%")
 
 
+def _match_float(m: re.Match, group: int = 1) -> float:
+    """Parse a captured number such as "1,234.56" as a float."""
+    return float(m[group].replace(",", ""))
+
+
 # ---------------------------------------------------------------------------
 # Issuer-specific regex configurations  (Tier 2)
 # Moved from streamlit_app.py ISSUER_CONFIGS
@@ -202,6 +485,25 @@ ISSUER_CONFIGS: Dict[str, Dict[str, List[str]]] = {
     },
 }
 
+# Compiled once at import; the source string stays available as .pattern
+# for the "pattern" provenance field
+ISSUER_CONFIGS_COMPILED: Dict[str, Dict[str, List[_PrefilteredPattern]]] = {
+    issuer: {
+        key: [_PrefilteredPattern(p) for p in patterns]
+        for key, patterns in config.items()
+        if key != "date_column_patterns"  # Plain column labels, not regexes
+    }
+    for issuer, config in ISSUER_CONFIGS.items()
+}
+
+# Coupon patterns that capture an annual rate rather than a per-period payment
+_COUPON_RATE_PATTERNS: FrozenSet[_PrefilteredPattern] = frozenset(
+    pattern
+    for config in ISSUER_CONFIGS_COMPILED.values()
+    for pattern in config.get("coupon_patterns", [])
+    if r"per\s+annum" in pattern.pattern
+)
+
 # Patterns without dollar capture groups (autocall equals initial price)
 _AUTOCALL_EQUALS_INITIAL_PATTERNS = [
     r"greater\s+than\s+or\s+equal\s+to\s+the\s+initial\s+(?:share\s+)?(?:price|value|underlier\s+value|level)",
@@ -230,39 +532,98 @@ _ISSUER_DETECT_PATTERNS: Dict[str, List[str]] = {
 }
 
 
-def detect_issuer(text: str) -> Optional[str]:
-    """Auto-detect issuer from filing text."""
-    for issuer, patterns in _ISSUER_DETECT_PATTERNS.items():
+_ISSUER_DETECT_COMPILED: Dict[str, List[_PrefilteredPattern]] = {
+    issuer: [_PrefilteredPattern(p) for p in patterns]
+    for issuer, patterns in _ISSUER_DETECT_PATTERNS.items()
+}
+
+
+# The issuer is named on the cover page; search this many leading
+# characters before falling back to the full text
+_ISSUER_HEADER_CHARS = 200_000
+
+
+def _detect_issuer_in(text: str) -> Optional[str]:
+    """First issuer (in _ISSUER_DETECT_PATTERNS order) mentioned in *text*."""
+    for issuer, patterns in _ISSUER_DETECT_COMPILED.items():
         for pattern in patterns:
-            if re.search(pattern, text, flags=re.I):
+            if pattern.search(text):
                 return issuer
     return None
 
 
+# Detected issuers keyed by text digest, oldest first.  The whole text is
+# hashed because detection falls back to scanning all of it.
+_DETECT_CACHE_SIZE = 1024
+_detect_cache: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+_detect_cache_lock = threading.Lock()
+
+
+def detect_issuer(text: str) -> Optional[str]:
+    """Auto-detect issuer from filing text (memoized by text digest)."""
+    key = hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    with _detect_cache_lock:
+        if key in _detect_cache:
+            _detect_cache.move_to_end(key)
+            return _detect_cache[key]
+
+    issuer = _detect_issuer_in(text[:_ISSUER_HEADER_CHARS])
+    if issuer is None and len(text) > _ISSUER_HEADER_CHARS:
+        issuer = _detect_issuer_in(text)
+
+    with _detect_cache_lock:
+        _detect_cache[key] = issuer
+        while len(_detect_cache) > _DETECT_CACHE_SIZE:
+            _detect_cache.popitem(last=False)
+    return issuer
+
+
 # ---------------------------------------------------------------------------
 # Tier 2: Issuer-specific regex extraction
 # ---------------------------------------------------------------------------
+# Result fields each Tier 2 pattern family can fill (the initial price
+# also feeds autocall derivation)
+_FAMILY_FIELDS: Dict[str, Set[str]] = {
+    "initial_patterns": {"initial_price", "autocall_level"},
+    "threshold_patterns": {"threshold_dollar"},
+    "autocall_patterns": {"autocall_level"},
+    "coupon_patterns": {"coupon_payment", "coupon_rate_pct"},
+    "notional_patterns": {"notional"},
+}
+
+
 def _extract_with_issuer_regex(
     text: str,
-    config: Dict[str, List[str]],
+    config: Dict[str, List[_PrefilteredPattern]],
     initial_price: Optional[float] = None,
+    fields: Optional[Set[str]] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """
     Apply issuer-specific regex patterns (Tier 2).
 
+    *config* is an entry of ISSUER_CONFIGS_COMPILED.  If *fields* is given,
+    pattern families that cannot fill any of those fields are skipped.
+
     Returns a dict keyed by canonical field name, each value containing:
       {"value": float_or_None, "source": "regex_issuer", "pattern": str}
     """
     result: Dict[str, Dict[str, Any]] = {}
 
+    def family(key: str) -> List[_PrefilteredPattern]:
+        if fields is not None and not (_FAMILY_FIELDS[key] & fields):
+            return []
+        return config.get(key, [])
+
     # --- initial_price ---
-    for pattern in config.get("initial_patterns", []):
-        m = re.search(pattern, text, flags=re.I)
+    for pattern in family("initial_patterns"):
+        m = pattern.search(text)
         if m:
             result["initial_price"] = {
-                "value": float(m.group(1).replace(",", "")),
+                "value": _match_float(m),
                 "source": "regex_issuer",
-                "pattern": pattern,
+                "pattern": pattern.pattern,
             }
             break
 
@@ -272,67 +633,63 @@ def _extract_with_issuer_regex(
     )
 
     # --- threshold_dollar ---
-    for pattern in config.get("threshold_patterns", []):
-        m = re.search(pattern, text, flags=re.I)
+    for pattern in family("threshold_patterns"):
+        m = pattern.search(text)
         if m:
             result["threshold_dollar"] = {
-                "value": float(m.group(1).replace(",", "")),
+                "value": _match_float(m),
                 "source": "regex_issuer",
-                "pattern": pattern,
+                "pattern": pattern.pattern,
             }
             break
 
     # --- autocall_level ---
-    for pattern in config.get("autocall_patterns", []):
+    for pattern in family("autocall_patterns"):
         # Check if this pattern has a capture group (i.e., extracts a dollar value)
         # vs. a semantic pattern like "greater than or equal to the initial price"
-        has_capture_group = bool(re.search(r'\((?!\?)', pattern))
-        if not has_capture_group:
+        if not pattern.groups:
             # No capture group → semantic "equals initial" pattern
-            if re.search(pattern, text, flags=re.I) and init_val:
+            # (only worth scanning for when there is an initial to use)
+            if init_val and pattern.search(text):
                 result["autocall_level"] = {
                     "value": init_val,
                     "source": "regex_issuer",
-                    "pattern": pattern,
+                    "pattern": pattern.pattern,
                 }
                 break
         else:
-            m = re.search(pattern, text, flags=re.I)
+            m = pattern.search(text)
             if m:
                 result["autocall_level"] = {
-                    "value": float(m.group(1).replace(",", "")),
+                    "value": _match_float(m),
                     "source": "regex_issuer",
-                    "pattern": pattern,
+                    "pattern": pattern.pattern,
                 }
                 break
 
     # --- coupon_payment / coupon_rate_pct ---
-    for pattern in config.get("coupon_patterns", []):
-        m = re.search(pattern, text, flags=re.I)
+    for pattern in family("coupon_patterns"):
+        m = pattern.search(text)
         if m:
-            value = float(m.group(1).replace(",", ""))
-            if r"per\s+annum" in pattern:
-                result["coupon_rate_pct"] = {
-                    "value": value,
-                    "source": "regex_issuer",
-                    "pattern": pattern,
-                }
+            if pattern in _COUPON_RATE_PATTERNS:
+                field_name = "coupon_rate_pct"
             else:
-                result["coupon_payment"] = {
-                    "value": value,
-                    "source": "regex_issuer",
-                    "pattern": pattern,
-                }
+                field_name = "coupon_payment"
+            result[field_name] = {
+                "value": _match_float(m),
+                "source": "regex_issuer",
+                "pattern": pattern.pattern,
+            }
             break
 
     # --- notional ---
-    for pattern in config.get("notional_patterns", []):
-        m = re.search(pattern, text, flags=re.I)
+    for pattern in family("notional_patterns"):
+        m = pattern.search(text)
         if m:
             result["notional"] = {
-                "value": float(m.group(1).replace(",", "")),
+                "value": _match_float(m),
                 "source": "regex_issuer",
-                "pattern": pattern,
+                "pattern": pattern.pattern,
             }
             break
 
@@ -342,6 +699,126 @@ def _extract_with_issuer_regex(
 # ---------------------------------------------------------------------------
 # Tier 3: Generic regex fallbacks  (moved from streamlit_app.py)
 # ---------------------------------------------------------------------------
+_DOLLAR_AMOUNT_RE = re.compile(r"\$\s*([0-9,]+(?:\.[0-9]+)?)")
+
+# Initial price strategies, in priority order
+_INITIAL_VALUE_RE = _PrefilteredPattern(
+    r"Initial\s+Value[^$]{0,30}\$\s*([0-9,]+(?:\.[0-9]+)?)", re.I
+)
+_INITIAL_PRICE_RE = _PrefilteredPattern(
+    r"Initial\s+price[^$]{0,30}\$\s*([0-9,]+(?:\.[0-9]+)?)", re.I
+)
+_INITIAL_LABELED_RE = _PrefilteredPattern(
+    r"Initial\s+(?:Share|Stock)\s+Price[^:$]*[:]\s*\$?\s*([0-9,]+(?:\.[0-9]+)?)", re.I
+)
+_INITIAL_HEADING_RE = _PrefilteredPattern(r"\b(Initial\s+(?:Share|Stock)\s+Price)\b", re.I)
+_INITIAL_BROAD_RE = _PrefilteredPattern(
+    r"initial\s+share\s+price[^$]*\$\s*([0-9,]+(?:\.[0-9]+)?)", re.I
+)
+
+# Threshold headings and the values near them (the value patterns only
+# ever scan short windows, so they skip the prefilter)
+_THRESHOLD_HEADING_RE = _PrefilteredPattern(
+    r"(interest\s+barrier|trigger\s+value|downside\s+threshold\s+level|"
+    r"threshold\s+level|barrier\s+level)",
+    re.I,
+)
+_THRESHOLD_DECIMAL_RE = re.compile(r"\$?\s*([0-9]{2,5}\.[0-9]{2,5})")
+_THRESHOLD_PCT_RE = re.compile(
+    r"([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:of\s+the\s+initial\s+(?:value|share\s+price))?", re.I
+)
+_THRESHOLD_DOLLAR_WIDE_RE = _PrefilteredPattern(
+    r"threshold\s+level[^$]*\$\s*([0-9,]+(?:\.[0-9]+)?)", re.I
+)
+_THRESHOLD_PCT_WIDE_RE = _PrefilteredPattern(
+    r"threshold\s+level[^%]*([0-9]+(?:\.[0-9]+)?)\s*%", re.I
+)
+
+# Semantic "autocall equals initial" rules
+_EQUALS_INITIAL_RES = [
+    _PrefilteredPattern(
+        r"greater\s+than\s+or\s+equal\s+to\s+the\s+initial\s+"
+        r"(?:share\s+)?(?:price|value|underlier\s+value|level)", re.I
+    ),
+    _PrefilteredPattern(
+        r"equal\s+to\s+or\s+greater\s+than\s+the\s+initial\s+"
+        r"(?:share\s+)?(?:price|value|underlier\s+value|level)", re.I
+    ),
+    _PrefilteredPattern(
+        r"at\s+or\s+above\s+the\s+initial\s+"
+        r"(?:share\s+)?(?:price|value|underlier\s+value|level)", re.I
+    ),
+    _PrefilteredPattern(
+        r"at\s+least\s+(?:equal\s+to\s+)?the\s+initial\s+"
+        r"(?:share\s+)?(?:price|value|underlier\s+value|level)", re.I
+    ),
+]
+_AUTOCALL_100PCT_RE = _PrefilteredPattern(
+    r"\b100\s*%\s*(?:of\s+the\s+initial|initial\s+(?:share\s+)?(?:price|value|underlier\s+value|level))",
+    re.I,
+)
+
+# Keywords whose surrounding text may carry the autocall level
+_AUTOCALL_KEYWORD_RE = _PrefilteredPattern(
+    r"(automatic(?:ally)?\s+call(?:ed)?|autocall|early\s+redemption)", re.I
+)
+_CALL_LEVEL_KEYWORD_RE = _PrefilteredPattern(
+    r"(call\s+threshold\s+level|call\s+level|redemption\s+trigger|redemption\s+level)", re.I
+)
+
+_COUPON_RATE_ANNUAL_RE = _PrefilteredPattern(
+    r"([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:per\s*annum|p\.a\.|annual)", re.I
+)
+_CONTINGENT_INTEREST_RATE_RE = _PrefilteredPattern(
+    r"Contingent\s+Interest\s+Rate[^:]*[:]\s*([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:per\s*annum)?", re.I
+)
+_COUPON_PAYMENT_GS_RE = _PrefilteredPattern(
+    r"Contingent\s+(?:quarterly|monthly|semi-annual|annual)\s+coupon[^$]{0,50}\$\s*([0-9,]+(?:\.[0-9]+)?)",
+    re.I,
+)
+_COUPON_PAYMENT_CIP_RE = _PrefilteredPattern(
+    r"Contingent\s+Interest\s+Payment[^$]{0,200}\$\s*([0-9,]+(?:\.[0-9]+)?)", re.I
+)
+
+# Tier-3 terms cluster in the summary / pricing supplement near the top of
+# the filing; scan a bounded window first and the full text when the window
+# misses a field or its match runs up to the end of the window
+_TIER3_ANCHOR_RE = _PrefilteredPattern(r"key\s+terms|summary|pricing\s+supplement", re.I)
+_TIER3_WINDOW_CHARS = 200_000
+_WHITESPACE_RE = re.compile(r"\s")
+
+_GENERIC_NOTIONAL_RES = [
+    _PrefilteredPattern(p) for p in (
+        r"per\s+\$\s*([0-9,]+(?:\.[0-9]+)?)\s+(?:stated\s+)?principal\s+amount",
+        r"(?:stated\s+)?principal\s+amount\s+of\s+\$\s*([0-9,]+(?:\.[0-9]+)?)",
+        r"each\s+(?:security|note)\s+has\s+a\s+(?:stated\s+)?principal\s+amount\s+of\s+\$\s*([0-9,]+(?:\.[0-9]+)?)",
+        r"principal\s+amount\s+per\s+(?:security|note)[:\s]+\$\s*([0-9,]+(?:\.[0-9]+)?)",
+    )
+]
+
+
+def _tier3_window(text: str) -> str:
+    """
+    Leading slice of *text* for Tier 3 scans.
+
+    Extends _TIER3_WINDOW_CHARS past the first summary/key-terms heading,
+    then on to the next whitespace so no number or word is cut in two.
+    The cover page before the heading is kept so leftmost matches there
+    are not traded for later ones. Returns *text* itself when it is short.
+    """
+    if len(text) <= _TIER3_WINDOW_CHARS:
+        return text
+    anchor = _TIER3_ANCHOR_RE.search(text)
+    end = (anchor.start() if anchor else 0) + _TIER3_WINDOW_CHARS
+    m = _WHITESPACE_RE.search(text, end) if end < len(text) else None
+    return text[:m.start()] if m else text
+
+
+def _within_window(found: Optional[Dict[str, Any]], window: str) -> bool:
+    """Whether a Tier 3 result's match ends before the end of *window*."""
+    return found is not None and found["end"] < len(window)
+
+
 def _extract_generic_initial_and_threshold(
     text: str,
 ) -> Dict[str, Dict[str, Any]]:
@@ -350,95 +827,86 @@ def _extract_generic_initial_and_threshold(
     Multi-strategy approach with cross-validation.
     """
     result: Dict[str, Dict[str, Any]] = {}
-    initial: Optional[float] = None
 
     # Strategy 1: "Initial Value ... $XXX"
-    m = re.search(r"Initial\s+Value[^$]{0,30}\$\s*([0-9,]+(?:\.[0-9]+)?)", text, flags=re.I)
-    if m:
-        initial = float(m.group(1).replace(",", ""))
+    m_initial = _INITIAL_VALUE_RE.search(text)
 
     # Strategy 2: "Initial price ... $XXX"
-    if initial is None:
-        m = re.search(r"Initial\s+price[^$]{0,30}\$\s*([0-9,]+(?:\.[0-9]+)?)", text, flags=re.I)
-        if m:
-            initial = float(m.group(1).replace(",", ""))
+    if m_initial is None:
+        m_initial = _INITIAL_PRICE_RE.search(text)
 
     # Strategy 3: "Initial Share Price:" or "Initial Stock Price:" as labeled field
-    if initial is None:
-        m = re.search(
-            r"Initial\s+(?:Share|Stock)\s+Price[^:$]*[:]\s*\$?\s*([0-9,]+(?:\.[0-9]+)?)",
-            text, flags=re.I,
-        )
-        if m:
-            initial = float(m.group(1).replace(",", ""))
+    if m_initial is None:
+        m_initial = _INITIAL_LABELED_RE.search(text)
 
     # Strategy 4: Section heading + nearby dollar amount
-    if initial is None:
-        for m in re.finditer(r"\b(Initial\s+(?:Share|Stock)\s+Price)\b", text, flags=re.I):
-            snippet = text[m.end():m.end() + 200]
-            m_val = re.search(r"\$\s*([0-9,]+(?:\.[0-9]+)?)", snippet)
-            if m_val:
-                initial = float(m_val.group(1).replace(",", ""))
+    if m_initial is None:
+        for m in _INITIAL_HEADING_RE.finditer(text):
+            m_initial = _DOLLAR_AMOUNT_RE.search(text, m.end(), m.end() + 200)
+            if m_initial:
                 break
 
     # Strategy 5: Broadest fallback
-    if initial is None:
-        m = re.search(r"initial\s+share\s+price[^$]*\$\s*([0-9,]+(?:\.[0-9]+)?)", text, flags=re.I)
-        if m:
-            initial = float(m.group(1).replace(",", ""))
+    if m_initial is None:
+        m_initial = _INITIAL_BROAD_RE.search(text)
 
-    if initial is not None:
+    initial: Optional[float] = None
+    if m_initial is not None:
+        initial = _match_float(m_initial)
         result["initial_price"] = {
             "value": initial,
             "source": "regex_generic",
             "pattern": "generic_initial",
+            "end": m_initial.end(),
         }
 
     # --- Threshold ---
     threshold_dollar: Optional[float] = None
     threshold_pct: Optional[float] = None
+    # End of the furthest match the threshold was derived from
+    threshold_end = 0
 
     # Look near threshold headings with a tight window
-    for m in re.finditer(
-        r"(interest\s+barrier|trigger\s+value|downside\s+threshold\s+level|"
-        r"threshold\s+level|barrier\s+level)",
-        text, flags=re.I,
-    ):
-        snippet = text[m.end():m.end() + 250]
+    for m in _THRESHOLD_HEADING_RE.finditer(text):
+        # Search the window in place rather than slicing it out
+        window_start, window_end = m.end(), m.end() + 250
 
-        m_d = re.search(r"\$?\s*([0-9]{2,5}\.[0-9]{2,5})", snippet)
+        m_d = _THRESHOLD_DECIMAL_RE.search(text, window_start, window_end)
         if not m_d:
-            m_d = MONEY_RE.search(snippet)
-        m_p = re.search(
-            r"([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:of\s+the\s+initial\s+(?:value|share\s+price))?",
-            snippet, flags=re.I,
-        )
+            m_d = MONEY_RE.search(text, window_start, window_end)
+        m_p = _THRESHOLD_PCT_RE.search(text, window_start, window_end)
 
         if m_d:
-            threshold_dollar = float(m_d.group(1).replace(",", ""))
+            threshold_dollar = _match_float(m_d)
+            threshold_end = m_d.end()
         if m_p:
             threshold_pct = float(m_p.group(1))
+            threshold_end = max(threshold_end, m_p.end())
 
         if threshold_dollar is not None or threshold_pct is not None:
             break
 
     # Wider fallback
     if threshold_dollar is None:
-        m = re.search(r"threshold\s+level[^$]*\$\s*([0-9,]+(?:\.[0-9]+)?)", text, flags=re.I)
+        m = _THRESHOLD_DOLLAR_WIDE_RE.search(text)
         if m:
-            threshold_dollar = float(m.group(1).replace(",", ""))
+            threshold_dollar = _match_float(m)
+            threshold_end = max(threshold_end, m.end())
     if threshold_pct is None:
-        m = re.search(r"threshold\s+level[^%]*([0-9]+(?:\.[0-9]+)?)\s*%", text, flags=re.I)
+        m = _THRESHOLD_PCT_WIDE_RE.search(text)
         if m:
             threshold_pct = float(m.group(1))
+            threshold_end = max(threshold_end, m.end())
 
     # Compute $ from % if only % found
     if threshold_dollar is None and threshold_pct is not None and initial is not None:
         threshold_dollar = round(initial * (threshold_pct / 100.0), 10)
+        threshold_end = max(threshold_end, m_initial.end())
 
     # Cross-check
     if threshold_dollar is not None and threshold_pct is not None and initial is not None:
         implied_pct = (threshold_dollar / initial) * 100.0
+        threshold_end = max(threshold_end, m_initial.end())
         if abs(implied_pct - threshold_pct) > 2.0:
             threshold_dollar = round(initial * (threshold_pct / 100.0), 10)
 
@@ -447,6 +915,7 @@ def _extract_generic_initial_and_threshold(
             "value": threshold_dollar,
             "source": "regex_generic",
             "pattern": "generic_threshold",
+            "end": threshold_end,
         }
 
     return result
@@ -466,129 +935,97 @@ def _extract_generic_autocall(
     # These are the most reliable because they describe the rule directly
     # rather than relying on a nearby dollar amount.
     if initial is not None:
-        _EQUALS_INITIAL_PATS = [
-            r"greater\s+than\s+or\s+equal\s+to\s+the\s+initial\s+"
-            r"(?:share\s+)?(?:price|value|underlier\s+value|level)",
-            r"equal\s+to\s+or\s+greater\s+than\s+the\s+initial\s+"
-            r"(?:share\s+)?(?:price|value|underlier\s+value|level)",
-            r"at\s+or\s+above\s+the\s+initial\s+"
-            r"(?:share\s+)?(?:price|value|underlier\s+value|level)",
-            r"at\s+least\s+(?:equal\s+to\s+)?the\s+initial\s+"
-            r"(?:share\s+)?(?:price|value|underlier\s+value|level)",
-        ]
-        for pat in _EQUALS_INITIAL_PATS:
-            if re.search(pat, text, flags=re.I):
+        for pat in _EQUALS_INITIAL_RES:
+            m = pat.search(text)
+            if m:
                 return {"value": float(initial), "source": "regex_generic",
-                        "pattern": "generic_autocall_equals_initial"}
+                        "pattern": "generic_autocall_equals_initial", "end": m.end()}
 
         # "100% of initial"
-        if re.search(
-            r"\b100\s*%\s*(?:of\s+the\s+initial|initial\s+(?:share\s+)?(?:price|value|underlier\s+value|level))",
-            text, flags=re.I,
-        ):
+        m = _AUTOCALL_100PCT_RE.search(text)
+        if m:
             return {"value": float(initial), "source": "regex_generic",
-                    "pattern": "generic_autocall_100pct"}
+                    "pattern": "generic_autocall_100pct", "end": m.end()}
 
     # --- Dollar/percentage based extraction from context windows ---
-    candidates = []
-
-    for m in re.finditer(
-        r"(automatic(?:ally)?\s+call(?:ed)?|autocall|early\s+redemption)",
-        text, flags=re.I,
-    ):
-        start = max(0, m.start() - 250)
-        end = min(len(text), m.end() + 250)
-        candidates.append(text[start:end])
-
-    for m in re.finditer(
-        r"(call\s+threshold\s+level|call\s+level|redemption\s+trigger|redemption\s+level)",
-        text, flags=re.I,
-    ):
-        start = max(0, m.start() - 250)
-        end = min(len(text), m.end() + 250)
-        candidates.append(text[start:end])
-
-    for s in candidates:
-        m_usd = MONEY_RE.search(s)
-        m_pct = PCT_RE.search(s)
-        if m_usd:
-            val = float(m_usd.group(1).replace(",", ""))
-            # Sanity check: autocall level should be near the initial price,
-            # not an aggregate principal amount (e.g., $27,544,000)
-            if initial is not None and val > initial * 5:
-                logger.debug(
-                    f"Rejecting autocall candidate ${val:,.2f} "
-                    f"(>5× initial ${initial:.2f})"
-                )
-                continue
-            return {"value": val,
-                    "source": "regex_generic", "pattern": "generic_autocall"}
-        if m_pct and initial is not None:
-            pct_val = float(m_pct.group(1))
-            if 50 <= pct_val <= 150:  # reasonable autocall percentage range
-                return {"value": initial * (pct_val / 100.0),
-                        "source": "regex_generic", "pattern": "generic_autocall_pct"}
+    # Windows are searched in place via pos/endpos instead of being sliced
+    # out; autocall mentions are tried before call-level mentions.
+    for anchor_re in (_AUTOCALL_KEYWORD_RE, _CALL_LEVEL_KEYWORD_RE):
+        for m in anchor_re.finditer(text):
+            start = max(0, m.start() - 250)
+            end = m.end() + 250
+            m_usd = MONEY_RE.search(text, start, end)
+            if m_usd:
+                val = _match_float(m_usd)
+                # Sanity check: autocall level should be near the initial price,
+                # not an aggregate principal amount (e.g., $27,544,000)
+                if initial is not None and val > initial * 5:
+                    logger.debug(
+                        f"Rejecting autocall candidate ${val:,.2f} "
+                        f"(>5× initial ${initial:.2f})"
+                    )
+                    continue
+                return {"value": val, "source": "regex_generic",
+                        "pattern": "generic_autocall", "end": m_usd.end()}
+            if initial is not None:
+                m_pct = PCT_RE.search(text, start, end)
+                if m_pct:
+                    pct_val = float(m_pct.group(1))
+                    if 50 <= pct_val <= 150:  # reasonable autocall percentage range
+                        return {"value": initial * (pct_val / 100.0), "source": "regex_generic",
+                                "pattern": "generic_autocall_pct", "end": m_pct.end()}
 
     return None
 
 
 def _extract_generic_coupon_rate(text: str) -> Optional[Dict[str, Any]]:
     """Generic coupon rate extraction (Tier 3)."""
-    m = re.search(r"([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:per\s*annum|p\.a\.|annual)", text, flags=re.I)
+    m = _COUPON_RATE_ANNUAL_RE.search(text)
     if m:
         return {"value": float(m.group(1)), "source": "regex_generic",
-                "pattern": "generic_coupon_rate_annual"}
+                "pattern": "generic_coupon_rate_annual", "end": m.end()}
 
-    m = re.search(
-        r"Contingent\s+Interest\s+Rate[^:]*[:]\s*([0-9]+(?:\.[0-9]+)?)\s*%\s*(?:per\s*annum)?",
-        text, flags=re.I,
-    )
+    m = _CONTINGENT_INTEREST_RATE_RE.search(text)
     if m:
         return {"value": float(m.group(1)), "source": "regex_generic",
-                "pattern": "generic_contingent_interest_rate"}
+                "pattern": "generic_contingent_interest_rate", "end": m.end()}
     return None
 
 
 def _extract_generic_coupon_payment(text: str) -> Optional[Dict[str, Any]]:
     """Generic coupon payment extraction (Tier 3)."""
-    m = re.search(
-        r"Contingent\s+(?:quarterly|monthly|semi-annual|annual)\s+coupon[^$]{0,50}\$\s*([0-9,]+(?:\.[0-9]+)?)",
-        text, flags=re.I,
-    )
+    m = _COUPON_PAYMENT_GS_RE.search(text)
     if m:
-        return {"value": float(m.group(1).replace(",", "")),
-                "source": "regex_generic", "pattern": "generic_coupon_payment_gs"}
+        return {"value": _match_float(m), "source": "regex_generic",
+                "pattern": "generic_coupon_payment_gs", "end": m.end()}
 
-    m = re.search(
-        r"Contingent\s+Interest\s+Payment[^$]{0,200}\$\s*([0-9,]+(?:\.[0-9]+)?)",
-        text, flags=re.I,
-    )
+    m = _COUPON_PAYMENT_CIP_RE.search(text)
     if m:
-        return {"value": float(m.group(1).replace(",", "")),
-                "source": "regex_generic", "pattern": "generic_coupon_payment_cip"}
+        return {"value": _match_float(m), "source": "regex_generic",
+                "pattern": "generic_coupon_payment_cip", "end": m.end()}
     return None
 
 
 def _extract_generic_notional(text: str) -> Optional[Dict[str, Any]]:
     """Generic notional extraction (Tier 3)."""
-    patterns = [
-        r"per\s+\$\s*([0-9,]+(?:\.[0-9]+)?)\s+(?:stated\s+)?principal\s+amount",
-        r"(?:stated\s+)?principal\s+amount\s+of\s+\$\s*([0-9,]+(?:\.[0-9]+)?)",
-        r"each\s+(?:security|note)\s+has\s+a\s+(?:stated\s+)?principal\s+amount\s+of\s+\$\s*([0-9,]+(?:\.[0-9]+)?)",
-        r"principal\s+amount\s+per\s+(?:security|note)[:\s]+\$\s*([0-9,]+(?:\.[0-9]+)?)",
-    ]
-    for pat in patterns:
-        m = re.search(pat, text, flags=re.I)
+    for pat in _GENERIC_NOTIONAL_RES:
+        m = pat.search(text)
         if m:
-            return {"value": float(m.group(1).replace(",", "")),
-                    "source": "regex_generic", "pattern": pat}
+            return {"value": _match_float(m), "source": "regex_generic",
+                    "pattern": pat.pattern, "end": m.end()}
     return None
 
 
 # ---------------------------------------------------------------------------
 # ParsedFiling dataclass
 # ---------------------------------------------------------------------------
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ParsedFiling:
     """Result of parsing an EDGAR filing through the 3-tier pipeline."""
 
@@ -633,25 +1070,147 @@ class ParsedFiling:
         }
 
 
+def _pick(
+    sources: Dict[str, str], field: str, candidates: Iterable[Tuple[str, Any]]
+) -> Optional[float]:
+    """
+    Select the first available value across tiers and record its source.
+
+    Args:
+        sources: Field-to-source mapping to update
+        field: Field name to record the source under
+        candidates: (source name, value) pairs in priority order; a value
+            is a plain number, an extraction dict with "value" (and
+            optionally "source"), or None when that tier found nothing
+
+    Returns:
+        The selected value, or None if no tier found one
+    """
+    for name, found in candidates:
+        if found is None:
+            continue
+        if isinstance(found, dict):
+            sources[field] = found.get("source", name)
+            return found["value"]
+        sources[field] = name
+        return found
+    return None
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
+# Parsed filings keyed by (content digest, is_html, issuer), oldest first
+_PARSE_CACHE_SIZE = 256
+_parse_cache: "OrderedDict[Tuple[bytes, bool, str], ParsedFiling]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached parse_filing and detect_issuer results."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+    with _detect_cache_lock:
+        _detect_cache.clear()
+
+
 def parse_filing(
     content: str,
     is_html: bool,
     issuer: str = "Auto-detect",
+    use_cache: bool = True,
 ) -> ParsedFiling:
     """
     Parse an EDGAR filing through a 3-tier extraction pipeline.
 
+    Results are cached in memory by a digest of *content*, so re-parsing
+    the same filing skips the pipeline.
+
     Args:
         content: Raw file content (HTML or plain text)
         is_html: Whether *content* is HTML
         issuer: Issuer name, or "Auto-detect"
+        use_cache: Whether to use the in-memory result cache (default: True)
 
     Returns:
         ParsedFiling with all extracted fields and metadata
     """
+    if not use_cache:
+        return _parse_filing_uncached(content, is_html, issuer)
+
+    raw = content.encode("utf-8", "surrogatepass") if isinstance(content, str) else content
+    key = (hashlib.blake2b(raw, digest_size=16).digest(), is_html, issuer)
+
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key)
+        if cached is not None:
+            _parse_cache.move_to_end(key)
+    if cached is not None:
+        logger.debug("Using cached parse for filing %s", key[0].hex())
+        # Callers may mutate the result; never hand out the cached object
+        return copy.deepcopy(cached)
+
+    filing = _parse_filing_uncached(content, is_html, issuer)
+
+    with _parse_cache_lock:
+        _parse_cache[key] = copy.deepcopy(filing)
+        while len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+    return filing
+
+
+def _init_parse_worker() -> None:
+    """Build the lazily compiled prefilters once per worker, before its first filing."""
+    if HYPERSCAN_AVAILABLE:
+        _get_prefilter_db()
+    if AHOCORASICK_AVAILABLE:
+        _get_literal_automaton()
+
+
+def _parse_filing_worker(args: Tuple[str, bool, str]) -> ParsedFiling:
+    """Process-pool entry point for parse_filings_batch."""
+    content, is_html, issuer = args
+    # Worker caches die with the pool, so skip the digest and copies
+    return _parse_filing_uncached(content, is_html, issuer)
+
+
+def parse_filings_batch(
+    filings: List[Tuple[str, bool, str]],
+    max_workers: Optional[int] = None,
+    chunksize: int = 8,
+) -> List[ParsedFiling]:
+    """
+    Parse many filings in parallel worker processes.
+
+    Parsing is CPU-bound pure-Python/regex work that holds the GIL, so
+    filings are spread across spawned worker processes (see
+    workers.process_pool).  Results are returned in input order; small
+    batches are parsed in-process.
+
+    Args:
+        filings: (content, is_html, issuer) tuples, as for parse_filing
+        max_workers: Worker processes (default: os.cpu_count())
+        chunksize: Filings sent to a worker per task (default: 8)
+
+    Returns:
+        List of ParsedFiling, one per input filing
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(filings))
+    if workers <= 1:
+        return [parse_filing(*args) for args in filings]
+
+    logger.info("Parsing %s filings in %s processes", len(filings), workers)
+    with process_pool(workers, initializer=_init_parse_worker) as executor:
+        return list(executor.map(_parse_filing_worker, filings, chunksize=chunksize))
+
+
+def _parse_filing_uncached(
+    content: str,
+    is_html: bool,
+    issuer: str,
+) -> ParsedFiling:
+    """Run the 3-tier pipeline for parse_filing (no caching)."""
     filing = ParsedFiling()
     sources: Dict[str, str] = {}
 
@@ -701,71 +1260,93 @@ def parse_filing(
     # ===================================================================
     # Tier 2: Issuer-specific regex (medium confidence)
     # ===================================================================
+    # Fields Tier 1 already settled need no regex scan in later tiers
+    t1_values = {
+        "initial_price": t1_initial,
+        "threshold_dollar": t1_threshold,
+        "autocall_level": t1_autocall,
+        "coupon_payment": t1_coupon_payment,
+        "coupon_rate_pct": t1_coupon_rate,
+        "notional": t1_notional,
+    }
+    needed = {name for name, value in t1_values.items() if value is None}
+
     t2: Dict[str, Dict[str, Any]] = {}
-    if issuer in ISSUER_CONFIGS:
-        config = ISSUER_CONFIGS[issuer]
-        # First pass without initial to get initial_price
-        t2 = _extract_with_issuer_regex(text, config, None)
-        # Re-run with initial for autocall derivation
-        init_for_t2 = (
-            t1_initial
-            or (t2.get("initial_price", {}).get("value"))
-        )
-        if init_for_t2:
-            t2 = _extract_with_issuer_regex(text, config, init_for_t2)
+    if issuer in ISSUER_CONFIGS and needed:
+        config = ISSUER_CONFIGS_COMPILED[issuer]
+        # Single pass: an issuer-regex initial price takes precedence and
+        # the table initial is the fallback for autocall derivation
+        t2 = _extract_with_issuer_regex(text, config, t1_initial, needed)
 
     # ===================================================================
     # Tier 3: Generic regex (lowest confidence)
     # ===================================================================
-    t3_init_thresh = _extract_generic_initial_and_threshold(text)
+    # Only fields neither Tier 1 nor Tier 2 supplied can come from Tier 3
+    unresolved = needed - t2.keys()
+
+    t3_text = _tier3_window(text)
+    t3_init_thresh: Dict[str, Dict[str, Any]] = {}
+    if unresolved & {"initial_price", "threshold_dollar"}:
+        t3_init_thresh = _extract_generic_initial_and_threshold(t3_text)
+        if t3_text is not text:
+            kept = {
+                name: found for name, found in t3_init_thresh.items()
+                if _within_window(found, t3_text)
+            }
+            if len(kept) < 2:
+                # Fill whichever of initial/threshold the window missed
+                t3_init_thresh = {
+                    **_extract_generic_initial_and_threshold(text), **kept
+                }
     # Determine best initial for generic autocall
     init_for_t3 = (
         t1_initial
         or t2.get("initial_price", {}).get("value")
         or t3_init_thresh.get("initial_price", {}).get("value")
     )
-    t3_autocall = _extract_generic_autocall(text, init_for_t3)
-    t3_coupon_rate = _extract_generic_coupon_rate(text)
-    t3_coupon_payment = _extract_generic_coupon_payment(text)
-    t3_notional = _extract_generic_notional(text)
+
+    def _tier3(field_name: str, extract, *args) -> Optional[Dict[str, Any]]:
+        """Run a Tier 3 extractor on the window, falling back to the full text."""
+        if field_name not in unresolved:
+            return None
+        found = extract(t3_text, *args)
+        if t3_text is not text and not _within_window(found, t3_text):
+            found = extract(text, *args)
+        return found
+
+    t3_autocall = _tier3("autocall_level", _extract_generic_autocall, init_for_t3)
+    t3_coupon_rate = _tier3("coupon_rate_pct", _extract_generic_coupon_rate)
+    t3_coupon_payment = _tier3("coupon_payment", _extract_generic_coupon_payment)
+    t3_notional = _tier3("notional", _extract_generic_notional)
 
     # ===================================================================
     # Merge: prefer Tier 1 > Tier 2 > Tier 3
     # ===================================================================
-    def _pick(field: str, t1_val, t2_key: str, t3_val) -> Optional[float]:
-        """Select best value across tiers and record source."""
-        if t1_val is not None:
-            sources[field] = "table"
-            return t1_val
-        if t2_key in t2:
-            sources[field] = "regex_issuer"
-            return t2[t2_key]["value"]
-        if t3_val is not None:
-            if isinstance(t3_val, dict):
-                sources[field] = t3_val.get("source", "regex_generic")
-                return t3_val["value"]
-            sources[field] = "regex_generic"
-            return t3_val
-        return None
-
-    filing.initial_price = _pick(
-        "initial_price", t1_initial, "initial_price",
-        t3_init_thresh.get("initial_price"),
-    )
-    filing.threshold_dollar = _pick(
-        "threshold_dollar", t1_threshold, "threshold_dollar",
-        t3_init_thresh.get("threshold_dollar"),
-    )
-    filing.autocall_level = _pick(
-        "autocall_level", t1_autocall, "autocall_level", t3_autocall,
-    )
-    filing.coupon_payment_per_period = _pick(
-        "coupon_payment_per_period", t1_coupon_payment, "coupon_payment",
-        t3_coupon_payment,
-    )
-    filing.notional = _pick(
-        "notional", t1_notional, "notional", t3_notional,
-    )
+    filing.initial_price = _pick(sources, "initial_price", (
+        ("table", t1_initial),
+        ("regex_issuer", t2.get("initial_price")),
+        ("regex_generic", t3_init_thresh.get("initial_price")),
+    ))
+    filing.threshold_dollar = _pick(sources, "threshold_dollar", (
+        ("table", t1_threshold),
+        ("regex_issuer", t2.get("threshold_dollar")),
+        ("regex_generic", t3_init_thresh.get("threshold_dollar")),
+    ))
+    filing.autocall_level = _pick(sources, "autocall_level", (
+        ("table", t1_autocall),
+        ("regex_issuer", t2.get("autocall_level")),
+        ("regex_generic", t3_autocall),
+    ))
+    filing.coupon_payment_per_period = _pick(sources, "coupon_payment_per_period", (
+        ("table", t1_coupon_payment),
+        ("regex_issuer", t2.get("coupon_payment")),
+        ("regex_generic", t3_coupon_payment),
+    ))
+    filing.notional = _pick(sources, "notional", (
+        ("table", t1_notional),
+        ("regex_issuer", t2.get("notional")),
+        ("regex_generic", t3_notional),
+    ))
 
     # Coupon rate: could be from table %, issuer regex, or generic
     if t1_coupon_rate is not None:
@@ -818,7 +1399,7 @@ def parse_filing(
     # ===================================================================
     try:
         from .terms import extract_product_terms, extract_basket_information, calculate_payoff_type
-        terms = extract_product_terms(content, is_html=is_html)
+        terms = extract_product_terms(content, is_html=is_html, text=text)
         filing.product_terms = terms
 
         basket_info = extract_basket_information(text)
@@ -4,12 +4,132 @@ Security identifier extraction and validation.
 Extracts CUSIP, ISIN, and other security identifiers from filings.
 """
 
+import functools
 import logging
 import re
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Try to import numba (optional dependency)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+    logger.debug("numba available - JIT batch CUSIP validation enabled")
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("numba not available - using NumPy batch CUSIP validation")
+
+# Labeled identifier patterns, tried in order; identifiers are often
+# labeled as "CUSIP:", "CUSIP No:", etc.  Every pattern starts with its
+# keyword, so patterns are only tried at the keyword's occurrences.
+_CUSIP_KEYWORD_RE = re.compile(r'CUSIP', re.IGNORECASE)
+_CUSIP_PATTERNS = [
+    re.compile(r'CUSIP\s*(?:No\.?|Number)?:?\s*([A-Z0-9]{9})\b', re.IGNORECASE),
+    re.compile(r'CUSIP\s+([A-Z0-9]{9})\b', re.IGNORECASE),
+    re.compile(r'\bCUSIP:\s*([A-Z0-9]{9})\b', re.IGNORECASE),
+]
+# Any 9-character alphanumeric sequence near "CUSIP"
+_CUSIP_CONTEXT_RE = re.compile(r'CUSIP.{0,50}?([A-Z0-9]{9})\b', re.IGNORECASE)
+
+# ISIN: 2 letters + 10 alphanumeric
+_ISIN_KEYWORD_RE = re.compile(r'ISIN', re.IGNORECASE)
+_ISIN_PATTERNS = [
+    re.compile(r'ISIN\s*(?:No\.?|Number)?:?\s*([A-Z]{2}[A-Z0-9]{10})\b', re.IGNORECASE),
+    re.compile(r'ISIN\s+([A-Z]{2}[A-Z0-9]{10})\b', re.IGNORECASE),
+    re.compile(r'\bISIN:\s*([A-Z]{2}[A-Z0-9]{10})\b', re.IGNORECASE),
+]
+_ISIN_CONTEXT_RE = re.compile(r'ISIN.{0,50}?([A-Z]{2}[A-Z0-9]{10})\b', re.IGNORECASE)
+
+_SEDOL_KEYWORD_RE = re.compile(r'SEDOL', re.IGNORECASE)
+_SEDOL_PATTERNS = [
+    re.compile(r'SEDOL\s*(?:No\.?|Number)?:?\s*([A-Z0-9]{7})\b', re.IGNORECASE),
+    re.compile(r'SEDOL\s+([A-Z0-9]{7})\b', re.IGNORECASE),
+]
+
+
+def _lowered(text: str):
+    """Lazily lower-cased view of *text* for keyword lookup, or None if inexact."""
+    from .parser import _LoweredText, _lower_matches_ignorecase
+
+    return _LoweredText(text) if _lower_matches_ignorecase(text) else None
+
+
+def _keyword_starts(text: str, lowered, keyword_re) -> Iterator[int]:
+    """Offsets of every case-insensitive occurrence of a keyword in *text*."""
+    if lowered is None:
+        return (match.start() for match in keyword_re.finditer(text))
+    return lowered.find_all(keyword_re.pattern.lower())
+
+
+def _search_from_keywords(pattern, text: str, lowered, keyword_re):
+    """
+    pattern.search(text) for a pattern that begins with its keyword.
+
+    Every match of such a pattern starts at a keyword occurrence, so
+    anchoring it at each occurrence in turn finds the same first match
+    without scanning the text in between, and a match near the start
+    never lower-cases the rest of the text.
+    """
+    for start in _keyword_starts(text, lowered, keyword_re):
+        match = pattern.match(text, start)
+        if match:
+            return match
+    return None
+
+
+class _CharTable(dict):
+    """Per-character lookup table that fills itself in on first use of a character."""
+
+    def __init__(self, compute):
+        super().__init__()
+        self._compute = compute
+
+    def __missing__(self, char: str):
+        value = self[char] = self._compute(char)
+        return value
+
+
+def _char_value(char: str) -> int:
+    """Checksum value of an identifier character (A=10, B=11, ..., Z=35)."""
+    return int(char) if char.isdigit() else ord(char) - ord('A') + 10
+
+
+def _digit_sum(value: int) -> int:
+    return value // 10 + value % 10
+
+
+def _luhn_double(digit: str) -> int:
+    n = int(digit) * 2
+    return n - 9 if n > 9 else n
+
+
+# Lookup tables for the check digit loops; characters are filled in as
+# they are seen, so unusual input is handled exactly as the arithmetic
+# would (including raising for characters int() rejects)
+_CUSIP_ODD = _CharTable(lambda char: _digit_sum(_char_value(char)))
+_CUSIP_EVEN = _CharTable(lambda char: _digit_sum(2 * _char_value(char)))
+# str.translate table (keyed by code point) spelling ISIN characters as digits
+_ISIN_NUMERIC = _CharTable(
+    lambda code: chr(code) if chr(code).isdigit() else str(_char_value(chr(code)))
+)
+_LUHN_SINGLE = _CharTable(int)
+_LUHN_DOUBLE = _CharTable(_luhn_double)
+
+
+def _isin_check_digit(base: str) -> int:
+    """Luhn check digit for an ISIN without its last character."""
+    # Spell letters as numbers (A=10, B=11, ..., Z=35), then double every
+    # second digit from the right
+    digits = base.translate(_ISIN_NUMERIC)[::-1]
+    total = (
+        sum(map(_LUHN_DOUBLE.__getitem__, digits[0::2]))
+        + sum(map(_LUHN_SINGLE.__getitem__, digits[1::2]))
+    )
+    return (10 - (total % 10)) % 10
+
 
 def extract_cusip(text: str) -> Optional[str]:
     """
@@ -26,16 +146,16 @@ def extract_cusip(text: str) -> Optional[str]:
     Returns:
         CUSIP string or None if not found
     """
-    # CUSIP pattern: 9 alphanumeric characters
-    # Often labeled as "CUSIP:", "CUSIP No:", etc.
-    patterns = [
-        r'CUSIP\s*(?:No\.?|Number)?:?\s*([A-Z0-9]{9})\b',
-        r'CUSIP\s+([A-Z0-9]{9})\b',
-        r'\bCUSIP:\s*([A-Z0-9]{9})\b',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    return _extract_cusip(text, _lowered(text))
+
+
+def _extract_cusip(text: str, lowered) -> Optional[str]:
+    """extract_cusip given the _lowered view of *text*."""
+    if next(_keyword_starts(text, lowered, _CUSIP_KEYWORD_RE), None) is None:
+        return None
+
+    for pattern in _CUSIP_PATTERNS:
+        match = _search_from_keywords(pattern, text, lowered, _CUSIP_KEYWORD_RE)
         if match:
             cusip = match.group(1).upper()
             if validate_cusip(cusip):
@@ -43,10 +163,8 @@ def extract_cusip(text: str) -> Optional[str]:
                 return cusip
 
     # Try finding any 9-character alphanumeric sequence near "CUSIP"
-    cusip_context = re.search(
-        r'CUSIP.{0,50}?([A-Z0-9]{9})\b',
-        text,
-        re.IGNORECASE
+    cusip_context = _search_from_keywords(
+        _CUSIP_CONTEXT_RE, text, lowered, _CUSIP_KEYWORD_RE
     )
     if cusip_context:
         cusip = cusip_context.group(1).upper()
@@ -57,6 +175,7 @@ def extract_cusip(text: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_cusip(cusip: str) -> bool:
     """
     Validate CUSIP format and check digit.
@@ -75,22 +194,12 @@ def validate_cusip(cusip: str) -> bool:
 
     # Check digit validation (Luhn algorithm with modifications)
     try:
-        # Convert letters to numbers (A=10, B=11, ..., Z=35)
-        values = []
-        for char in cusip[:-1]:  # Exclude check digit
-            if char.isdigit():
-                values.append(int(char))
-            else:
-                # A=10, B=11, etc.
-                values.append(ord(char) - ord('A') + 10)
-
-        # Double every second digit
-        total = 0
-        for i, val in enumerate(values):
-            if i % 2 == 1:
-                val *= 2
-            # Add digits of the value
-            total += val // 10 + val % 10
+        # Sum the digits of each character value, doubling every second
+        # one (A=10, B=11, ..., Z=35); the check digit is excluded
+        total = (
+            sum(map(_CUSIP_ODD.__getitem__, cusip[0:8:2]))
+            + sum(map(_CUSIP_EVEN.__getitem__, cusip[1:8:2]))
+        )
 
         # Check digit should make total divisible by 10
         check_digit = (10 - (total % 10)) % 10
@@ -101,6 +210,71 @@ def validate_cusip(cusip: str) -> bool:
         return False
 
 
+# Serial on purpose: numba's parallel threading layer is not fork-safe
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _cusip_flags_numba(codes):
+        """validate_cusip's check digit test for each row of ASCII codes."""
+        flags = np.empty(codes.shape[0], dtype=np.bool_)
+        for i in range(codes.shape[0]):
+            total = 0
+            for j in range(8):
+                code = np.int64(codes[i, j])
+                # Character value: 0-9 for digits, A=10, B=11, ..., Z=35
+                value = code - 48 if code <= 57 else code - 55
+                if j % 2 == 1:
+                    value *= 2
+                total += value // 10 + value % 10
+            flags[i] = codes[i, 8] == 48 + (10 - total % 10) % 10
+        return flags
+
+
+def _cusip_flags_numpy(codes: np.ndarray) -> np.ndarray:
+    """Vectorized fallback for _cusip_flags_numba."""
+    codes = codes.astype(np.int64)
+    values = np.where(codes[:, :8] <= 57, codes[:, :8] - 48, codes[:, :8] - 55)
+    values[:, 1::2] *= 2
+    total = (values // 10 + values % 10).sum(axis=1)
+    return codes[:, 8] == 48 + (10 - total % 10) % 10
+
+
+def validate_cusips(cusips: Sequence[str]) -> np.ndarray:
+    """
+    Validate many CUSIPs at once.
+
+    Bulk counterpart of validate_cusip for large identifier lists (e.g.
+    cross-filing deduplication). Check digits of ASCII CUSIPs are tested
+    with a numba kernel when numba is installed, otherwise NumPy; any
+    other 9-character alphanumeric strings go through validate_cusip.
+
+    Args:
+        cusips: CUSIP strings to validate
+
+    Returns:
+        Boolean array, True where the CUSIP is valid
+    """
+    flags = np.zeros(len(cusips), dtype=bool)
+    rows = []
+    for i, cusip in enumerate(cusips):
+        if len(cusip) != 9 or not cusip.isalnum():
+            continue
+        if cusip.isascii():
+            rows.append(i)
+        else:
+            flags[i] = validate_cusip(cusip)
+    if not rows:
+        return flags
+
+    codes = np.frombuffer(
+        "".join([cusips[i] for i in rows]).encode("ascii"), dtype=np.uint8
+    ).reshape(-1, 9)
+    if NUMBA_AVAILABLE:
+        flags[rows] = _cusip_flags_numba(codes)
+    else:
+        flags[rows] = _cusip_flags_numpy(codes)
+    return flags
+
+
 def extract_isin(text: str) -> Optional[str]:
     """
     Extract ISIN from text.
@@ -116,15 +290,16 @@ def extract_isin(text: str) -> Optional[str]:
     Returns:
         ISIN string or None if not found
     """
-    # ISIN pattern: 2 letters + 10 alphanumeric
-    patterns = [
-        r'ISIN\s*(?:No\.?|Number)?:?\s*([A-Z]{2}[A-Z0-9]{10})\b',
-        r'ISIN\s+([A-Z]{2}[A-Z0-9]{10})\b',
-        r'\bISIN:\s*([A-Z]{2}[A-Z0-9]{10})\b',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    return _extract_isin(text, _lowered(text))
+
+
+def _extract_isin(text: str, lowered) -> Optional[str]:
+    """extract_isin given the _lowered view of *text*."""
+    if next(_keyword_starts(text, lowered, _ISIN_KEYWORD_RE), None) is None:
+        return None
+
+    for pattern in _ISIN_PATTERNS:
+        match = _search_from_keywords(pattern, text, lowered, _ISIN_KEYWORD_RE)
         if match:
             isin = match.group(1).upper()
             if validate_isin(isin):
@@ -132,10 +307,8 @@ def extract_isin(text: str) -> Optional[str]:
                 return isin
 
     # Try finding any valid ISIN near "ISIN" keyword
-    isin_context = re.search(
-        r'ISIN.{0,50}?([A-Z]{2}[A-Z0-9]{10})\b',
-        text,
-        re.IGNORECASE
+    isin_context = _search_from_keywords(
+        _ISIN_CONTEXT_RE, text, lowered, _ISIN_KEYWORD_RE
     )
     if isin_context:
         isin = isin_context.group(1).upper()
@@ -146,6 +319,7 @@ def extract_isin(text: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_isin(isin: str) -> bool:
     """
     Validate ISIN format and check digit.
@@ -169,33 +343,42 @@ def validate_isin(isin: str) -> bool:
 
     # Validate check digit (Luhn algorithm)
     try:
-        # Convert to numeric string (A=10, B=11, ..., Z=35)
-        numeric = ""
-        for char in isin[:-1]:  # Exclude check digit
-            if char.isdigit():
-                numeric += char
-            else:
-                numeric += str(ord(char) - ord('A') + 10)
-
-        # Apply Luhn algorithm
-        total = 0
-        for i, digit in enumerate(reversed(numeric)):
-            n = int(digit)
-            if i % 2 == 0:
-                n *= 2
-                if n > 9:
-                    n -= 9
-            total += n
-
-        # Check digit should make total divisible by 10
-        check_digit = (10 - (total % 10)) % 10
-        return str(check_digit) == isin[-1]
-
+        # Check digit should make the Luhn total divisible by 10
+        return str(_isin_check_digit(isin[:-1])) == isin[-1]
     except Exception as e:
         logger.debug(f"ISIN validation error: {e}")
         return False
 
 
+# SEDOL check digit weights for the first six characters
+_SEDOL_WEIGHTS = (1, 3, 1, 7, 3, 9)
+
+
+def validate_sedol(sedol: str) -> bool:
+    """
+    Validate SEDOL format and check digit.
+
+    Args:
+        sedol: SEDOL string to validate
+
+    Returns:
+        True if valid SEDOL
+    """
+    if len(sedol) != 7 or not sedol.isascii() or not sedol.isalnum():
+        return False
+
+    sedol = sedol.upper()
+
+    # Vowels are never used in SEDOLs, and the check digit is a digit
+    if any(char in "AEIOU" for char in sedol) or not sedol[-1].isdigit():
+        return False
+
+    total = sum(
+        weight * _char_value(char) for weight, char in zip(_SEDOL_WEIGHTS, sedol)
+    )
+    return (10 - total % 10) % 10 == int(sedol[-1])
+
+
 def extract_sedol(text: str) -> Optional[str]:
     """
     Extract SEDOL from text.
@@ -208,13 +391,16 @@ def extract_sedol(text: str) -> Optional[str]:
     Returns:
         SEDOL string or None if not found
     """
-    patterns = [
-        r'SEDOL\s*(?:No\.?|Number)?:?\s*([A-Z0-9]{7})\b',
-        r'SEDOL\s+([A-Z0-9]{7})\b',
-    ]
+    return _extract_sedol(text, _lowered(text))
+
 
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+def _extract_sedol(text: str, lowered) -> Optional[str]:
+    """extract_sedol given the _lowered view of *text*."""
+    if next(_keyword_starts(text, lowered, _SEDOL_KEYWORD_RE), None) is None:
+        return None
+
+    for pattern in _SEDOL_PATTERNS:
+        match = _search_from_keywords(pattern, text, lowered, _SEDOL_KEYWORD_RE)
         if match:
             sedol = match.group(1).upper()
             logger.debug(f"Found SEDOL: {sedol}")
@@ -223,13 +409,17 @@ def extract_sedol(text: str) -> Optional[str]:
     return None
 
 
-def extract_all_identifiers(content: str, is_html: bool = False) -> Dict[str, Optional[str]]:
+def extract_all_identifiers(
+    content: str, is_html: bool = False, text: Optional[str] = None
+) -> Dict[str, Optional[str]]:
     """
     Extract all security identifiers from content.
 
     Args:
         content: Filing content (HTML or plain text)
         is_html: Whether content is HTML format
+        text: Optional plain text already extracted from *content*; when
+            given, *content* is not converted again
 
     Returns:
         Dictionary with extracted identifiers
@@ -238,21 +428,21 @@ def extract_all_identifiers(content: str, is_html: bool = False) -> Dict[str, Op
 
     logger.info("Extracting security identifiers")
 
-    if is_html:
-        text = extract_text_from_html(content)
-    else:
-        text = content
+    if text is None:
+        text = extract_text_from_html(content) if is_html else content
 
     identifiers = {}
+    # Shared by the extractors, so no part of the text is lower-cased twice
+    lowered = _lowered(text)
 
     # Extract CUSIP
-    cusip = extract_cusip(text)
+    cusip = _extract_cusip(text, lowered)
     if cusip:
         identifiers["cusip"] = cusip
         logger.info(f"Found CUSIP: {cusip}")
 
     # Extract ISIN
-    isin = extract_isin(text)
+    isin = _extract_isin(text, lowered)
     if isin:
         identifiers["isin"] = isin
         logger.info(f"Found ISIN: {isin}")
@@ -263,7 +453,7 @@ def extract_all_identifiers(content: str, is_html: bool = False) -> Dict[str, Op
             identifiers["country_code"] = country_code
 
     # Extract SEDOL
-    sedol = extract_sedol(text)
+    sedol = _extract_sedol(text, lowered)
     if sedol:
         identifiers["sedol"] = sedol
         logger.info(f"Found SEDOL: {sedol}")
@@ -274,6 +464,7 @@ def extract_all_identifiers(content: str, is_html: bool = False) -> Dict[str, Op
     return identifiers
 
 
+@functools.lru_cache(maxsize=4096)
 def cusip_to_isin(cusip: str, country_code: str = "US") -> Optional[str]:
     """
     Convert CUSIP to ISIN.
@@ -292,31 +483,22 @@ def cusip_to_isin(cusip: str, country_code: str = "US") -> Optional[str]:
     # ISIN = Country Code + CUSIP + Check Digit
     base = country_code.upper() + cusip
 
-    # Calculate check digit
-    numeric = ""
-    for char in base:
-        if char.isdigit():
-            numeric += char
-        else:
-            numeric += str(ord(char) - ord('A') + 10)
-
-    # Luhn algorithm
-    total = 0
-    for i, digit in enumerate(reversed(numeric)):
-        n = int(digit)
-        if i % 2 == 0:
-            n *= 2
-            if n > 9:
-                n -= 9
-        total += n
-
-    check_digit = (10 - (total % 10)) % 10
-    isin = base + str(check_digit)
+    isin = base + str(_isin_check_digit(base))
 
     logger.debug(f"Converted CUSIP {cusip} to ISIN {isin}")
     return isin
 
 
+# Display formatters keyed by (identifier type, length); identifiers of
+# any other type or length are shown as-is
+_FORMATTERS = {
+    # Format: XXX XXX XXX
+    ("cusip", 9): lambda s: f"{s[:3]} {s[3:6]} {s[6:]}",
+    # Format: XX XXXX XXXX XX
+    ("isin", 12): lambda s: f"{s[:2]} {s[2:6]} {s[6:10]} {s[10:]}",
+}
+
+
 def format_identifier(identifier: str, identifier_type: str) -> str:
     """
     Format identifier for display.
@@ -330,14 +512,37 @@ def format_identifier(identifier: str, identifier_type: str) -> str:
     """
     identifier = identifier.upper().strip()
 
-    if identifier_type.lower() == "cusip":
-        # Format: XXX XXX XXX
-        if len(identifier) == 9:
-            return f"{identifier[:3]} {identifier[3:6]} {identifier[6:]}"
+    formatter = _FORMATTERS.get((identifier_type.lower(), len(identifier)))
+    return formatter(identifier) if formatter else identifier
 
-    elif identifier_type.lower() == "isin":
-        # Format: XX XXXX XXXX XX
-        if len(identifier) == 12:
-            return f"{identifier[:2]} {identifier[2:6]} {identifier[6:10]} {identifier[10:]}"
 
-    return identifier
+def format_cusip(cusip: str) -> str:
+    """
+    Format a CUSIP as issuer-issue-check (e.g. 037833-10-0).
+
+    Args:
+        cusip: 9-character CUSIP
+
+    Returns:
+        Formatted CUSIP, or the input unchanged if it is not a valid CUSIP
+    """
+    if not validate_cusip(cusip):
+        return cusip
+    cusip = cusip.upper()
+    return f"{cusip[:6]}-{cusip[6:8]}-{cusip[8]}"
+
+
+def format_isin(isin: str) -> str:
+    """
+    Format an ISIN as country code and national identifier (e.g. US 0378331005).
+
+    Args:
+        isin: 12-character ISIN
+
+    Returns:
+        Formatted ISIN, or the input unchanged if it is not a valid ISIN
+    """
+    if not validate_isin(isin.upper()):
+        return isin
+    isin = isin.upper()
+    return f"{isin[:2]} {isin[2:]}"
@@ -4,13 +4,23 @@ Parser module for extracting symbols and dates from structured product filings.
 
 import logging
 import re
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Optional, Tuple
 from datetime import datetime
 from bs4 import BeautifulSoup
+from lxml import etree
 from dateutil import parser as date_parser
 
 logger = logging.getLogger(__name__)
 
+# Try to import pyahocorasick (optional dependency)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+    logger.debug("pyahocorasick available - one-pass index name matching enabled")
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.debug("pyahocorasick not available - index names checked one by one")
+
 
 # Common index names and their Yahoo Finance symbols
 INDEX_MAPPING = {
@@ -86,6 +96,96 @@ INDEX_MAPPING = {
     "RUSSIA MOEX": "IMOEX.ME",
 }
 
+# (upper-cased name, name, Yahoo symbol) for each INDEX_MAPPING entry
+_INDEX_ENTRIES = [
+    (index_name.upper(), index_name, yahoo_symbol)
+    for index_name, yahoo_symbol in INDEX_MAPPING.items()
+]
+
+
+def _build_index_automaton():
+    """Aho-Corasick automaton over every upper-cased index name."""
+    automaton = ahocorasick.Automaton()
+    for upper_name, index_name, yahoo_symbol in _INDEX_ENTRIES:
+        automaton.add_word(upper_name, (len(upper_name), index_name, yahoo_symbol))
+    automaton.make_automaton()
+    return automaton
+
+
+_INDEX_AUTOMATON = _build_index_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+# Index names are matched against upper-cased chunks of this many
+# characters, extended by enough of the following text that a name
+# starting in one chunk is seen whole, plus one character to check the
+# name ends on a word boundary
+_INDEX_CHUNK_CHARS = 1 << 16
+_INDEX_CHUNK_OVERLAP = max(len(upper_name) for upper_name, _, _ in _INDEX_ENTRIES)
+
+
+def _iter_upper_chunks(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    Upper-cased consecutive chunks of *text*, each with its lookahead.
+
+    Yields (chunk, lookahead) pairs. The chunks concatenate to
+    text.upper() (upper-casing is per character), without ever holding a
+    full upper-cased copy of the text.
+    """
+    for start in range(0, len(text), _INDEX_CHUNK_CHARS):
+        end = start + _INDEX_CHUNK_CHARS
+        yield text[start:end].upper(), text[end:end + _INDEX_CHUNK_OVERLAP].upper()
+
+
+def _iter_index_matches(window: str, limit: int) -> Iterator[Tuple[int, int, str, str]]:
+    """(start, length, index name, Yahoo symbol) of names starting before *limit*."""
+    if _INDEX_AUTOMATON is not None:
+        # One pass over the window reports every occurrence of every name
+        for end, (length, index_name, yahoo_symbol) in _INDEX_AUTOMATON.iter(window):
+            start = end - length + 1
+            if start < limit:
+                yield start, length, index_name, yahoo_symbol
+        return
+    for upper_name, index_name, yahoo_symbol in _INDEX_ENTRIES:
+        start = window.find(upper_name, 0, limit + len(upper_name) - 1)
+        while start != -1:
+            yield start, len(upper_name), index_name, yahoo_symbol
+            start = window.find(upper_name, start + 1, limit + len(upper_name) - 1)
+
+
+def _find_indices(text: str) -> Iterator[Tuple[str, str]]:
+    """
+    (index name, Yahoo symbol) for each INDEX_MAPPING name in *text*, ignoring case.
+
+    Names only count as whole words, so "DOW" is not found in "DOWNSIDE",
+    and where names overlap only the leftmost, longest one counts, so
+    "NASDAQ-100" does not also report "NASDAQ".
+    """
+    seen: Set[str] = set()
+    # Offset of the current chunk in text.upper(), the end of the last
+    # accepted name there, and the character before the chunk
+    offset = covered = 0
+    previous = ""
+    for chunk, lookahead in _iter_upper_chunks(text):
+        window = chunk + lookahead
+        for start, length, index_name, yahoo_symbol in sorted(
+            _iter_index_matches(window, len(chunk)), key=lambda match: (match[0], -match[1])
+        ):
+            end = start + length
+            before = window[start - 1] if start else previous
+            if (
+                offset + start < covered
+                or before.isalnum()
+                or (end < len(window) and window[end].isalnum())
+            ):
+                continue
+            covered = offset + end
+            if index_name not in seen:
+                seen.add(index_name)
+                yield index_name, yahoo_symbol
+        offset += len(chunk)
+        previous = chunk[-1:]
+
+
 # Date-related keywords
 DATE_KEYWORDS = [
     "pricing date",
@@ -99,24 +199,283 @@ DATE_KEYWORDS = [
     "observation date",
 ]
 
+# "<keyword>" followed by the next 100 characters (up to a period), with
+# the result key for each keyword
+_DATE_KEYWORD_PATTERNS = [
+    (
+        keyword,
+        keyword.lower().replace(" ", "_"),
+        re.compile(re.escape(keyword) + r'[:\s,]*([^\.]{0,100})', re.IGNORECASE),
+    )
+    for keyword in DATE_KEYWORDS
+]
+
+# Characters for which str.lower() disagrees with re.IGNORECASE on ASCII
+# keywords: "İ" lower-cases to two characters, and "ı" and "ſ" match "i"
+# and "s" case-insensitively without lower-casing to them
+_LOWER_UNSAFE_CHARS = ("\u0130", "\u0131", "\u017f")
+
+
+def _lower_matches_ignorecase(text: str) -> bool:
+    """Whether finding lower-case keywords in text.lower() is exact for *text*."""
+    return text.isascii() or not any(char in text for char in _LOWER_UNSAFE_CHARS)
+
+
+class _LoweredText:
+    """
+    Lower-cased view of a text for finding ASCII keywords, built on demand.
+
+    Only valid when _lower_matches_ignorecase(text) holds. The text is
+    lower-cased one chunk at a time as searches reach it, so keywords
+    found near the start (the cover page of a filing) never touch the
+    rest of a large document.
+    """
+
+    CHUNK_CHARS = 1 << 14
+    # Chunks overlap by this much, so any keyword up to one character
+    # longer that starts in a chunk is seen whole there
+    OVERLAP = 31
+
+    def __init__(self, text: str):
+        self.text = text
+        self._chunks: List[str] = []
+
+    def _chunk(self, index: int) -> str:
+        while len(self._chunks) <= index:
+            start = len(self._chunks) * self.CHUNK_CHARS
+            self._chunks.append(
+                self.text[start:start + self.CHUNK_CHARS + self.OVERLAP].lower()
+            )
+        return self._chunks[index]
+
+    def find_all(self, keyword: str) -> Iterator[int]:
+        """Offsets of every occurrence of lower-case *keyword*, in order."""
+        size = self.CHUNK_CHARS
+        for index in range((len(self.text) + size - 1) // size):
+            chunk = self._chunk(index)
+            pos = chunk.find(keyword)
+            while 0 <= pos < size:
+                yield index * size + pos
+                pos = chunk.find(keyword, pos + 1)
+
+
+def _iter_keyword_matches(
+    text: str, lowered: _LoweredText, keyword: str, pattern: re.Pattern
+) -> Iterator[re.Match]:
+    """
+    Same matches as pattern.finditer(text) for a keyword-led date pattern.
+
+    Keyword occurrences are located with str.find on the lower-cased text,
+    which is much cheaper than a case-insensitive regex scan; the pattern
+    then only runs at each occurrence.
+    """
+    pos = 0
+    for start in lowered.find_all(keyword):
+        if start < pos:
+            continue
+        # The rest of the pattern is optional, so it always matches here
+        match = pattern.match(text, start)
+        yield match
+        pos = match.end()
+
+
+# Common date patterns, tried in order
+_DATE_PATTERNS = [
+    re.compile(r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b'),  # MM/DD/YYYY or DD-MM-YYYY
+    re.compile(r'\b(\d{4}[/-]\d{1,2}[/-]\d{1,2})\b'),  # YYYY-MM-DD
+    re.compile(r'\b([A-Za-z]+ \d{1,2},? \d{4})\b'),  # Month DD, YYYY
+    re.compile(r'\b(\d{1,2} [A-Za-z]+ \d{4})\b'),  # DD Month YYYY
+]
+
+# Month and weekday name prefixes; without one of these or a digit,
+# dateutil's fuzzy parser cannot find a date in a piece of text
+_DATE_WORD_RE = re.compile(
+    r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec|mon|tue|wed|thu|fri|sat|sun',
+    re.IGNORECASE,
+)
+
+# Ticker-like tokens (e.g., ^GSPC, AAPL); the leading boundary is a
+# lookbehind so that a "^" after a space or comma is part of the token
+_TICKER_RE = re.compile(r'(?<!\w)(\^?[A-Z]{2,5})\b')
+
+
+def _iter_phrases(line: str) -> Iterator[str]:
+    """Non-empty, stripped double-space-separated phrases of one line."""
+    for phrase in line.strip().split("  "):
+        phrase = phrase.strip()
+        if phrase:
+            yield phrase
+
+
+def _iter_clean_text(pieces: Iterable[str]) -> Iterator[str]:
+    """
+    Whitespace-cleaned phrases of the concatenation of *pieces*.
+
+    Equivalent to splitting "".join(pieces) into lines and lines into
+    phrases, but only the current line is ever held in memory.
+    """
+    pending: List[str] = []
+    for piece in pieces:
+        lines = piece.splitlines(keepends=True)
+        if not lines:
+            continue
+        last = lines.pop()
+        for line in lines:
+            if pending:
+                pending.append(line)
+                line = "".join(pending)
+                pending = []
+            yield from _iter_phrases(line)
+        if len(last.splitlines()[0]) != len(last):
+            # Ends with a line break: the line is complete
+            pending.append(last)
+            yield from _iter_phrases("".join(pending))
+            pending = []
+        else:
+            pending.append(last)
+    if pending:
+        yield from _iter_phrases("".join(pending))
+
+
+# Elements whose strings BeautifulSoup does not report as document text
+_NON_TEXT_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+
+# Elements inside which BeautifulSoup keeps whitespace-only strings as-is
+_PRESERVE_WHITESPACE_TAGS = frozenset(("pre", "textarea"))
+
+# BeautifulSoup's notion of whitespace when collapsing blank strings
+_ASCII_SPACES = frozenset("\x20\x0a\x09\x0c\x0d")
+
+
+class _HTMLTextTarget:
+    """
+    lxml parser target collecting the document text strings.
+
+    Receives the same parser events BeautifulSoup's lxml builder does and
+    applies the same rules, so the collected strings equal ``soup.strings``
+    after decomposing script and style elements, without building the
+    BeautifulSoup object tree.
+    """
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._data: List[str] = []
+        self._tags: List[str] = []
+        # Open-element counts of _NON_TEXT_TAGS and _PRESERVE_WHITESPACE_TAGS
+        self._hidden = 0
+        self._preserve = 0
+
+    def _end_data(self, keep: bool = True) -> None:
+        if not self._data:
+            return
+        string = "".join(self._data)
+        self._data = []
+        if not keep or self._hidden:
+            return
+        if not self._preserve and all(char in _ASCII_SPACES for char in string):
+            string = "\n" if "\n" in string else " "
+        self.strings.append(string)
+
+    def start(self, tag, attrib) -> None:
+        self._end_data()
+        self._tags.append(tag)
+        if tag in _NON_TEXT_TAGS:
+            self._hidden += 1
+        if tag in _PRESERVE_WHITESPACE_TAGS:
+            self._preserve += 1
+
+    def end(self, tag) -> None:
+        self._end_data()
+        if tag not in self._tags:
+            return
+        while True:
+            popped = self._tags.pop()
+            if popped in _NON_TEXT_TAGS:
+                self._hidden -= 1
+            if popped in _PRESERVE_WHITESPACE_TAGS:
+                self._preserve -= 1
+            if popped == tag:
+                break
+
+    def data(self, data: str) -> None:
+        self._data.append(data)
+
+    def comment(self, text: str) -> None:
+        self._end_data()
+        self._data.append(text)
+        self._end_data(keep=False)
+
+    def pi(self, target: str, data: str) -> None:
+        self.comment(target + " " + data)
+
+    def doctype(self, name, pubid, system) -> None:
+        self._end_data()
+
+    def close(self) -> List[str]:
+        self._end_data()
+        return self.strings
+
+
+def _html_strings(html_content: str) -> List[str]:
+    """
+    Text strings of HTML content in document order.
+
+    Equivalent to BeautifulSoup's ``soup.strings`` with the lxml builder
+    once script and style elements are removed, but fed straight from
+    lxml's parser events. Falls back to BeautifulSoup for markup lxml
+    rejects as Unicode input.
+    """
+    if html_content[:1] == "\ufeff":
+        html_content = html_content[1:]
+    parser = etree.HTMLParser(target=_HTMLTextTarget(), recover=True)
+    try:
+        parser.feed(html_content)
+        return parser.close()
+    except (UnicodeDecodeError, LookupError, etree.ParserError, ValueError):
+        soup = BeautifulSoup(html_content, "lxml")
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        return list(soup.strings)
+
+
+def iter_text_from_html(html_content: str) -> Iterator[str]:
+    """
+    Yield the whitespace-cleaned text phrases of HTML content in order.
+
+    Streams phrases straight from the document's text strings, without
+    building the full intermediate text and line list.
+    """
+    logger.debug(f"Extracting text from HTML ({len(html_content)} characters)")
+    strings = _html_strings(html_content)
+
+    def pieces() -> Iterator[str]:
+        # Same as soup.get_text(separator=" ")
+        for i, string in enumerate(strings):
+            if i:
+                yield " "
+            yield string
+
+    return _iter_clean_text(pieces())
+
 
 def extract_text_from_html(html_content: str) -> str:
     """Extract plain text from HTML content."""
     logger.debug(f"Extracting text from HTML ({len(html_content)} characters)")
-    soup = BeautifulSoup(html_content, "lxml")
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-    text = soup.get_text(separator=" ")
-    # Clean up whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = " ".join(chunk for chunk in chunks if chunk)
+    # Join the raw strings first, so whitespace cleanup splits a few long
+    # lines in C rather than stepping through every text node
+    raw = " ".join(_html_strings(html_content))
+    text = " ".join(_iter_clean_text((raw,)))
     logger.debug(f"Extracted {len(text)} characters of text")
     return text
 
 
-def extract_symbols(content: str, is_html: bool = False, additional_symbols: Optional[List[str]] = None) -> Dict[str, any]:
+def extract_symbols(
+    content: str,
+    is_html: bool = False,
+    additional_symbols: Optional[List[str]] = None,
+    text: Optional[str] = None,
+) -> Dict[str, any]:
     """
     Extract index references and ticker symbols from filing content.
 
@@ -124,6 +483,8 @@ def extract_symbols(content: str, is_html: bool = False, additional_symbols: Opt
         content: The filing content (HTML or plain text)
         is_html: Whether the content is HTML format
         additional_symbols: Optional list of additional symbols to include
+        text: Optional plain text already extracted from *content*; when
+            given, *content* is not converted again
 
     Returns:
         Dictionary containing:
@@ -133,33 +494,25 @@ def extract_symbols(content: str, is_html: bool = False, additional_symbols: Opt
     """
     logger.info(f"Extracting symbols from {'HTML' if is_html else 'text'} content")
 
-    if is_html:
-        text = extract_text_from_html(content)
-    else:
-        text = content
+    if text is None:
+        text = extract_text_from_html(content) if is_html else content
 
     detected_indices = set()
     yahoo_symbols = set()
-    raw_tickers = set()
 
     # Search for known index names (case-insensitive)
-    text_upper = text.upper()
-    for index_name, yahoo_symbol in INDEX_MAPPING.items():
-        if index_name.upper() in text_upper:
-            detected_indices.add(index_name)
-            yahoo_symbols.add(yahoo_symbol)
-            logger.debug(f"Found index: {index_name} -> {yahoo_symbol}")
+    for index_name, yahoo_symbol in _find_indices(text):
+        detected_indices.add(index_name)
+        yahoo_symbols.add(yahoo_symbol)
+        logger.debug(f"Found index: {index_name} -> {yahoo_symbol}")
 
     logger.info(f"Detected {len(detected_indices)} known indices")
 
     # Extract ticker-like patterns (e.g., ^GSPC, AAPL, etc.)
-    ticker_pattern = r'\b(\^?[A-Z]{2,5})\b'
-    matches = re.findall(ticker_pattern, text)
-    for match in matches:
-        raw_tickers.add(match)
-        # If it starts with ^, it's likely an index symbol
-        if match.startswith("^"):
-            yahoo_symbols.add(match)
+    # Streamed into a set, so repeated tokens never build a match list
+    raw_tickers = {match.group(1) for match in _TICKER_RE.finditer(text)}
+    # If it starts with ^, it's likely an index symbol
+    yahoo_symbols.update(ticker for ticker in raw_tickers if ticker.startswith("^"))
 
     logger.info(f"Found {len(raw_tickers)} ticker-like patterns")
 
@@ -170,50 +523,54 @@ def extract_symbols(content: str, is_html: bool = False, additional_symbols: Opt
             yahoo_symbols.add(symbol)
 
     result = {
-        "indices": sorted(list(detected_indices)),
-        "yahoo_symbols": sorted(list(yahoo_symbols)),
-        "raw_tickers": sorted(list(raw_tickers)),
+        "indices": sorted(detected_indices),
+        "yahoo_symbols": sorted(yahoo_symbols),
+        "raw_tickers": sorted(raw_tickers),
     }
 
     logger.info(f"Symbol extraction complete: {len(result['yahoo_symbols'])} Yahoo symbols")
     return result
 
 
-def extract_dates(content: str, is_html: bool = False) -> Dict[str, Optional[str]]:
+def extract_dates(
+    content: str, is_html: bool = False, text: Optional[str] = None
+) -> Dict[str, Optional[str]]:
     """
     Extract key dates from filing content.
 
     Args:
         content: The filing content (HTML or plain text)
         is_html: Whether the content is HTML format
+        text: Optional plain text already extracted from *content*; when
+            given, *content* is not converted again
 
     Returns:
         Dictionary mapping date types to ISO-formatted date strings
     """
     logger.info(f"Extracting dates from {'HTML' if is_html else 'text'} content")
 
-    if is_html:
-        text = extract_text_from_html(content)
-    else:
-        text = content
+    if text is None:
+        text = extract_text_from_html(content) if is_html else content
 
     dates = {}
+    # Lower-cased lazily: most keywords are found near the start
+    lowered = _LoweredText(text) if _lower_matches_ignorecase(text) else None
 
     # Search for dates near keywords
-    for keyword in DATE_KEYWORDS:
+    for keyword, key, pattern in _DATE_KEYWORD_PATTERNS:
         # Look for the keyword followed by a date within the next 100 characters
-        pattern = re.escape(keyword) + r'[:\s,]*([^\.]{0,100})'
-        matches = re.finditer(pattern, text, re.IGNORECASE)
+        if lowered is not None:
+            matches = _iter_keyword_matches(text, lowered, keyword.lower(), pattern)
+        else:
+            matches = pattern.finditer(text)
 
         for match in matches:
             context = match.group(1)
             # Try to extract a date from the context
             extracted_date = extract_date_from_text(context)
             if extracted_date:
-                # Normalize the keyword for the dictionary key
-                key = keyword.lower().replace(" ", "_")
                 if key not in dates:  # Only store the first occurrence
-                    dates[key] = extracted_date.strftime("%Y-%m-%d")
+                    dates[key] = extracted_date.date().isoformat()
                     logger.debug(f"Found {keyword}: {dates[key]}")
                 break
 
@@ -231,16 +588,8 @@ def extract_date_from_text(text: str) -> Optional[datetime]:
     Returns:
         datetime object if a date is found, None otherwise
     """
-    # Common date patterns
-    date_patterns = [
-        r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b',  # MM/DD/YYYY or DD-MM-YYYY
-        r'\b(\d{4}[/-]\d{1,2}[/-]\d{1,2})\b',  # YYYY-MM-DD
-        r'\b([A-Za-z]+ \d{1,2},? \d{4})\b',  # Month DD, YYYY
-        r'\b(\d{1,2} [A-Za-z]+ \d{4})\b',  # DD Month YYYY
-    ]
-
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in _DATE_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             try:
                 # Try to parse the date
@@ -249,7 +598,10 @@ def extract_date_from_text(text: str) -> Optional[datetime]:
             except (ValueError, TypeError):
                 continue
 
-    # Fallback: try fuzzy parsing on the whole text
+    # Fallback: try fuzzy parsing on the whole text, unless it cannot
+    # possibly succeed (fuzzy parsing is slow on long contexts)
+    if not _DATE_WORD_RE.search(text) and not any(char.isdigit() for char in text):
+        return None
     try:
         parsed_date = date_parser.parse(text, fuzzy=True)
         return parsed_date
@@ -1,23 +1,75 @@
 """
 PDF support for structured products toolkit.
 
-Extracts text from PDF filings using pdfplumber (optional dependency).
+Extracts text from PDF filings using PyMuPDF, or pdfplumber when PyMuPDF
+is not installed (both optional dependencies).
 """
 
+import hashlib
 import logging
+import mmap
+import os
+import time
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+
+from .workers import process_pool
 
 logger = logging.getLogger(__name__)
 
+# Try to import PyMuPDF (optional dependency, preferred: its C engine
+# extracts text far faster than pdfplumber's pure-Python parser)
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+    logger.debug("PyMuPDF available - using it for PDF extraction")
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+    logger.debug("PyMuPDF not available - falling back to pdfplumber")
+
 # Try to import pdfplumber (optional dependency)
 try:
     import pdfplumber
-    PDF_SUPPORT_AVAILABLE = True
-    logger.debug("pdfplumber available - PDF support enabled")
+    PDFPLUMBER_AVAILABLE = True
+    logger.debug("pdfplumber available")
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+    logger.debug("pdfplumber not available")
+
+# Try to import zstandard (optional dependency, compresses cached PDF text)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+    logger.debug("zstandard available - cached PDF text is compressed")
 except ImportError:
-    PDF_SUPPORT_AVAILABLE = False
-    logger.debug("pdfplumber not available - PDF support disabled")
+    ZSTD_AVAILABLE = False
+    logger.debug("zstandard not available - cached PDF text is stored uncompressed")
+
+PDF_SUPPORT_AVAILABLE = PYMUPDF_AVAILABLE or PDFPLUMBER_AVAILABLE
+if not PDF_SUPPORT_AVAILABLE:
+    logger.debug("No PDF library available - PDF support disabled")
+
+# Spawned workers re-import the package and open the PDF before their first
+# page, about 1-2s each, while a page takes roughly 0.05-0.15s serially.
+# Below this many pages the pool costs more than it saves, and each worker
+# gets at least _MIN_PAGES_PER_WORKER pages to pay for its own startup.
+_PARALLEL_MIN_PAGES = 64
+_MIN_PAGES_PER_WORKER = 16
+
+# Extracted text is cached next to the price cache, keyed by file content.
+# Entries unread for longer than the max age are dropped, and the least
+# recently read entries are evicted once the directory outgrows the max size.
+_PDF_TEXT_CACHE_DIR = Path(os.path.expanduser("~"), ".structured_products_cache", "pdf_text")
+_PDF_TEXT_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+_PDF_TEXT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+_PDF_SUPPORT_MESSAGE = (
+    "PDF support requires PyMuPDF or pdfplumber. "
+    "Install one with: pip install pymupdf (or pip install pdfplumber)"
+)
 
 
 def is_pdf_supported() -> bool:
@@ -25,83 +77,353 @@ def is_pdf_supported() -> bool:
     Check if PDF support is available.
 
     Returns:
-        True if pdfplumber is installed
+        True if PyMuPDF or pdfplumber is installed
     """
     return PDF_SUPPORT_AVAILABLE
 
 
 def extract_text_from_pdf(
     pdf_path: str,
-    max_pages: Optional[int] = None
+    max_pages: Optional[int] = None,
+    use_cache: bool = True
 ) -> str:
     """
     Extract text from PDF file.
 
-    Requires pdfplumber to be installed:
-    pip install pdfplumber
+    Uses PyMuPDF when installed, otherwise pdfplumber:
+    pip install pymupdf
+
+    Extracted text is cached under ~/.structured_products_cache/pdf_text,
+    keyed by a hash of the file contents, so edited files never hit a
+    stale entry. Entries unread for 30 days expire, and the least recently
+    read ones are evicted to keep the directory under 256MB.
+
+    Long documents are split across spawned worker processes, so scripts
+    that call this at module level must guard their entry point with
+    ``if __name__ == "__main__":``.
 
     Args:
         pdf_path: Path to PDF file
         max_pages: Maximum number of pages to extract (None = all)
+        use_cache: Whether to use the extracted text cache (default: True)
 
     Returns:
         Extracted text
 
     Raises:
-        ImportError: If pdfplumber is not installed
+        ImportError: If neither PyMuPDF nor pdfplumber is installed
         FileNotFoundError: If PDF file doesn't exist
     """
     if not PDF_SUPPORT_AVAILABLE:
-        raise ImportError(
-            "PDF support requires pdfplumber. Install it with: pip install pdfplumber"
-        )
+        raise ImportError(_PDF_SUPPORT_MESSAGE)
 
     pdf_file = Path(pdf_path)
     if not pdf_file.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
+    cache_file = _cache_path_for(pdf_path, max_pages) if use_cache else None
+    if cache_file is not None:
+        cached = _load_cached_text(cache_file)
+        if cached is not None:
+            logger.info(f"Loaded cached text for PDF: {pdf_path}")
+            return cached
+
     logger.info(f"Extracting text from PDF: {pdf_path}")
 
-    extracted_text = []
-    page_count = 0
+    try:
+        if PYMUPDF_AVAILABLE:
+            extracted_text, page_count = _extract_pages_pymupdf(pdf_path, max_pages)
+        else:
+            extracted_text, page_count = _extract_pages_pdfplumber(pdf_path, max_pages)
+
+    except Exception as e:
+        logger.error(f"Error extracting text from PDF: {e}", exc_info=True)
+        raise
+
+    result = "\n\n".join(extracted_text)
+    logger.info(f"Extracted {len(result)} characters from {page_count} pages")
 
+    if not page_count:
+        logger.warning(f"No text found in PDF: {pdf_path} (likely scanned PDF, consider OCR)")
+
+    if cache_file is not None:
+        _store_cached_text(cache_file, result)
+
+    return result
+
+
+def _hash_file(file_path: str) -> str:
+    """BLAKE2b digest of a file's contents, read through mmap in 1MB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for start in range(0, len(view), _HASH_CHUNK_BYTES):
+                        digest.update(view[start:start + _HASH_CHUNK_BYTES])
+                finally:
+                    view.release()
+
+    return digest.hexdigest()
+
+
+def _cache_path_for(file_path: str, max_pages: Optional[int]) -> Optional[Path]:
+    """
+    Cache file for a PDF's extracted text.
+
+    The key covers the file contents, the page limit and the extraction
+    library, since each of them changes the text.
+
+    Args:
+        file_path: Path to PDF file
+        max_pages: Maximum number of pages extracted (None = all)
+
+    Returns:
+        Path of the cache file, or None if the PDF could not be hashed
+    """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            pages_to_process = min(total_pages, max_pages) if max_pages else total_pages
+        content_hash = _hash_file(file_path)
+    except OSError as e:
+        logger.warning(f"Failed to hash PDF for text cache: {e}")
+        return None
 
-            logger.info(f"Processing {pages_to_process} of {total_pages} pages")
+    backend = "pymupdf" if PYMUPDF_AVAILABLE else "pdfplumber"
+    suffix = ".txt.zst" if ZSTD_AVAILABLE else ".txt"
+    return _PDF_TEXT_CACHE_DIR / f"{content_hash}-{max_pages or 'all'}-{backend}{suffix}"
 
-            for page_num, page in enumerate(pdf.pages, start=1):
-                if max_pages and page_num > max_pages:
-                    break
 
-                # Extract text from page
-                text = page.extract_text()
-                if text:
-                    extracted_text.append(text)
-                    page_count += 1
+def _load_cached_text(cache_file: Path) -> Optional[str]:
+    """
+    Load cached PDF text.
 
-                    # Extract tables if present
-                    tables = page.extract_tables()
-                    if tables:
-                        for table in tables:
-                            # Convert table to text
-                            table_text = table_to_text(table)
-                            if table_text:
-                                extracted_text.append(table_text)
+    Args:
+        cache_file: Path of the cache file
 
-                if page_num % 10 == 0:
-                    logger.debug(f"Processed {page_num} pages")
+    Returns:
+        Cached text or None if not found/expired/unreadable
+    """
+    try:
+        age_seconds = time.time() - cache_file.stat().st_mtime
+        if age_seconds > _PDF_TEXT_CACHE_MAX_AGE_SECONDS:
+            logger.debug(f"PDF text cache expired: {cache_file.name}")
+            cache_file.unlink()
+            return None
+        data = cache_file.read_bytes()
+        # Reads refresh the mtime, so age and eviction follow last use
+        os.utime(cache_file)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Failed to read PDF text cache: {e}")
+        return None
 
+    try:
+        if ZSTD_AVAILABLE:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        return data.decode('utf-8')
     except Exception as e:
-        logger.error(f"Error extracting text from PDF: {e}", exc_info=True)
-        raise
+        logger.warning(f"Ignoring corrupt PDF text cache file {cache_file.name}: {e}")
+        return None
 
-    result = "\n\n".join(extracted_text)
-    logger.info(f"Extracted {len(result)} characters from {page_count} pages")
 
-    return result
+def _store_cached_text(cache_file: Path, text: str) -> None:
+    """
+    Write PDF text to the cache atomically using temp file + rename.
+
+    Args:
+        cache_file: Path of the cache file
+        text: Extracted text
+    """
+    data = text.encode('utf-8')
+    if ZSTD_AVAILABLE:
+        data = zstandard.ZstdCompressor().compress(data)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_name(cache_file.name + '.tmp')
+        temp_file.write_bytes(data)
+        temp_file.replace(cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write PDF text cache: {e}")
+        return
+
+    _prune_text_cache()
+
+
+def _prune_text_cache() -> int:
+    """
+    Delete expired cache files, then the least recently used ones while the
+    cache is over its size limit.
+
+    Returns:
+        Number of files deleted
+    """
+    try:
+        entries = []
+        for entry in os.scandir(_PDF_TEXT_CACHE_DIR):
+            if entry.is_file():
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError as e:
+        logger.warning(f"Failed to scan PDF text cache: {e}")
+        return 0
+
+    entries.sort()
+    total_bytes = sum(size for _, size, _ in entries)
+    cutoff = time.time() - _PDF_TEXT_CACHE_MAX_AGE_SECONDS
+    deleted = 0
+
+    for mtime, size, path in entries:
+        if mtime >= cutoff and total_bytes <= _PDF_TEXT_CACHE_MAX_BYTES:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to delete PDF text cache file: {e}")
+            continue
+        total_bytes -= size
+        deleted += 1
+
+    if deleted:
+        logger.debug(f"Pruned {deleted} PDF text cache files")
+    return deleted
+
+
+def _get_max_workers(max_pages: Optional[int] = None) -> int:
+    """Worker processes for page extraction: one per core, each with enough pages to pay off."""
+    if max_pages is None:
+        return min(os.cpu_count() or 1, 32)
+    return max(1, min(os.cpu_count() or 1, max_pages // _MIN_PAGES_PER_WORKER))
+
+
+def _use_process_pool(pages_to_process: int) -> bool:
+    """Whether a page range is large enough to amortize starting worker processes."""
+    return pages_to_process >= _PARALLEL_MIN_PAGES and _get_max_workers(pages_to_process) > 1
+
+
+def _pymupdf_page_texts(page) -> Tuple[str, List[str]]:
+    """Text of a PyMuPDF page and, when it has text, its tables as text."""
+    text = page.get_text("text").strip()
+    if not text:
+        return "", []
+
+    # Extract tables if present
+    tables_text = [table_to_text(table.extract()) for table in page.find_tables().tables]
+    return text, [table_text for table_text in tables_text if table_text]
+
+
+def _pdfplumber_page_texts(page) -> Tuple[str, List[str]]:
+    """Text of a pdfplumber page and, when it has text, its tables as text."""
+    try:
+        # Scanned (image-only) pages have no characters; skip layout analysis
+        if not page.chars:
+            return "", []
+
+        text = page.extract_text()
+        if not text:
+            return "", []
+
+        # Extract tables if present
+        tables_text = [table_to_text(table) for table in page.extract_tables() or []]
+        return text, [table_text for table_text in tables_text if table_text]
+    finally:
+        # Drop the page's cached layout objects; pdfplumber otherwise keeps
+        # every processed page's characters alive until the file is closed
+        page.close()
+
+
+@lru_cache(maxsize=1)
+def _open_worker_document(pdf_path: str):
+    """PDF handle kept open for the lifetime of a worker process."""
+    if PYMUPDF_AVAILABLE:
+        return pymupdf.open(pdf_path)
+    return pdfplumber.open(pdf_path)
+
+
+def _extract_one_page(pdf_path: str, page_index: int) -> Tuple[int, str, List[str]]:
+    """
+    Extract one page in a worker process.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_index: Zero-based page number
+
+    Returns:
+        Tuple of (page_index, text, tables_text)
+    """
+    doc = _open_worker_document(pdf_path)
+    if PYMUPDF_AVAILABLE:
+        text, tables_text = _pymupdf_page_texts(doc.load_page(page_index))
+    else:
+        text, tables_text = _pdfplumber_page_texts(doc.pages[page_index])
+    return page_index, text, tables_text
+
+
+def _extract_pages_parallel(pdf_path: str, pages_to_process: int) -> List[Tuple[str, List[str]]]:
+    """Extract the first pages of a PDF concurrently in spawned worker processes."""
+    with process_pool(_get_max_workers(pages_to_process)) as executor:
+        results = list(executor.map(
+            partial(_extract_one_page, pdf_path),
+            range(pages_to_process),
+            chunksize=8,
+        ))
+
+    results.sort(key=lambda result: result[0])
+    return [(text, tables_text) for _, text, tables_text in results]
+
+
+def _collect_page_texts(page_results: Iterable[Tuple[str, List[str]]]) -> Tuple[List[str], int]:
+    """Flatten per-page (text, tables_text) results in page order, counting pages with text."""
+    extracted_text = []
+    page_count = 0
+
+    for page_num, (text, tables_text) in enumerate(page_results, start=1):
+        if text:
+            extracted_text.append(text)
+            extracted_text.extend(tables_text)
+            page_count += 1
+
+        if page_num % 10 == 0:
+            logger.debug(f"Processed {page_num} pages")
+
+    return extracted_text, page_count
+
+
+def _extract_pages_pymupdf(pdf_path: str, max_pages: Optional[int]) -> Tuple[List[str], int]:
+    """Page and table texts of a PDF via PyMuPDF, plus the number of pages with text."""
+    with pymupdf.open(pdf_path) as doc:
+        total_pages = doc.page_count
+        pages_to_process = min(total_pages, max_pages) if max_pages else total_pages
+
+        logger.info(f"Processing {pages_to_process} of {total_pages} pages")
+
+        if not _use_process_pool(pages_to_process):
+            return _collect_page_texts(
+                _pymupdf_page_texts(doc.load_page(page_index))
+                for page_index in range(pages_to_process)
+            )
+
+    return _collect_page_texts(_extract_pages_parallel(pdf_path, pages_to_process))
+
+
+def _extract_pages_pdfplumber(pdf_path: str, max_pages: Optional[int]) -> Tuple[List[str], int]:
+    """Page and table texts of a PDF via pdfplumber, plus the number of pages with text."""
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+        pages_to_process = min(total_pages, max_pages) if max_pages else total_pages
+
+        logger.info(f"Processing {pages_to_process} of {total_pages} pages")
+
+        if not _use_process_pool(pages_to_process):
+            return _collect_page_texts(
+                _pdfplumber_page_texts(page) for page in pdf.pages[:pages_to_process]
+            )
+
+    return _collect_page_texts(_extract_pages_parallel(pdf_path, pages_to_process))
 
 
 def table_to_text(table: list) -> str:
@@ -109,7 +431,7 @@ def table_to_text(table: list) -> str:
     Convert extracted PDF table to text.
 
     Args:
-        table: Table data from pdfplumber (list of lists)
+        table: Table data from PyMuPDF or pdfplumber (list of lists)
 
     Returns:
         Text representation of table
@@ -139,18 +461,31 @@ def extract_pdf_metadata(pdf_path: str) -> Dict[str, Any]:
         Dictionary with PDF metadata
 
     Raises:
-        ImportError: If pdfplumber is not installed
+        ImportError: If neither PyMuPDF nor pdfplumber is installed
     """
     if not PDF_SUPPORT_AVAILABLE:
-        raise ImportError(
-            "PDF support requires pdfplumber. Install it with: pip install pdfplumber"
-        )
+        raise ImportError(_PDF_SUPPORT_MESSAGE)
 
     pdf_file = Path(pdf_path)
     if not pdf_file.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
     try:
+        if PYMUPDF_AVAILABLE:
+            with pymupdf.open(pdf_path) as doc:
+                metadata = doc.metadata or {}
+
+                return {
+                    "num_pages": doc.page_count,
+                    "title": metadata.get("title") or None,
+                    "author": metadata.get("author") or None,
+                    "subject": metadata.get("subject") or None,
+                    "creator": metadata.get("creator") or None,
+                    "producer": metadata.get("producer") or None,
+                    "creation_date": metadata.get("creationDate") or None,
+                    "modification_date": metadata.get("modDate") or None,
+                }
+
         with pdfplumber.open(pdf_path) as pdf:
             metadata = pdf.metadata or {}
 
@@ -181,29 +516,35 @@ def detect_pdf_type(pdf_path: str) -> str:
         "text" or "image" or "unknown"
 
     Raises:
-        ImportError: If pdfplumber is not installed
+        ImportError: If neither PyMuPDF nor pdfplumber is installed
     """
     if not PDF_SUPPORT_AVAILABLE:
-        raise ImportError(
-            "PDF support requires pdfplumber. Install it with: pip install pdfplumber"
-        )
+        raise ImportError(_PDF_SUPPORT_MESSAGE)
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            # Check first few pages
-            pages_to_check = min(3, len(pdf.pages))
-            text_chars = 0
-
-            for page in pdf.pages[:pages_to_check]:
-                text = page.extract_text()
-                if text:
-                    text_chars += len(text.strip())
-
-            # If we got substantial text, it's text-based
-            if text_chars > 100:
-                return "text"
-            else:
-                return "image"
+        if PYMUPDF_AVAILABLE:
+            with pymupdf.open(pdf_path) as doc:
+                # Check first few pages
+                text_chars = sum(
+                    len(doc.load_page(i).get_text("text").strip())
+                    for i in range(min(3, doc.page_count))
+                )
+        else:
+            with pdfplumber.open(pdf_path) as pdf:
+                # Check first few pages
+                pages_to_check = min(3, len(pdf.pages))
+                text_chars = 0
+
+                for page in pdf.pages[:pages_to_check]:
+                    text = page.extract_text()
+                    if text:
+                        text_chars += len(text.strip())
+
+        # If we got substantial text, it's text-based
+        if text_chars > 100:
+            return "text"
+        else:
+            return "image"
 
     except Exception as e:
         logger.error(f"Error detecting PDF type: {e}")
@@ -212,16 +553,22 @@ def detect_pdf_type(pdf_path: str) -> str:
 
 def read_filing_content(
     file_path: str,
-    max_pdf_pages: Optional[int] = None
+    max_pdf_pages: Optional[int] = None,
+    use_cache: bool = True
 ) -> tuple[str, bool]:
     """
     Read filing content from file (supports HTML, TXT, PDF).
 
     Automatically detects file type and extracts content.
 
+    Long PDFs are extracted in spawned worker processes (see
+    extract_text_from_pdf), so scripts that call this at module level must
+    guard their entry point with ``if __name__ == "__main__":``.
+
     Args:
         file_path: Path to filing file
         max_pdf_pages: Maximum pages to extract from PDF (None = all)
+        use_cache: Whether to use the extracted PDF text cache (default: True)
 
     Returns:
         Tuple of (content, is_html)
@@ -240,12 +587,10 @@ def read_filing_content(
     # PDF files
     if suffix == ".pdf":
         if not PDF_SUPPORT_AVAILABLE:
-            raise ImportError(
-                "PDF support requires pdfplumber. Install it with: pip install pdfplumber"
-            )
+            raise ImportError(_PDF_SUPPORT_MESSAGE)
 
         logger.info(f"Reading PDF file: {file_path}")
-        content = extract_text_from_pdf(file_path, max_pdf_pages)
+        content = extract_text_from_pdf(file_path, max_pdf_pages, use_cache=use_cache)
         return content, False  # PDF text is not HTML
 
     # HTML files
@@ -13,13 +13,27 @@ Handles 4 common EDGAR table patterns:
   4. Compound values:   <td>$166.264 (70.00% of the initial share price)</td>
 """
 
+import functools
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Pattern, Set, Tuple
 from bs4 import BeautifulSoup
+from dateutil import parser as date_parser
+from lxml import etree
+
+from .parser import _NON_TEXT_TAGS, _lower_matches_ignorecase
 
 logger = logging.getLogger(__name__)
 
+# Try to import pyahocorasick (optional dependency)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+    logger.debug("pyahocorasick available - one-pass label prefiltering enabled")
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.debug("pyahocorasick not available - labels checked against every field")
+
 
 # ---------------------------------------------------------------------------
 # Canonical field names → label patterns (issuer-agnostic)
@@ -115,6 +129,191 @@ LABEL_MAP: Dict[str, List[str]] = {
 }
 
 
+# Labels to EXCLUDE per field (e.g., "aggregate principal" is total offering, not per-security)
+LABEL_EXCLUSIONS: Dict[str, List[str]] = {
+    "notional": [r"aggregate"],
+}
+
+
+def _compile_label_patterns(
+    patterns: List[str],
+    flags: int = re.IGNORECASE,
+) -> Tuple[Optional[Pattern], Dict[int, int], List[Pattern]]:
+    """
+    Compile one field's label patterns.
+
+    Returns the patterns joined into a single alternation (None when there are
+    none), a map from each alternative's wrapping group number to its pattern
+    index, and the individually compiled patterns in priority order.
+    """
+    compiled = [re.compile(p, flags) for p in patterns]
+    if not compiled:
+        return None, {}, compiled
+
+    group_to_index: Dict[int, int] = {}
+    group = 1
+    for pat_idx, pattern in enumerate(compiled):
+        group_to_index[group] = pat_idx
+        group += pattern.groups + 1
+
+    combined = re.compile("|".join(f"({p})" for p in patterns), flags)
+    return combined, group_to_index, compiled
+
+
+def _compile_label_map(
+    label_map: Dict[str, List[str]],
+) -> Dict[str, Tuple[Optional[Pattern], Dict[int, int], List[Pattern]]]:
+    """Compile every field of a label map with _compile_label_patterns()."""
+    return {field: _compile_label_patterns(patterns) for field, patterns in label_map.items()}
+
+
+def _lowered_label_flags(patterns: List[str]) -> int:
+    """
+    Regex flags for matching *patterns* against lower-cased labels.
+
+    All-lower-case patterns need no case folding there; anything else
+    (including escapes such as \\S) keeps re.IGNORECASE.
+    """
+    return 0 if all(p == p.lower() for p in patterns) else re.IGNORECASE
+
+
+_COMPILED_LABEL_MAP = _compile_label_map(LABEL_MAP)
+# Variant for labels whose lower-cased form matches exactly as re.IGNORECASE
+# would (see _lower_matches_ignorecase), skipping case folding in the engine
+_LOWERED_LABEL_MAP = {
+    field: _compile_label_patterns(patterns, _lowered_label_flags(patterns))
+    for field, patterns in LABEL_MAP.items()
+}
+
+
+def _required_literal(pattern: str, min_len: int = 1) -> Optional[str]:
+    """
+    Longest lower-cased alphanumeric run every match of *pattern* contains.
+
+    Only plain characters at the top level of the pattern count; groups,
+    classes, escapes and quantified characters end a run, and a top-level
+    alternation means there is no required literal.  Runs shorter than
+    *min_len* are not worth checking for and also give None.
+    """
+    runs: List[str] = []
+    run: List[str] = []
+    i, n = 0, len(pattern)
+
+    def end_run() -> None:
+        if run:
+            runs.append("".join(run))
+            run.clear()
+
+    while i < n:
+        ch = pattern[i]
+        if ch == "|":
+            return None
+        if ch in "?*+{":
+            # The quantified character is not required (or not contiguous)
+            if run:
+                run.pop()
+            end_run()
+            i += 1
+        elif ch == "\\":
+            end_run()
+            i += 2
+        elif ch == "[":
+            end_run()
+            i += 1
+            if i < n and pattern[i] == "^":
+                i += 1
+            if i < n and pattern[i] == "]":
+                i += 1
+            while i < n and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+        elif ch == "(":
+            end_run()
+            depth = 0
+            while i < n:
+                c = pattern[i]
+                if c == "\\":
+                    i += 1
+                elif c == "[":
+                    i += 1
+                    while i < n and pattern[i] != "]":
+                        i += 2 if pattern[i] == "\\" else 1
+                elif c == "(":
+                    depth += 1
+                elif c == ")":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                i += 1
+            i += 1
+        elif ch.isascii() and ch.isalnum():
+            run.append(ch.lower())
+            i += 1
+        else:
+            end_run()
+            i += 1
+    end_run()
+
+    literal = max(runs, key=len, default="")
+    return literal if literal and len(literal) >= min_len else None
+
+
+def _build_label_automaton() -> Tuple["ahocorasick.Automaton", FrozenSet[str]]:
+    """
+    Build an Aho-Corasick automaton over the required literals of LABEL_MAP.
+
+    Returns the automaton, whose values are the sets of fields with a pattern
+    requiring that literal, and the fields with a pattern that requires no
+    literal (always candidates).
+    """
+    fields_by_literal: Dict[str, Set[str]] = {}
+    unanchored: Set[str] = set()
+    for field_name, patterns in LABEL_MAP.items():
+        for pattern in patterns:
+            literal = _required_literal(pattern)
+            if literal is None:
+                unanchored.add(field_name)
+            else:
+                fields_by_literal.setdefault(literal, set()).add(field_name)
+
+    automaton = ahocorasick.Automaton()
+    for literal, fields in fields_by_literal.items():
+        automaton.add_word(literal, frozenset(fields))
+    automaton.make_automaton()
+    return automaton, frozenset(unanchored)
+
+
+if AHOCORASICK_AVAILABLE:
+    _LABEL_AUTOMATON, _UNANCHORED_LABEL_FIELDS = _build_label_automaton()
+else:
+    _LABEL_AUTOMATON, _UNANCHORED_LABEL_FIELDS = None, frozenset()
+
+
+def _candidate_fields(label_lower: str) -> Optional[FrozenSet[str]]:
+    """
+    Fields of LABEL_MAP whose patterns could match a lower-cased label, in one pass.
+
+    Only valid when _lower_matches_ignorecase() holds for the label. Returns
+    None (every field is a candidate) without pyahocorasick.
+    """
+    if _LABEL_AUTOMATON is None:
+        return None
+    fields = set(_UNANCHORED_LABEL_FIELDS)
+    for _, literal_fields in _LABEL_AUTOMATON.iter(label_lower):
+        fields |= literal_fields
+    return frozenset(fields)
+
+
+_COMPILED_LABEL_EXCLUSIONS: Dict[str, List[Pattern]] = {
+    field: [re.compile(ex, re.IGNORECASE) for ex in exclusions]
+    for field, exclusions in LABEL_EXCLUSIONS.items()
+}
+_LOWERED_LABEL_EXCLUSIONS: Dict[str, List[Pattern]] = {
+    field: [re.compile(ex, _lowered_label_flags(exclusions)) for ex in exclusions]
+    for field, exclusions in LABEL_EXCLUSIONS.items()
+}
+
+
 # ---------------------------------------------------------------------------
 # Value parsing helpers
 # ---------------------------------------------------------------------------
@@ -127,6 +326,21 @@ _DATE_RE = re.compile(
     re.IGNORECASE,
 )
 _PURE_NUMBER_RE = re.compile(r"^[\s$]*([0-9]{1,3}(?:,?[0-9]{3})*(?:\.[0-9]+)?)[\s%$]*$")
+# Every _DATE_RE match contains four digits in a row or digit/digit, so
+# cells without either skip its slow month-name alternation
+_DATE_HINT_RE = re.compile(r"\d{4}|\d/\d")
+
+# Shared dateutil parser (date_parser.parse() goes through an equivalent default)
+_DATE_PARSER = date_parser.parser()
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_date(date_text: str) -> Optional[str]:
+    """ISO form of a _DATE_RE match, or None if it is not a valid date."""
+    try:
+        return _DATE_PARSER.parse(date_text, fuzzy=False).date().isoformat()
+    except (ValueError, OverflowError):
+        return None
 
 
 def parse_value(raw: str) -> Dict:
@@ -150,8 +364,8 @@ def parse_value(raw: str) -> Dict:
 
     cleaned = raw.strip()
 
-    # Dollar amount
-    m_dollar = _MONEY_RE.search(cleaned)
+    # Dollar amount (the literal checks skip scans that cannot match)
+    m_dollar = _MONEY_RE.search(cleaned) if "$" in cleaned else None
     if m_dollar:
         try:
             result["dollar"] = float(m_dollar.group(1).replace(",", ""))
@@ -159,7 +373,7 @@ def parse_value(raw: str) -> Dict:
             pass
 
     # Percentage
-    m_pct = _PCT_RE.search(cleaned)
+    m_pct = _PCT_RE.search(cleaned) if "%" in cleaned else None
     if m_pct:
         try:
             result["pct"] = float(m_pct.group(1))
@@ -172,14 +386,9 @@ def parse_value(raw: str) -> Dict:
         result["compound_pct"] = result["pct"]
 
     # Date
-    m_date = _DATE_RE.search(cleaned)
+    m_date = _DATE_RE.search(cleaned) if _DATE_HINT_RE.search(cleaned) else None
     if m_date:
-        try:
-            from dateutil import parser as date_parser
-            parsed = date_parser.parse(m_date.group(0), fuzzy=False)
-            result["date"] = parsed.strftime("%Y-%m-%d")
-        except (ValueError, TypeError, OverflowError, Exception):
-            pass
+        result["date"] = _iso_date(m_date.group(0))
 
     # Pure number without $ or % (might be a dollar amount contextually)
     if result["dollar"] is None and result["pct"] is None and result["date"] is None:
@@ -209,6 +418,166 @@ def _should_skip_table(rows: List[List[str]]) -> bool:
     return bool(_SKIP_TABLE_RE.search(full_text))
 
 
+# ---------------------------------------------------------------------------
+# HTML tree access
+# ---------------------------------------------------------------------------
+class _Cell:
+    """Text strings of a table cell and of its first <b>/<strong> element."""
+
+    __slots__ = ("strings", "bold")
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.bold: Optional[List[str]] = None
+
+
+class _TableTarget:
+    """
+    lxml parser target collecting the cells of every <table>.
+
+    Receives the same parser events BeautifulSoup's lxml builder does and
+    applies the same rules (text inside script/style/template/ruby text is
+    not document text; comments and processing instructions end a string),
+    so cell texts equal BeautifulSoup's without building its object tree.
+    """
+
+    def __init__(self):
+        self.tables: List[List[List[_Cell]]] = []
+        self._data: List[str] = []
+        # Open elements as (tag, table rows / row cells / cell / bold strings)
+        self._stack: List[Tuple[str, object]] = []
+        self._open_tags: List[str] = []
+        self._hidden = 0
+
+    def _end_data(self) -> None:
+        if not self._data:
+            return
+        string = "".join(self._data)
+        self._data = []
+        if self._hidden:
+            return
+        for tag, obj in self._stack:
+            if tag in ("td", "th"):
+                obj.strings.append(string)
+            elif tag in ("b", "strong"):
+                obj.append(string)
+
+    def start(self, tag, attrib) -> None:
+        self._end_data()
+        obj = None
+        if tag == "table":
+            obj = []
+            self.tables.append(obj)
+        elif tag == "tr":
+            # Rows of nested tables also belong to the enclosing tables
+            obj = []
+            for open_tag, rows in self._stack:
+                if open_tag == "table":
+                    rows.append(obj)
+        elif tag in ("td", "th"):
+            obj = _Cell()
+            for open_tag, cells in self._stack:
+                if open_tag == "tr":
+                    cells.append(obj)
+        elif tag in ("b", "strong"):
+            obj = []
+            for open_tag, cell in self._stack:
+                if open_tag in ("td", "th") and cell.bold is None:
+                    cell.bold = obj
+        self._stack.append((tag, obj))
+        self._open_tags.append(tag)
+        if tag in _NON_TEXT_TAGS:
+            self._hidden += 1
+
+    def end(self, tag) -> None:
+        self._end_data()
+        if tag not in self._open_tags:
+            return
+        while True:
+            self._stack.pop()
+            popped = self._open_tags.pop()
+            if popped in _NON_TEXT_TAGS:
+                self._hidden -= 1
+            if popped == tag:
+                break
+
+    def data(self, data: str) -> None:
+        self._data.append(data)
+
+    def comment(self, text: str) -> None:
+        self._end_data()
+
+    def pi(self, target: str, data: str) -> None:
+        self._end_data()
+
+    def doctype(self, name, pubid, system) -> None:
+        self._end_data()
+
+    def close(self) -> List[List[List[_Cell]]]:
+        self._end_data()
+        return self.tables
+
+
+def _parse_tables(html: str) -> Optional[List[List[List[_Cell]]]]:
+    """Cells of every table in *html* via lxml, or None if lxml rejects the markup."""
+    if html[:1] == "\ufeff":
+        html = html[1:]
+    parser = etree.HTMLParser(target=_TableTarget(), recover=True)
+    try:
+        parser.feed(html)
+        return parser.close()
+    except (UnicodeDecodeError, LookupError, etree.ParserError, ValueError):
+        return None
+
+
+def _joined_stripped(strings: List[str]) -> str:
+    """Same as BeautifulSoup's ``get_text(strip=True)`` over *strings*."""
+    return "".join(stripped for stripped in (string.strip() for string in strings) if stripped)
+
+
+def _cell_text(cell: _Cell) -> str:
+    """Stripped text of a cell collected by _TableTarget."""
+    return _joined_stripped(cell.strings)
+
+
+def _cell_bold_text(cell: _Cell) -> Optional[str]:
+    """Text of a collected cell's first bold element, or None if it has none."""
+    return None if cell.bold is None else _joined_stripped(cell.bold)
+
+
+def _soup_bold_text(el) -> Optional[str]:
+    """Text of the first <b>/<strong> inside a BeautifulSoup cell, or None if it has none."""
+    bold = el.find(["b", "strong"])
+    return bold.get_text(strip=True) if bold else None
+
+
+def _table_rows(
+    html: str,
+) -> Tuple[List[List[list]], Callable[[object], str], Callable[[object], Optional[str]]]:
+    """
+    Cells of every <table> in *html*, grouped by row.
+
+    Rows and cells include those of nested tables, as with BeautifulSoup's
+    recursive ``find_all``; rows without cells are dropped.
+
+    Returns:
+        Tuple of (tables, cell_text_of, bold_text_of) where tables lists each
+        table's rows of cells and the two functions give a cell's
+        stripped text and its first bold text (None without a bold element)
+    """
+    parsed = _parse_tables(html)
+    if parsed is not None:
+        tables = [[cells for cells in rows if cells] for rows in parsed]
+        return tables, _cell_text, _cell_bold_text
+
+    soup = BeautifulSoup(html, "lxml")
+    tables = [
+        [cells for cells in (tr.find_all(["td", "th"]) for tr in tbl.find_all("tr")) if cells]
+        for tbl in soup.find_all("table")
+    ]
+    return tables, (lambda el: el.get_text(strip=True)), _soup_bold_text
+
+
 # ---------------------------------------------------------------------------
 # Core extraction
 # ---------------------------------------------------------------------------
@@ -224,27 +593,20 @@ def extract_table_key_value_pairs(html: str) -> List[Dict]:
         "pattern": str,        # "2col" | "3col_spacer" | "inline" | "compound"
       }
     """
-    soup = BeautifulSoup(html, "lxml")
+    tables, cell_text_of, bold_text_of = _table_rows(html)
     pairs: List[Dict] = []
 
-    for tbl_idx, tbl in enumerate(soup.find_all("table")):
-        rows = []
-        for tr in tbl.find_all("tr"):
-            cells = tr.find_all(["td", "th"])
-            if cells:
-                rows.append(cells)
-
+    for tbl_idx, rows in enumerate(tables):
         if not rows:
             continue
 
         # Get text version for skip detection
-        text_rows = [[c.get_text(strip=True) for c in row] for row in rows]
+        text_rows = [[cell_text_of(c) for c in row] for row in rows]
         if _should_skip_table(text_rows):
             logger.debug(f"Skipping table {tbl_idx}: example/hypothetical")
             continue
 
-        for row_idx, cell_elements in enumerate(rows):
-            texts = [c.get_text(strip=True) for c in cell_elements]
+        for row_idx, (cell_elements, texts) in enumerate(zip(rows, text_rows)):
             num_cells = len(texts)
 
             # Skip rows with too many cells (likely data tables, not label-value)
@@ -296,17 +658,15 @@ def extract_table_key_value_pairs(html: str) -> List[Dict]:
             # --- Pattern 3: Inline label-value in a single cell ---
             # e.g. <td><b>Initial price:</b> $237.52</td>
             if num_cells >= 1:
-                for cell_el in cell_elements:
+                for cell_el, full_text in zip(cell_elements, texts):
                     # Check if cell has a bold/strong element followed by text
-                    bold = cell_el.find(["b", "strong"])
-                    if bold:
-                        bold_text = bold.get_text(strip=True)
-                        full_text = cell_el.get_text(strip=True)
+                    bold = bold_text_of(cell_el)
+                    if bold is not None:
                         # Value is the part after the bold text
-                        remainder = full_text[len(bold_text):].strip().lstrip(":").strip()
-                        if bold_text and remainder and _looks_like_label(bold_text):
+                        remainder = full_text[len(bold):].strip().lstrip(":").strip()
+                        if bold and remainder and _looks_like_label(bold):
                             pairs.append({
-                                "label": _clean_label(bold_text),
+                                "label": _clean_label(bold),
                                 "value": parse_value(remainder),
                                 "table_index": tbl_idx,
                                 "row_index": row_idx,
@@ -329,13 +689,49 @@ def extract_table_key_value_pairs(html: str) -> List[Dict]:
                             "pattern": "inline",
                         })
 
-    logger.info(f"Extracted {len(pairs)} key-value pairs from {tbl_idx + 1 if soup.find_all('table') else 0} tables")
+    logger.info(f"Extracted {len(pairs)} key-value pairs from {len(tables)} tables")
     return pairs
 
 
 # ---------------------------------------------------------------------------
 # Label matching
 # ---------------------------------------------------------------------------
+def _best_pattern_index(
+    label_lower: str,
+    compiled_field: Tuple[Optional[Pattern], Dict[int, int], List[Pattern]],
+    exclusions: Iterable[Pattern],
+) -> Optional[int]:
+    """
+    Index of the first of a field's patterns matching a lower-cased label.
+
+    Args:
+        label_lower: Lower-cased label text
+        compiled_field: Output of _compile_label_patterns() for the field
+        exclusions: Compiled exclusion patterns for the field
+
+    Returns:
+        Pattern index, or None if no pattern matches or an exclusion does
+    """
+    combined, group_to_index, patterns = compiled_field
+
+    # One pass over the label decides whether any pattern matches
+    m = combined.search(label_lower) if combined is not None else None
+    if m is None:
+        return None
+
+    # Skip if label matches any exclusion pattern for this field
+    if any(ex.search(label_lower) for ex in exclusions):
+        return None
+
+    # The alternation reports the leftmost match, which need not be
+    # the highest-priority pattern; only earlier patterns can beat it
+    pat_idx = group_to_index[m.lastindex]
+    for earlier_idx in range(pat_idx):
+        if patterns[earlier_idx].search(label_lower):
+            return earlier_idx
+    return pat_idx
+
+
 def match_labels_to_fields(
     pairs: List[Dict],
     label_map: Optional[Dict[str, List[str]]] = None,
@@ -355,42 +751,58 @@ def match_labels_to_fields(
       }
     """
     if label_map is None:
-        label_map = LABEL_MAP
-
-    # Labels to EXCLUDE per field (e.g., "aggregate principal" is total offering, not per-security)
-    LABEL_EXCLUSIONS: Dict[str, List[str]] = {
-        "notional": [r"aggregate"],
-    }
+        compiled_map = _COMPILED_LABEL_MAP
+    else:
+        compiled_map = _compile_label_map(label_map)
 
     matched: Dict[str, Dict] = {}
+    # Fields matched by a first pattern; no later pair can beat confidence 1.0
+    settled: Set[str] = set()
+
+    # Pairs outer, so each label is lower-cased once and, with the default
+    # map, checked only against the fields its literals point to
+    for pair in pairs:
+        label_lower = pair["label"].lower()
+        field_patterns, field_exclusions = compiled_map, _COMPILED_LABEL_EXCLUSIONS
+        fields = None
+        if label_map is None and _lower_matches_ignorecase(pair["label"]):
+            # The label is already lower-case, so skip case folding, and
+            # only the fields its literals point to can match
+            field_patterns, field_exclusions = _LOWERED_LABEL_MAP, _LOWERED_LABEL_EXCLUSIONS
+            fields = _candidate_fields(label_lower)
+
+        for field_name in compiled_map if fields is None else fields:
+            if field_name in settled:
+                continue
 
-    for field_name, patterns in label_map.items():
-        exclusions = LABEL_EXCLUSIONS.get(field_name, [])
-        for pair in pairs:
-            label_lower = pair["label"].lower()
-
-            # Skip if label matches any exclusion pattern for this field
-            if any(re.search(ex, label_lower, re.IGNORECASE) for ex in exclusions):
+            pat_idx = _best_pattern_index(
+                label_lower,
+                field_patterns[field_name],
+                field_exclusions.get(field_name, ()),
+            )
+            if pat_idx is None:
                 continue
 
-            for pat_idx, pattern in enumerate(patterns):
-                if re.search(pattern, label_lower, re.IGNORECASE):
-                    # Confidence: first pattern in list = highest confidence
-                    confidence = 1.0 - (pat_idx * 0.1)
-                    confidence = max(0.5, confidence)
-
-                    # Only replace if higher confidence
-                    if field_name not in matched or confidence > matched[field_name]["confidence"]:
-                        matched[field_name] = {
-                            "value": pair["value"],
-                            "label": pair["label"],
-                            "confidence": confidence,
-                            "source": "table",
-                            "pattern": pair["pattern"],
-                            "table_index": pair["table_index"],
-                            "row_index": pair["row_index"],
-                        }
-                    break  # matched this pair to this field, move on
+            # Confidence: first pattern in list = highest confidence
+            confidence = 1.0 - (pat_idx * 0.1)
+            confidence = max(0.5, confidence)
+
+            # Only replace if higher confidence
+            if field_name not in matched or confidence > matched[field_name]["confidence"]:
+                matched[field_name] = {
+                    "value": pair["value"],
+                    "label": pair["label"],
+                    "confidence": confidence,
+                    "source": "table",
+                    "pattern": pair["pattern"],
+                    "table_index": pair["table_index"],
+                    "row_index": pair["row_index"],
+                }
+                if pat_idx == 0:
+                    settled.add(field_name)
+
+    # Report fields in label map order
+    matched = {field_name: matched[field_name] for field_name in compiled_map if field_name in matched}
 
     logger.info(f"Matched {len(matched)} fields from table pairs")
     return matched
@@ -409,6 +821,10 @@ def _clean_label(label: str) -> str:
     return label.strip()
 
 
+_PURE_VALUE_RE = re.compile(r"^[\s$]*[0-9,]+(?:\.[0-9]+)?\s*[%$]?\s*$")
+_VALUE_START_CHARS = frozenset("$,0123456789")
+
+
 def _looks_like_label(text: str) -> bool:
     """
     Heuristic: does *text* look like a label (not a value)?
@@ -423,10 +839,11 @@ def _looks_like_label(text: str) -> bool:
         return False
     if len(text) > 120:
         return False
-    # Pure numbers / dollar amounts / percentages are values, not labels
-    if re.match(r"^[\s$]*[0-9,]+(?:\.[0-9]+)?\s*[%$]?\s*$", text):
-        return False
     # Single character is not a label
     if len(text) <= 1:
         return False
+    # Pure numbers / dollar amounts / percentages are values, not labels
+    # (text is stripped, so only these first characters can start one)
+    if text[0] in _VALUE_START_CHARS and _PURE_VALUE_RE.match(text):
+        return False
     return True
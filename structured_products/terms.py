@@ -69,13 +69,17 @@ PRODUCT_TERM_PATTERNS = {
 }
 
 
-def extract_product_terms(content: str, is_html: bool = False) -> Dict[str, any]:
+def extract_product_terms(
+    content: str, is_html: bool = False, text: Optional[str] = None
+) -> Dict[str, any]:
     """
     Extract structured product terms from filing content.
 
     Args:
         content: The filing content (HTML or plain text)
         is_html: Whether the content is HTML format
+        text: Optional plain text already extracted from *content*; when
+            given, *content* is not converted again
 
     Returns:
         Dictionary containing extracted product terms with values
@@ -84,10 +88,8 @@ def extract_product_terms(content: str, is_html: bool = False) -> Dict[str, any]
 
     logger.info("Extracting product terms from content")
 
-    if is_html:
-        text = extract_text_from_html(content)
-    else:
-        text = content
+    if text is None:
+        text = extract_text_from_html(content) if is_html else content
 
     terms = {}
 
@@ -0,0 +1,39 @@
+"""
+Worker process pools for structured products toolkit.
+
+Shared by batch filing parsing and parallel PDF page extraction.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+# fork() copies only the calling thread, so a child forked after numba's
+# parallel kernels (or any other library) started worker threads can block
+# forever on a lock one of those threads held.  Spawned workers start from
+# a fresh interpreter instead, on every platform.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def process_pool(
+    max_workers: int,
+    initializer: Optional[Callable[[], None]] = None,
+) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers are spawned, never forked.
+
+    Spawned workers re-import this package, so scripts that use the pool
+    must guard their entry point with ``if __name__ == "__main__":``.
+
+    Args:
+        max_workers: Number of worker processes
+        initializer: Called once in each worker before it takes tasks
+
+    Returns:
+        ProcessPoolExecutor (use as a context manager)
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=_MP_CONTEXT,
+        initializer=initializer,
+    )
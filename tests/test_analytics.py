@@ -4,18 +4,23 @@ Unit tests for analytics module.
 
 import pytest
 import math
+import subprocess
+import sys
+import numpy as np
 from structured_products.analytics import (
     calculate_log_returns,
     calculate_realized_volatility,
     calculate_rolling_volatilities,
     calculate_greeks,
+    calculate_greeks_grid,
     estimate_time_to_maturity,
     analyze_structured_product_greeks,
     calculate_breakeven_levels,
     calculate_risk_metrics,
     generate_analytics_summary,
     black_scholes_call_price,
-    black_scholes_put_price
+    black_scholes_put_price,
+    black_scholes_prices
 )
 
 
@@ -177,6 +182,16 @@ class TestBlackScholesPrice:
         assert price == 5.0
 
 
+    def test_prices_match_individual_pricers(self):
+        """Test combined pricer agrees with the call and put pricers."""
+        call, put = black_scholes_prices(S=100, K=95, T=0.5, r=0.03, sigma=0.25)
+
+        assert call == pytest.approx(black_scholes_call_price(100, 95, 0.5, 0.03, 0.25))
+        assert put == pytest.approx(black_scholes_put_price(100, 95, 0.5, 0.03, 0.25))
+        # Put-call parity: C - P = S - K * exp(-rT)
+        assert call - put == pytest.approx(100 - 95 * math.exp(-0.03 * 0.5))
+
+
 class TestGreeks:
     """Test Greeks calculations."""
 
@@ -249,6 +264,62 @@ class TestGreeks:
         # ITM call delta should be > 0.5
         assert greeks["delta"] > 0.6
 
+    def test_greeks_unrounded(self):
+        """Test that round_output=False returns full-precision values."""
+        raw = calculate_greeks(
+            S=100, K=95, T=1.0, r=0.05, sigma=0.2, option_type="call",
+            round_output=False
+        )
+        rounded = calculate_greeks(
+            S=100, K=95, T=1.0, r=0.05, sigma=0.2, option_type="call"
+        )
+
+        assert raw["delta"] != rounded["delta"]
+        assert round(raw["delta"], 4) == rounded["delta"]
+
+
+class TestGreeksGrid:
+    """Test batched Greeks across a strike grid."""
+
+    @pytest.fixture(params=[True, False], ids=["numba", "numpy"])
+    def grid_backend(self, request, monkeypatch):
+        from structured_products import analytics
+        if request.param and not analytics.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(analytics, "NUMBA_AVAILABLE", request.param)
+
+    def test_grid_matches_scalar_greeks(self, grid_backend):
+        """Test that each grid point matches calculate_greeks."""
+        strikes = np.linspace(50, 150, 11)
+        is_call = np.arange(11) % 2 == 0
+        grid = calculate_greeks_grid(100, strikes, 1.0, 0.05, 0.2, is_call)
+
+        for i, K in enumerate(strikes):
+            option_type = "call" if is_call[i] else "put"
+            expected = calculate_greeks(100, K, 1.0, 0.05, 0.2, option_type)
+            for name, value in expected.items():
+                assert grid[name][i] == pytest.approx(value, abs=1e-4)
+
+    def test_grid_scalar_option_type(self, grid_backend):
+        """Test that a scalar is_call flag applies to every strike."""
+        grid = calculate_greeks_grid(100, [90, 100, 110], 1.0, 0.05, 0.2, False)
+
+        assert np.all(grid["delta"] < 0)
+        assert np.all(grid["gamma"] > 0)
+
+    def test_grid_at_expiration(self):
+        """Test grid Greeks at expiration."""
+        grid = calculate_greeks_grid(100, [90, 110], 0.0, 0.05, 0.2, [True, False])
+
+        assert grid["delta"].tolist() == [1.0, -1.0]
+        assert np.all(grid["gamma"] == 0.0)
+
+    def test_grid_zero_volatility(self):
+        """Test grid Greeks with zero volatility."""
+        grid = calculate_greeks_grid(100, [90, 110], 1.0, 0.05, 0.0)
+
+        assert all(np.all(np.isnan(v)) for v in grid.values())
+
 
 class TestTimeToMaturity:
     """Test time to maturity calculations."""
@@ -279,6 +350,18 @@ class TestTimeToMaturity:
         )
         assert T == 0.0
 
+    def test_estimate_time_to_maturity_unpadded_date(self):
+        """Test that non-zero-padded dates are still accepted."""
+        T = estimate_time_to_maturity(
+            maturity_date_str="2025-1-1",
+            pricing_date_str="2024-01-01"
+        )
+        assert T == pytest.approx(1.0, rel=0.01)
+
+    def test_estimate_time_to_maturity_invalid(self):
+        """Test that unparseable dates return None."""
+        assert estimate_time_to_maturity("not-a-date", "2024-01-01") is None
+
 
 class TestStructuredProductGreeks:
     """Test structured product Greeks analysis."""
@@ -413,6 +496,16 @@ class TestRiskMetrics:
         assert result["sharpe_ratio"] is None
 
 
+    def test_value_at_risk_matches_lower_percentile(self):
+        """Test VaR uses the lower order statistic of the returns."""
+        rng = np.random.default_rng(42)
+        returns = rng.normal(0, 0.01, 500).tolist()
+        result = calculate_risk_metrics([], returns_data=returns, round_output=False)
+
+        assert result["value_at_risk_95"] == np.percentile(returns, 5, method="lower")
+        assert result["value_at_risk_99"] == np.percentile(returns, 1, method="lower")
+
+
 class TestAnalyticsSummary:
     """Test full analytics summary generation."""
 
@@ -478,5 +571,17 @@ class TestAnalyticsSummary:
         assert "error" in result
 
 
+class TestImportCost:
+    """Test that heavy dependencies are imported lazily."""
+
+    def test_import_does_not_load_scipy_stats(self):
+        """Test that importing analytics does not pull in scipy.stats."""
+        code = (
+            "import sys, structured_products.analytics; "
+            "sys.exit('scipy.stats' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
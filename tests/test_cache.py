@@ -0,0 +1,78 @@
+"""
+Unit tests for cache module.
+"""
+
+import os
+import time
+
+import pytest
+from structured_products.cache import PriceCache
+
+
+PRICE = {"actual_date": "2024-01-12", "adj_close": 4783.83}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PriceCache(cache_dir=str(tmp_path), ttl_seconds=3600)
+
+
+class TestPerDateEntries:
+    """Test per-date get_many/set_many entries."""
+
+    def test_round_trip(self, cache):
+        """Test that stored dates are returned, including None results."""
+        stored = cache.set_many("^GSPC", 7, {"2024-01-15": PRICE, "2024-01-20": None})
+
+        assert stored == 2
+        assert cache.get_many("^GSPC", ["2024-01-15", "2024-01-20"], 7) == {
+            "2024-01-15": PRICE,
+            "2024-01-20": None,
+        }
+
+    def test_partial_hit(self, cache):
+        """Test that only cached dates are returned for overlapping requests."""
+        cache.set_many("^GSPC", 7, {"2024-01-15": PRICE})
+
+        hits = cache.get_many("^GSPC", ["2024-01-15", "2024-02-15"], 7)
+
+        assert hits == {"2024-01-15": PRICE}
+
+    def test_key_includes_symbol_and_lookback(self, cache):
+        """Test that entries are not shared across symbols or lookbacks."""
+        cache.set_many("^GSPC", 7, {"2024-01-15": PRICE})
+
+        assert cache.get_many("^RUT", ["2024-01-15"], 7) == {}
+        assert cache.get_many("^GSPC", ["2024-01-15"], 3) == {}
+
+    def test_expired_entries_are_removed(self, cache, tmp_path):
+        """Test that entries older than the TTL miss and are deleted."""
+        cache.set_many("^GSPC", 7, {"2024-01-15": PRICE})
+        (cache_file,) = tmp_path.glob("*.json")
+        old = time.time() - 7200
+        os.utime(cache_file, (old, old))
+
+        assert cache.get_many("^GSPC", ["2024-01-15"], 7) == {}
+        assert not cache_file.exists()
+
+    def test_disabled_cache(self):
+        """Test that a disabled cache stores and returns nothing."""
+        cache = PriceCache(enabled=False)
+
+        assert cache.set_many("^GSPC", 7, {"2024-01-15": PRICE}) == 0
+        assert cache.get_many("^GSPC", ["2024-01-15"], 7) == {}
+
+
+class TestStats:
+    """Test cache statistics and clearing."""
+
+    def test_stats_and_clear(self, cache):
+        """Test entry counts before and after clearing."""
+        cache.set_many("^GSPC", 7, {"2024-01-15": PRICE, "2024-01-16": PRICE})
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["valid_entries"] == 2
+
+        assert cache.clear() == 2
+        assert cache.get_stats()["total_entries"] == 0
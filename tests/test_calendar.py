@@ -2,19 +2,24 @@
 Unit tests for business day calendar module.
 """
 
+import numpy as np
 import pytest
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from structured_products.calendar import (
     Market,
     is_weekend,
     is_trading_day,
+    are_trading_days,
     next_trading_day,
     previous_trading_day,
     get_settlement_date,
+    get_trading_days_between,
+    count_trading_days_between,
     adjust_to_trading_day,
     is_us_holiday,
     is_uk_holiday,
     infer_market_from_symbol,
+    validate_date_business_day,
     validate_settlement_date,
 )
 
@@ -76,6 +81,16 @@ class TestUSHolidays:
         regular_day = datetime(2024, 3, 15)
         assert not is_us_holiday(regular_day)
 
+    def test_observed_holidays(self):
+        """Test Monday-observed New Year's and Christmas."""
+        assert is_us_holiday(datetime(2017, 1, 2))  # Jan 1 2017 was Sunday
+        assert is_us_holiday(datetime(2022, 12, 26))  # Dec 25 2022 was Sunday
+
+    def test_accepts_date_objects(self):
+        """Test that plain date objects are supported."""
+        assert is_us_holiday(date(2024, 11, 28))
+        assert not is_us_holiday(date(2024, 11, 27))
+
 
 class TestUKHolidays:
     """Test UK holiday detection."""
@@ -140,6 +155,35 @@ class TestTradingDayDetection:
         assert is_trading_day(july_4th, Market.GENERIC)
 
 
+class TestBulkTradingDays:
+    """Test the bulk trading day check."""
+
+    @pytest.fixture(params=["numba", "numpy"])
+    def backend(self, request, monkeypatch):
+        from structured_products import calendar
+        if request.param == "numba" and not calendar.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        if request.param == "numpy":
+            monkeypatch.setattr(calendar, "NUMBA_AVAILABLE", False)
+        return request.param
+
+    @pytest.mark.parametrize("market", [Market.NYSE, Market.LSE, Market.GENERIC])
+    def test_matches_is_trading_day(self, backend, market):
+        """Test bulk results agree with the scalar check over several years."""
+        days = [date(2022, 1, 1) + timedelta(days=i) for i in range(1100)]
+        expected = [is_trading_day(d, market) for d in days]
+        assert are_trading_days(days, market).tolist() == expected
+
+    def test_accepts_ordinals(self, backend):
+        """Test that integer ordinals are accepted directly."""
+        ordinals = np.array([date(2024, 7, 4).toordinal(), date(2024, 7, 5).toordinal()])
+        assert are_trading_days(ordinals).tolist() == [False, True]
+
+    def test_empty(self, backend):
+        """Test that no dates give an empty result."""
+        assert are_trading_days([]).size == 0
+
+
 class TestNextTradingDay:
     """Test next trading day calculation."""
 
@@ -182,6 +226,44 @@ class TestPreviousTradingDay:
         assert prev_day == datetime(2024, 1, 10)
 
 
+class TestTradingDaysBetween:
+    """Test trading day ranges."""
+
+    def test_trading_days_skip_weekend_and_holiday(self):
+        """Test range over a weekend and MLK Day."""
+        days = get_trading_days_between(
+            datetime(2024, 1, 12), datetime(2024, 1, 17), Market.NYSE
+        )
+        assert days == [
+            datetime(2024, 1, 12),
+            datetime(2024, 1, 16),
+            datetime(2024, 1, 17),
+        ]
+
+    def test_trading_days_reversed_range(self):
+        """Test that reversed bounds are swapped."""
+        assert get_trading_days_between(
+            datetime(2024, 1, 10), datetime(2024, 1, 8)
+        ) == [datetime(2024, 1, 8), datetime(2024, 1, 9), datetime(2024, 1, 10)]
+
+    def test_count_trading_days_full_year(self):
+        """Test count of NYSE trading days in 2024."""
+        count = count_trading_days_between(
+            datetime(2024, 1, 1), datetime(2024, 12, 31), Market.NYSE
+        )
+        assert count == len(get_trading_days_between(
+            datetime(2024, 1, 1), datetime(2024, 12, 31), Market.NYSE
+        ))
+        assert count == 254
+
+    def test_count_trading_days_generic(self):
+        """Test that the generic calendar counts every weekday."""
+        count = count_trading_days_between(
+            datetime(2024, 7, 1), datetime(2024, 7, 7), Market.GENERIC
+        )
+        assert count == 5
+
+
 class TestSettlementDate:
     """Test settlement date calculation."""
 
@@ -211,6 +293,24 @@ class TestSettlementDate:
         settlement = get_settlement_date(monday, settlement_days=0, market=Market.NYSE)
         assert settlement == monday
 
+    def test_settlement_from_weekend_trade_date(self):
+        """Test T+1 from Saturday lands on the first trading day after Monday."""
+        saturday = datetime(2024, 3, 9)
+        settlement = get_settlement_date(saturday, settlement_days=1, market=Market.NYSE)
+        assert settlement == datetime(2024, 3, 11)
+
+    def test_settlement_preserves_time_of_day(self):
+        """Test that the trade time is carried to the settlement date."""
+        trade = datetime(2024, 3, 8, 15, 30)
+        settlement = get_settlement_date(trade, settlement_days=2, market=Market.NYSE)
+        assert settlement == datetime(2024, 3, 12, 15, 30)
+
+    def test_settlement_outside_index_range(self):
+        """Test dates outside the precomputed index use the fallback path."""
+        trade = datetime(1985, 7, 3)
+        settlement = get_settlement_date(trade, settlement_days=2, market=Market.NYSE)
+        assert settlement == datetime(1985, 7, 8)
+
 
 class TestAdjustToTradingDay:
     """Test date adjustment to trading days."""
@@ -255,6 +355,46 @@ class TestAdjustToTradingDay:
         adjusted = adjust_to_trading_day(monday, Market.NYSE)
         assert adjusted == monday
 
+    def test_nearest_convention_holiday(self):
+        """Test NEAREST from a Monday holiday picks the following Tuesday."""
+        mlk_day = datetime(2024, 1, 15, 9, 30)
+        adjusted = adjust_to_trading_day(mlk_day, convention="nearest", market=Market.NYSE)
+        assert adjusted == datetime(2024, 1, 16, 9, 30)
+
+    def test_modified_following_crosses_month(self):
+        """Test MODIFIED_FOLLOWING falls back to preceding at month end."""
+        saturday = datetime(2024, 8, 31)
+        adjusted = adjust_to_trading_day(
+            saturday, convention="modified_following", market=Market.NYSE
+        )
+        assert adjusted == datetime(2024, 8, 30)
+
+
+class TestBusinessDayValidation:
+    """Test business day validation warnings."""
+
+    def test_trading_day_has_no_warnings(self):
+        """Test that a normal trading day is valid."""
+        assert validate_date_business_day(datetime(2024, 1, 16)) == []
+
+    def test_weekend_warnings(self):
+        """Test that a Saturday warns about the weekend."""
+        warnings = validate_date_business_day(
+            datetime(2024, 1, 13), date_type="pricing_date"
+        )
+        assert warnings[0] == "pricing_date (2024-01-13) falls on Saturday (weekend)"
+
+    def test_holiday_warning(self):
+        """Test that a holiday warns with the market's holiday name."""
+        warnings = validate_date_business_day(date(2024, 12, 26), Market.LSE)
+        assert warnings == ["unknown (2024-12-26) falls on a UK market holiday"]
+
+    def test_cached_result_is_a_fresh_list(self):
+        """Test that mutating a result does not affect later calls."""
+        first = validate_date_business_day(datetime(2024, 7, 4))
+        first.append("extra")
+        assert validate_date_business_day(datetime(2024, 7, 4)) == first[:1]
+
 
 class TestMarketInference:
     """Test market inference from symbols."""
@@ -284,6 +424,21 @@ class TestMarketInference:
         market = infer_market_from_symbol("000001.SS")
         assert market == Market.SSE
 
+    def test_exchange_suffixes(self):
+        """Test Yahoo exchange suffixes map to their markets."""
+        assert infer_market_from_symbol("0700.HK") == Market.HKEX
+        assert infer_market_from_symbol("vod.l") == Market.LSE
+        assert infer_market_from_symbol("7203.T") == Market.TSE
+
+    def test_us_stock_infers_nyse(self):
+        """Test plain and share-class tickers default to NYSE."""
+        assert infer_market_from_symbol("AAPL") == Market.NYSE
+        assert infer_market_from_symbol("BRK.B") == Market.NYSE
+
+    def test_unknown_index_generic(self):
+        """Test unknown index symbol infers GENERIC."""
+        assert infer_market_from_symbol("^STOXX50E") == Market.GENERIC
+
     def test_unknown_symbol_generic(self):
         """Test unknown symbol infers GENERIC."""
         market = infer_market_from_symbol("UNKNOWN")
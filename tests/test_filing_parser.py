@@ -0,0 +1,397 @@
+"""
+Tests for structured_products.filing_parser.
+
+Uses short synthetic filing text; each test targets one tier or helper.
+"""
+
+import threading
+
+import pytest
+
+from structured_products import filing_parser
+from structured_products.filing_parser import (
+    detect_issuer,
+    parse_filing,
+    _tier3_window,
+    _ISSUER_HEADER_CHARS,
+    _TIER3_WINDOW_CHARS,
+)
+
+
+# ---------------------------------------------------------------------------
+# detect_issuer() tests
+# ---------------------------------------------------------------------------
+class TestDetectIssuer:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        filing_parser.clear_parse_cache()
+        yield
+        filing_parser.clear_parse_cache()
+
+    def test_detects_issuer(self):
+        assert detect_issuer("Issued by GS Finance Corp.") == "Goldman Sachs"
+
+    def test_case_insensitive(self):
+        assert detect_issuer("UBS ag, London Branch") == "UBS"
+
+    def test_no_issuer(self):
+        assert detect_issuer("A note with no recognizable issuer") is None
+
+    def test_cover_page_issuer_wins(self):
+        filler = "x" * _ISSUER_HEADER_CHARS
+        text = "Citigroup Global Markets Holdings Inc." + filler + "GS Finance Corp."
+        assert detect_issuer(text) == "Citigroup"
+
+    def test_falls_back_to_full_text(self):
+        filler = "x" * _ISSUER_HEADER_CHARS
+        assert detect_issuer(filler + "Barclays Bank PLC") == "Barclays"
+
+    def test_repeat_detection_is_memoized(self, monkeypatch):
+        text = "Issued by GS Finance Corp."
+        assert detect_issuer(text) == "Goldman Sachs"
+        monkeypatch.setattr(
+            filing_parser, "_detect_issuer_in",
+            lambda text: pytest.fail("issuer patterns re-scanned"),
+        )
+        assert detect_issuer(text) == "Goldman Sachs"
+
+    def test_cache_distinguishes_tail(self):
+        filler = "x" * _ISSUER_HEADER_CHARS
+        assert detect_issuer(filler + "Barclays Bank PLC") == "Barclays"
+        assert detect_issuer(filler + "Citibank, N.A.") == "Citigroup"
+
+
+# ---------------------------------------------------------------------------
+# Tier 3 window tests
+# ---------------------------------------------------------------------------
+class TestTier3Window:
+    def test_short_text_is_not_sliced(self):
+        text = "Summary of terms"
+        assert _tier3_window(text) is text
+
+    def test_window_extends_past_anchor(self):
+        text = "cover " * 10 + "Key Terms " + "1,234.56 " * _TIER3_WINDOW_CHARS
+        window = _tier3_window(text)
+        assert window.startswith("cover")
+        assert len(window) >= text.index("Key Terms") + _TIER3_WINDOW_CHARS
+        # Cut at the next whitespace, never through a number
+        assert text[len(window)] == " "
+        assert window.endswith(" 1,234.56")
+
+    def test_value_at_cut_is_not_truncated(self, monkeypatch):
+        text = "x " * 500 + "Initial Value: $1,234.56 " + "x " * 500
+        monkeypatch.setattr(filing_parser, "_TIER3_WINDOW_CHARS", text.index("34.56"))
+        filing = parse_filing(text, is_html=False, issuer="Nobody", use_cache=False)
+        assert filing.initial_price == 1234.56
+
+    def test_match_at_window_edge_rescans_full_text(self, monkeypatch):
+        text = (
+            "x " * 500 + "Initial price: $5.00 " + "x " * 500
+            + "Initial Value: $7" + "\xa0" + "x " * 500
+        )
+        monkeypatch.setattr(filing_parser, "_TIER3_WINDOW_CHARS", text.index("$7") + 1)
+        window = _tier3_window(text)
+        assert window.endswith("$7")
+
+        scanned = []
+        extract = filing_parser._extract_generic_initial_and_threshold
+        monkeypatch.setattr(
+            filing_parser, "_extract_generic_initial_and_threshold",
+            lambda t: scanned.append(len(t)) or extract(t),
+        )
+        filing = parse_filing(text, is_html=False, issuer="Nobody", use_cache=False)
+        assert filing.initial_price == 7.0
+        assert scanned == [len(window), len(text)]
+
+    def test_full_text_fallback(self):
+        filler = "x " * _TIER3_WINDOW_CHARS
+        text = (
+            "Summary: Initial Value $100.00 " + filler
+            + "each note has a stated principal amount of $1,000"
+        )
+        filing = parse_filing(text, is_html=False, issuer="Nobody")
+        assert filing.initial_price == 100.0
+        assert filing.notional == 1000.0
+
+
+# ---------------------------------------------------------------------------
+# Hyperscan prefilter tests
+# ---------------------------------------------------------------------------
+@pytest.mark.skipif(
+    not filing_parser.HYPERSCAN_AVAILABLE, reason="hyperscan not installed"
+)
+class TestPrefilter:
+    def _large_text(self):
+        filler = "the notes are linked to the underlier " * 5000
+        return filler + "Issued by UBS AG. Trigger price $70.00 " + filler
+
+    def test_rules_out_absent_patterns(self):
+        text = self._large_text()
+        hits = filing_parser._prefilter_hits(text)
+        assert filing_parser._INITIAL_VALUE_RE._id not in hits
+        assert filing_parser._INITIAL_VALUE_RE.search(text) is None
+
+    def test_same_results_as_re(self, monkeypatch):
+        text = self._large_text()
+        with_prefilter = parse_filing(text, is_html=False, use_cache=False).to_dict()
+        monkeypatch.setattr(filing_parser, "HYPERSCAN_AVAILABLE", False)
+        without = parse_filing(text, is_html=False, use_cache=False).to_dict()
+        assert without == with_prefilter
+        assert with_prefilter["issuer"] == "UBS"
+        assert with_prefilter["threshold_dollar"] == 70.0
+
+    @pytest.mark.parametrize("mention, issuer", [
+        ("UBS\x1cFinancial", "UBS"),
+        ("Goldman\x1fSachs & Co", "Goldman Sachs"),
+        ("C\u0131t\u0131bank", "Citigroup"),
+    ])
+    def test_characters_hyperscan_misreads_fall_back_to_re(self, mention, issuer):
+        text = "the notes are linked to the underlier " * 5000 + mention
+        assert filing_parser._prefilter_hits(text) is None
+        assert detect_issuer(text) == issuer
+
+    def test_issuer_patterns_share_one_scan(self, monkeypatch):
+        text = self._large_text()
+        db = filing_parser._get_prefilter_db()
+        scans = []
+
+        class CountingDB:
+            def scan(self, data, **kwargs):
+                scans.append(len(data))
+                return db.scan(data, **kwargs)
+
+        monkeypatch.setattr(filing_parser, "_get_prefilter_db", lambda: CountingDB())
+        monkeypatch.setattr(filing_parser, "_prefilter_local", threading.local())
+        config = filing_parser.ISSUER_CONFIGS_COMPILED["UBS"]
+        result = filing_parser._extract_with_issuer_regex(text, config)
+        assert result["threshold_dollar"]["value"] == 70.0
+        assert len(scans) == 1
+
+
+class TestRequiredLiteral:
+    @pytest.mark.parametrize("pattern, literal", [
+        (r"Downside\s+threshold\s+level[^$]{0,50}\$\s*([0-9,]+)", "threshold"),
+        (r"automatic(?:ally)?\s+call(?:ed)?", "automatic"),
+        (r"[Pp]rincipal\s+[Aa]mount", "rincipal"),
+        (r"J\.?P\.?\s*Morgan", "morgan"),
+        (r"Calls?\s+level", "level"),
+        (r"key\s+terms|summary", None),
+        (r"UBS\s+AG", None),
+    ])
+    def test_required_literal(self, pattern, literal):
+        assert filing_parser._required_literal(
+            pattern, filing_parser._LITERAL_MIN_LEN
+        ) == literal
+
+    def test_missing_literal_skips_regex(self):
+        text = "x" * filing_parser._LITERAL_MIN_CHARS + " Barclays Bank PLC"
+        assert filing_parser._ruled_out(filing_parser._INITIAL_VALUE_RE, text)
+        assert detect_issuer(text) == "Barclays"
+
+    def test_literal_scan_matches_substring_checks(self, monkeypatch):
+        text = "x" * 1_000 + " Contingent coupon, Initial Value and principal amount"
+        found = filing_parser._TextProfile(text).literals
+        monkeypatch.setattr(filing_parser, "AHOCORASICK_AVAILABLE", False)
+        assert filing_parser._TextProfile(text).literals == found
+        assert {"contingent", "initial", "principal"} <= found
+        assert "threshold" not in found
+
+    def test_case_variants_are_not_ruled_out(self):
+        pad = "x" * filing_parser._LITERAL_MIN_CHARS
+        for text in (pad + " INITIAL VALUE $5", pad + " \u0130nitial Value $5"):
+            m = filing_parser._INITIAL_VALUE_RE.search(text)
+            assert m is not None and m.group(1) == "5"
+
+
+class TestAsciiFastPath:
+    PAD = "x" * 1_000
+
+    def test_ascii_text_scans_folded_copy(self):
+        text = self.PAD + " Initial Value $5"
+        pattern = filing_parser._INITIAL_VALUE_RE
+        regex, subject = filing_parser._scan_target(pattern, text)
+        assert regex is pattern.ascii_regex
+        assert subject == text.lower()
+        assert pattern.search(text).span(1) == (len(text) - 1, len(text))
+
+    def test_matches_come_from_original_text(self):
+        text = self.PAD + " Call Level: $5 and CALL LEVEL $6"
+        pattern = filing_parser._CALL_LEVEL_KEYWORD_RE
+        m = pattern.search(text)
+        assert m.group(1) == "Call Level"
+        assert m.string is text
+        assert [m.group() for m in pattern.finditer(text)] == ["Call Level", "CALL LEVEL"]
+
+    def test_fold_pattern_keeps_escapes(self):
+        assert filing_parser._fold_pattern(r"Initial\s+\S[Pp]RICE\$") == r"initial\s+\S[pp]rice\$"
+
+    @pytest.mark.parametrize("space", ["\xa0", "\x1f"])
+    def test_unicode_whitespace_keeps_unicode_regex(self, space):
+        text = self.PAD + f" Initial{space}Value $5"
+        pattern = filing_parser._INITIAL_VALUE_RE
+        assert filing_parser._scan_target(pattern, text) == (pattern.regex, text)
+        assert pattern.search(text).group(1) == "5"
+
+
+# ---------------------------------------------------------------------------
+# parse_filing() result cache tests
+# ---------------------------------------------------------------------------
+class TestParseCache:
+    TEXT = "Issued by GS Finance Corp. Initial share price: $123.45"
+
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        filing_parser.clear_parse_cache()
+        yield
+        filing_parser.clear_parse_cache()
+
+    def test_repeat_parse_skips_pipeline(self, monkeypatch):
+        first = parse_filing(self.TEXT, is_html=False)
+        calls = []
+        monkeypatch.setattr(
+            filing_parser, "_parse_filing_uncached",
+            lambda *args: calls.append(args),
+        )
+        second = parse_filing(self.TEXT, is_html=False)
+        assert calls == []
+        assert second.to_dict() == first.to_dict()
+        assert second.initial_price == 123.45
+
+    def test_cached_result_is_a_copy(self):
+        first = parse_filing(self.TEXT, is_html=False)
+        first.sources["initial_price"] = "tampered"
+        assert parse_filing(self.TEXT, is_html=False).sources["initial_price"] != "tampered"
+
+    def test_issuer_is_part_of_key(self):
+        auto = parse_filing(self.TEXT, is_html=False)
+        other = parse_filing(self.TEXT, is_html=False, issuer="UBS")
+        assert auto.issuer == "Goldman Sachs"
+        assert other.issuer == "UBS"
+
+
+# ---------------------------------------------------------------------------
+# HTML-to-text conversion tests
+# ---------------------------------------------------------------------------
+class TestHtmlConversion:
+    def test_html_converted_once(self, monkeypatch):
+        from structured_products import parser
+
+        calls = []
+        convert = parser.extract_text_from_html
+
+        def counting(content):
+            calls.append(content)
+            return convert(content)
+
+        monkeypatch.setattr(parser, "extract_text_from_html", counting)
+        monkeypatch.setattr(filing_parser, "extract_text_from_html", counting)
+
+        html = "<html><body><p>Issued by GS Finance Corp. 12% per annum</p></body></html>"
+        parse_filing(html, is_html=True, use_cache=False)
+        assert len(calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# Tier short-circuit tests
+# ---------------------------------------------------------------------------
+class TestTierShortCircuit:
+    ROWS = [
+        ("Initial share price", "$50.00"),
+        ("Downside threshold level", "$35.00"),
+        ("Call threshold level", "$50.00"),
+        ("Contingent quarterly coupon", "$2.00"),
+        ("Contingent coupon rate", "8.00% per annum"),
+        ("Stated principal amount", "$1,000"),
+    ]
+
+    def _html(self, rows, body):
+        cells = "".join(f"<tr><td>{a}</td><td>{b}</td></tr>" for a, b in rows)
+        return f"<html><body><table>{cells}</table><p>{body}</p></body></html>"
+
+    def test_complete_tables_skip_regex_tiers(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("regex tier should not run")
+
+        for name in (
+            "_extract_with_issuer_regex",
+            "_extract_generic_initial_and_threshold",
+            "_extract_generic_autocall",
+            "_extract_generic_coupon_rate",
+            "_extract_generic_coupon_payment",
+            "_extract_generic_notional",
+        ):
+            monkeypatch.setattr(filing_parser, name, fail)
+
+        filing = parse_filing(
+            self._html(self.ROWS, "Initial Value $10"), True, "UBS", use_cache=False
+        )
+        assert filing.initial_price == 50.0
+        assert filing.notional == 1000.0
+
+    def test_missing_field_still_uses_regex(self):
+        filing = parse_filing(
+            self._html(self.ROWS[:-1], "principal amount of $25"),
+            True, "UBS", use_cache=False,
+        )
+        assert filing.notional == 25.0
+        assert filing.sources["notional"] == "regex_issuer"
+
+
+# ---------------------------------------------------------------------------
+# _pick() tier selection tests
+# ---------------------------------------------------------------------------
+class TestPick:
+    def test_first_available_tier_wins(self):
+        sources = {}
+        value = filing_parser._pick(sources, "notional", (
+            ("table", None),
+            ("regex_issuer", {"value": 1000.0, "source": "regex_issuer"}),
+            ("regex_generic", 10.0),
+        ))
+        assert value == 1000.0
+        assert sources == {"notional": "regex_issuer"}
+
+    def test_plain_and_dict_values(self):
+        sources = {}
+        assert filing_parser._pick(sources, "a", (("table", 0.0),)) == 0.0
+        assert filing_parser._pick(
+            sources, "b", (("table", None), ("regex_generic", {"value": 5.0}))
+        ) == 5.0
+        assert filing_parser._pick(sources, "c", (("table", None),)) is None
+        assert sources == {"a": "table", "b": "regex_generic"}
+
+
+# ---------------------------------------------------------------------------
+# parse_filings_batch() tests
+# ---------------------------------------------------------------------------
+class TestParseFilingsBatch:
+    FILINGS = [
+        ("Issued by GS Finance Corp. Initial share price: $123.45", False, "Auto-detect"),
+        ("UBS AG London Branch. Trigger price $70.00", False, "Auto-detect"),
+        ("<p>No recognizable issuer</p>", True, "Auto-detect"),
+    ]
+
+    def test_matches_serial_parse_in_order(self):
+        batch = filing_parser.parse_filings_batch(self.FILINGS, max_workers=2, chunksize=1)
+        serial = [parse_filing(*args, use_cache=False) for args in self.FILINGS]
+        assert [f.to_dict() for f in batch] == [f.to_dict() for f in serial]
+        assert [f.issuer for f in batch] == ["Goldman Sachs", "UBS", None]
+
+    def test_empty_batch(self):
+        assert filing_parser.parse_filings_batch([]) == []
+
+    def test_after_numba_parallel_kernel(self):
+        """Workers are spawned, so numba's thread pool cannot deadlock them."""
+        numba = pytest.importorskip("numba")
+        np = pytest.importorskip("numpy")
+
+        @numba.njit(parallel=True)
+        def total(values):
+            acc = 0.0
+            for i in numba.prange(values.size):
+                acc += values[i]
+            return acc
+
+        assert total(np.ones(1000)) == 1000.0
+        batch = filing_parser.parse_filings_batch(self.FILINGS, max_workers=2, chunksize=1)
+        assert [f.issuer for f in batch] == ["Goldman Sachs", "UBS", None]
@@ -5,6 +5,7 @@ Unit tests for security identifiers module.
 import pytest
 from structured_products.identifiers import (
     validate_cusip,
+    validate_cusips,
     validate_isin,
     validate_sedol,
     extract_cusip,
@@ -50,6 +51,17 @@ class TestCUSIPValidation:
         assert validate_cusip("037833100")
         assert validate_cusip("02079k107")  # lowercase k
 
+    def test_validate_cusips_matches_single(self):
+        """Test that batch validation agrees with validate_cusip."""
+        cusips = ["037833100", "594918104", "037833101", "0378331", "03783310!", "abcdefgh1"]
+        flags = validate_cusips(cusips)
+        assert flags.tolist() == [validate_cusip(c) for c in cusips]
+        assert flags.tolist()[:3] == [True, True, False]
+
+    def test_validate_cusips_empty(self):
+        """Test batch validation of an empty list."""
+        assert validate_cusips([]).size == 0
+
 
 class TestISINValidation:
     """Test ISIN validation and check digit calculation."""
@@ -268,6 +280,17 @@ class TestExtractAllIdentifiers:
         assert identifiers["cusip"] == "037833100"
         assert identifiers["isin"] == "US0378331005"
 
+    def test_extract_all_later_keyword_occurrence(self):
+        """Test that labels after an unlabeled keyword mention are found."""
+        text = (
+            "The cusip and isin are listed below. "
+            "CUSIP No.: 037833100 İ ISIN: US0378331005"
+        )
+        identifiers = extract_all_identifiers(text, is_html=False)
+        assert identifiers["cusip"] == "037833100"
+        assert identifiers["isin"] == "US0378331005"
+        assert extract_cusip(text.replace("İ", "")) == "037833100"
+
 
 class TestCUSIPToISIN:
     """Test CUSIP to ISIN conversion."""
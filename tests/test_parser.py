@@ -4,10 +4,14 @@ Unit tests for parser module.
 
 import unittest
 from datetime import datetime
+from unittest import mock
+
+from structured_products import parser as parser_module
 from structured_products.parser import (
     extract_symbols,
     extract_dates,
     extract_text_from_html,
+    iter_text_from_html,
     extract_date_from_text
 )
 
@@ -68,6 +72,40 @@ class TestSymbolExtraction(unittest.TestCase):
 
         self.assertIn("S&P 500", result["indices"])
 
+    def test_overlapping_index_names(self):
+        """Test that only the longest of overlapping index names is detected."""
+        content = "linked to the Nasdaq-100 Index and the FTSE China A50 Index"
+        result = extract_symbols(content, is_html=False)
+
+        self.assertEqual(result["indices"], ["FTSE CHINA A50", "NASDAQ-100"])
+        self.assertEqual(result["yahoo_symbols"], ["^FTXIN9", "^NDX"])
+
+    def test_index_names_match_whole_words(self):
+        """Test that index names inside longer words are not detected."""
+        content = "Downside risk for institutional investors; see the Dow."
+        result = extract_symbols(content, is_html=False)
+
+        self.assertEqual(result["indices"], ["DOW"])
+
+    def test_index_matching_without_automaton(self):
+        """Test that the substring fallback finds the same indices."""
+        content = "linked to the Nasdaq-100 Index, the Dow, the Nasdaq and the Euro Stoxx 50"
+        expected = extract_symbols(content, is_html=False)
+        with mock.patch.object(parser_module, "_INDEX_AUTOMATON", None):
+            result = extract_symbols(content, is_html=False)
+
+        self.assertEqual(result, expected)
+
+    def test_index_names_across_chunk_boundaries(self):
+        """Test that names split between upper-cased chunks are found."""
+        content = "linked to the Euro Stoxx 50 and the Russell 2000 or FTSE China A50"
+        expected = extract_symbols(content, is_html=False)
+        for size in range(1, 12):
+            with mock.patch.object(parser_module, "_INDEX_CHUNK_CHARS", size):
+                result = extract_symbols(content, is_html=False)
+            self.assertEqual(result, expected)
+        self.assertIn("EURO STOXX 50", result["indices"])
+
     def test_empty_content(self):
         """Test extraction from empty content."""
         result = extract_symbols("", is_html=False)
@@ -83,6 +121,17 @@ class TestSymbolExtraction(unittest.TestCase):
         self.assertIn("S&P 500", result["indices"])
         self.assertIn("RUSSELL 2000", result["indices"])
 
+    def test_pre_extracted_text_skips_conversion(self):
+        """Test that passing text avoids converting the HTML again."""
+        html = "<html><body><p>Linked to the S&amp;P 500 Index</p></body></html>"
+        text = extract_text_from_html(html)
+        with mock.patch.object(parser_module, "extract_text_from_html") as convert:
+            result = extract_symbols(html, is_html=True, text=text)
+            extract_dates(html, is_html=True, text=text)
+
+        convert.assert_not_called()
+        self.assertIn("^GSPC", result["yahoo_symbols"])
+
 
 class TestDateExtraction(unittest.TestCase):
     """Test date extraction functionality."""
@@ -128,6 +177,31 @@ class TestDateExtraction(unittest.TestCase):
         self.assertIn("initial_valuation_date", result)
         self.assertIn("final_valuation_date", result)
 
+    def test_keywords_across_lowered_chunks(self):
+        """Test that keywords split between lower-cased chunks are found."""
+        content = "Pricing Date: March 4, 2024. Maturity Date: March 4, 2029"
+        expected = extract_dates(content)
+        for size in range(1, 16):
+            with mock.patch.object(parser_module._LoweredText, "CHUNK_CHARS", size):
+                self.assertEqual(extract_dates(content), expected)
+        self.assertEqual(expected["maturity_date"], "2029-03-04")
+
+    def test_keyword_lookup_matches_regex_scan(self):
+        """Test that the lower-cased keyword lookup and the regex scan agree."""
+        content = "PRICING DATE: TBD. Pricing date: March 4, 2024. Initial Valuation Date: 2024-03-05"
+        for extra in ["", " \u0130ssue Date: 2024-03-06"]:
+            expected = {}
+            for keyword, key, pattern in parser_module._DATE_KEYWORD_PATTERNS:
+                for match in pattern.finditer(content + extra):
+                    parsed = extract_date_from_text(match.group(1))
+                    if parsed:
+                        expected[key] = parsed.date().isoformat()
+                        break
+
+            self.assertEqual(extract_dates(content + extra), expected)
+        self.assertEqual(expected["pricing_date"], "2024-03-04")
+        self.assertEqual(expected["valuation_date"], "2024-03-05")
+
     def test_various_date_formats(self):
         """Test extraction of various date formats."""
         formats = [
@@ -187,6 +261,14 @@ class TestDateParsing(unittest.TestCase):
         # Just ensure it doesn't crash
         self.assertTrue(date is None or isinstance(date, datetime))
 
+    def test_fuzzy_fallback_skipped_without_date_tokens(self):
+        """Test that text without digits or month/day names is not fuzzy-parsed."""
+        with mock.patch.object(parser_module.date_parser, "parse") as parse:
+            self.assertIsNone(extract_date_from_text("to be determined later"))
+        parse.assert_not_called()
+
+        self.assertEqual(extract_date_from_text("in March").month, 3)
+
 
 class TestHTMLExtraction(unittest.TestCase):
     """Test HTML text extraction."""
@@ -226,6 +308,35 @@ class TestHTMLExtraction(unittest.TestCase):
         self.assertIn("Real content", text)
         self.assertNotIn("color:", text)
 
+    def test_whitespace_cleanup_across_tags(self):
+        """Test that whitespace is collapsed across lines and tag boundaries."""
+        html = "<p>Initial  share\r\nprice</p><td>  $1,000 </td>\n\n<b>a</b>b"
+        self.assertEqual(
+            extract_text_from_html(html), "Initial share price $1,000 a b"
+        )
+
+    def test_iter_text_matches_joined_text(self):
+        """Test that streamed phrases join to the extracted text."""
+        html = "<div>One  two\nthree</div><p>four</p>"
+        self.assertEqual(
+            " ".join(iter_text_from_html(html)), extract_text_from_html(html)
+        )
+
+    def test_matches_beautifulsoup_text(self):
+        """Test that the lxml event walk yields BeautifulSoup's strings."""
+        from bs4 import BeautifulSoup
+
+        html = (
+            "<!DOCTYPE html><html><body>a<!-- note -->b <pre> \n </pre>"
+            "<ruby>x<rt>y</rt></ruby><template>t</template>&amp; <?pi z?>"
+            "<textarea>  </textarea>\t<br>\n<script>s()</script>c</body></html>"
+        )
+        soup = BeautifulSoup(html, "lxml")
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        self.assertEqual(parser_module._html_strings(html), list(soup.strings))
+
 
 if __name__ == "__main__":
     unittest.main()
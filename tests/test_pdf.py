@@ -2,6 +2,9 @@
 Unit tests for PDF extraction module.
 """
 
+import os
+import time
+
 import pytest
 from unittest.mock import Mock, patch, mock_open
 from pathlib import Path
@@ -32,6 +35,7 @@ class TestPDFTextExtraction:
     """Test PDF text extraction."""
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_extract_text_from_single_page(self, mock_pdfplumber):
         """Test text extraction from single-page PDF."""
@@ -51,6 +55,7 @@ class TestPDFTextExtraction:
         assert "Test PDF content" in text
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_extract_text_from_multi_page(self, mock_pdfplumber):
         """Test text extraction from multi-page PDF."""
@@ -77,6 +82,7 @@ class TestPDFTextExtraction:
         assert "[Page 2]" in text
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_extract_text_with_max_pages(self, mock_pdfplumber):
         """Test text extraction with max_pages limit."""
@@ -102,6 +108,7 @@ class TestPDFTextExtraction:
         assert "Page 3 content" not in text
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_extract_text_with_tables(self, mock_pdfplumber):
         """Test text extraction includes table data."""
@@ -136,6 +143,7 @@ class TestPDFMetadataExtraction:
     """Test PDF metadata extraction."""
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_extract_metadata(self, mock_pdfplumber):
         """Test metadata extraction from PDF."""
@@ -158,6 +166,7 @@ class TestPDFMetadataExtraction:
         assert metadata["num_pages"] == 2
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_extract_metadata_empty(self, mock_pdfplumber):
         """Test metadata extraction when no metadata present."""
@@ -186,6 +195,7 @@ class TestPDFTypeDetection:
     """Test PDF type detection."""
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_detect_text_pdf(self, mock_pdfplumber):
         """Test detection of text-based PDF."""
@@ -204,6 +214,7 @@ class TestPDFTypeDetection:
         assert pdf_type == "text"
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_detect_image_pdf(self, mock_pdfplumber):
         """Test detection of image-based PDF."""
@@ -232,6 +243,7 @@ class TestReadFilingContent:
     """Test universal file reading function."""
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_read_pdf_file(self, mock_pdfplumber):
         """Test reading PDF file."""
@@ -317,6 +329,7 @@ class TestPDFMaxPages:
     """Test max_pages parameter handling."""
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_read_pdf_with_max_pages(self, mock_pdfplumber):
         """Test reading PDF with max_pages limit."""
@@ -343,6 +356,7 @@ class TestPDFMaxPages:
         assert not is_html
 
     @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', False)
     @patch('pdfplumber.open')
     def test_read_pdf_no_max_pages(self, mock_pdfplumber):
         """Test reading PDF without max_pages limit (all pages)."""
@@ -367,5 +381,142 @@ class TestPDFMaxPages:
         assert "Page 3" in content
 
 
+class TestPageTexts:
+    """Test per-page text and table extraction."""
+
+    def test_pdfplumber_page_without_chars_skipped(self):
+        """Test scanned pages skip text and table extraction."""
+        from structured_products.pdf import _pdfplumber_page_texts
+
+        page = Mock()
+        page.chars = []
+        assert _pdfplumber_page_texts(page) == ("", [])
+        page.extract_text.assert_not_called()
+        page.extract_tables.assert_not_called()
+
+    def test_pdfplumber_page_with_text(self):
+        """Test text pages return their text and tables."""
+        from structured_products.pdf import _pdfplumber_page_texts
+
+        page = Mock()
+        page.chars = [{"text": "P"}]
+        page.extract_text.return_value = "Pricing Date"
+        page.extract_tables.return_value = [[["Strike", "100%"]]]
+        assert _pdfplumber_page_texts(page) == ("Pricing Date", ["Strike\t100%"])
+        page.close.assert_called_once()
+
+
+class TestPyMuPDFExtraction:
+    """Test extraction through PyMuPDF on a real generated PDF."""
+
+    @pytest.fixture
+    def sample_pdf(self, tmp_path):
+        pymupdf = pytest.importorskip("pymupdf")
+        doc = pymupdf.open()
+        for i in range(3):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {i+1} autocallable notes")
+        doc.set_metadata({"title": "Pricing Supplement", "author": "Issuer"})
+        path = tmp_path / "sample.pdf"
+        doc.save(str(path))
+        doc.close()
+        return str(path)
+
+    @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', True)
+    def test_extract_text(self, sample_pdf):
+        """Test text extraction honours max_pages."""
+        text = extract_text_from_pdf(sample_pdf, max_pages=2, use_cache=False)
+        assert "Page 1 autocallable notes" in text
+        assert "Page 2 autocallable notes" in text
+        assert "Page 3" not in text
+
+    @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', True)
+    def test_extract_metadata(self, sample_pdf):
+        """Test metadata is mapped onto the common keys."""
+        metadata = extract_pdf_metadata(sample_pdf)
+        assert metadata["num_pages"] == 3
+        assert metadata["title"] == "Pricing Supplement"
+        assert metadata["author"] == "Issuer"
+        assert metadata["subject"] is None
+
+    @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', True)
+    def test_detect_type(self, sample_pdf):
+        """Test a short text PDF falls under the text threshold."""
+        assert detect_pdf_type(sample_pdf) == "image"
+
+    @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', True)
+    def test_parallel_extraction_matches_serial(self, sample_pdf):
+        """Test the process pool reassembles pages in order."""
+        serial = extract_text_from_pdf(sample_pdf, use_cache=False)
+        with patch('structured_products.pdf._PARALLEL_MIN_PAGES', 1), \
+                patch('structured_products.pdf._get_max_workers', return_value=2):
+            parallel = extract_text_from_pdf(sample_pdf, use_cache=False)
+        assert parallel == serial
+        assert parallel.index("Page 1") < parallel.index("Page 2") < parallel.index("Page 3")
+
+    @patch('os.cpu_count', return_value=8)
+    def test_pool_only_for_long_documents(self, _cpu_count):
+        """Test short documents stay serial and each worker gets enough pages."""
+        from structured_products.pdf import _get_max_workers, _use_process_pool
+
+        assert not _use_process_pool(16)
+        assert _use_process_pool(64)
+        assert _get_max_workers(64) == 4
+        assert _get_max_workers(1000) == 8
+
+    @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', True)
+    def test_text_cache(self, sample_pdf, tmp_path):
+        """Test cached text is reused and keyed by file content and page limit."""
+        cache_dir = tmp_path / "cache"
+        with patch('structured_products.pdf._PDF_TEXT_CACHE_DIR', cache_dir):
+            text = extract_text_from_pdf(sample_pdf)
+            assert len(list(cache_dir.iterdir())) == 1
+
+            with patch('structured_products.pdf._extract_pages_pymupdf') as mock_extract:
+                assert extract_text_from_pdf(sample_pdf) == text
+                mock_extract.assert_not_called()
+
+            assert extract_text_from_pdf(sample_pdf, max_pages=1) != text
+            assert len(list(cache_dir.iterdir())) == 2
+
+    @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', True)
+    def test_text_cache_expires(self, sample_pdf, tmp_path):
+        """Test entries older than the max age are re-extracted."""
+        cache_dir = tmp_path / "cache"
+        with patch('structured_products.pdf._PDF_TEXT_CACHE_DIR', cache_dir):
+            text = extract_text_from_pdf(sample_pdf)
+            (cache_file,) = cache_dir.iterdir()
+            stale = time.time() - 31 * 24 * 3600
+            os.utime(cache_file, (stale, stale))
+
+            assert extract_text_from_pdf(sample_pdf) == text
+            assert cache_file.stat().st_mtime > stale
+
+    @patch('structured_products.pdf.PDF_SUPPORT_AVAILABLE', True)
+    @patch('structured_products.pdf.PYMUPDF_AVAILABLE', True)
+    def test_text_cache_evicts_least_recently_used(self, sample_pdf, tmp_path):
+        """Test the cache stays under its size limit, oldest entries first."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        old_file = cache_dir / "old.txt"
+        old_file.write_bytes(b"x" * 10_000)
+        old = time.time() - 3600
+        os.utime(old_file, (old, old))
+
+        with patch('structured_products.pdf._PDF_TEXT_CACHE_DIR', cache_dir), \
+                patch('structured_products.pdf._PDF_TEXT_CACHE_MAX_BYTES', 10_000):
+            extract_text_from_pdf(sample_pdf, max_pages=1)
+
+        remaining = list(cache_dir.iterdir())
+        assert old_file not in remaining
+        assert len(remaining) == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
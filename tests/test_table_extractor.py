@@ -66,6 +66,16 @@ class TestParseValue:
         result = parse_value("9.40% per annum")
         assert result["pct"] == 9.4
 
+    def test_date_inside_text(self):
+        result = parse_value("Settles on 1/15/2025, or June 3, 2025 if postponed")
+        assert result["date"] == "2025-01-15"
+        assert parse_value("Quarterly, on the 15th")["date"] is None
+
+    def test_invalid_date(self):
+        result = parse_value("February 30, 2025")
+        assert result["date"] is None
+        assert result["text"] == "February 30, 2025"
+
 
 # ---------------------------------------------------------------------------
 # _looks_like_label() tests
@@ -89,6 +99,9 @@ class TestLooksLikeLabel:
     def test_long_paragraph(self):
         assert _looks_like_label("x" * 130) is False
 
+    def test_label_starting_with_digit(self):
+        assert _looks_like_label("10-year Treasury rate")
+
     def test_single_char(self):
         assert _looks_like_label("X") is False
 
@@ -268,6 +281,21 @@ class TestExtractTableKeyValuePairs:
         pairs = extract_table_key_value_pairs("<html><body><p>No tables here</p></body></html>")
         assert pairs == []
 
+    def test_lxml_tree_matches_beautifulsoup(self, monkeypatch):
+        """Walking lxml's tree gives the same pairs as the BeautifulSoup fallback."""
+        from structured_products import table_extractor
+
+        html = (
+            GOLDMAN_SACHS_HTML + UBS_HTML
+            + "<table><tr><td>Trigger<!-- note --> value<script>x()</script></td>"
+            "<td>$70.00</td></tr><template><tr><td>Issuer</td><td>Hidden</td></tr>"
+            "</template><tr><td><strong>Coupon rate:</strong> 8.00%</td></tr></table>"
+        )
+        expected = extract_table_key_value_pairs(html)
+        monkeypatch.setattr(table_extractor, "_parse_tables", lambda html: None)
+        assert extract_table_key_value_pairs(html) == expected
+        assert any(p["label"] == "Coupon rate" for p in expected)
+
 
 # ---------------------------------------------------------------------------
 # match_labels_to_fields() tests
@@ -317,6 +345,42 @@ class TestMatchLabelsToFields:
         # "initial share price" matches the first pattern in LABEL_MAP["initial_price"]
         assert matched["initial_price"]["confidence"] >= 0.9
 
+    def test_confidence_uses_best_pattern_not_leftmost(self):
+        """A higher-priority pattern later in the label still sets confidence."""
+        pairs = [{
+            "label": "Trigger value (downside threshold level)",
+            "value": parse_value("$70.00"),
+            "pattern": "2col",
+            "table_index": 0,
+            "row_index": 0,
+        }]
+        matched = match_labels_to_fields(pairs)
+        assert matched["threshold_dollar"]["confidence"] == 1.0
+
+    def test_label_matches_several_fields(self):
+        """A pair claimed by one field is still offered to the others."""
+        pairs = [{
+            "label": "Downside threshold level (70% of the initial price)",
+            "value": parse_value("$70.00"),
+            "pattern": "2col",
+            "table_index": 0,
+            "row_index": 0,
+        }]
+        matched = match_labels_to_fields(pairs)
+        assert matched["threshold_dollar"]["confidence"] == 1.0
+        assert matched["threshold_pct"]["confidence"] == 1.0
+
+    def test_exclusions_applied(self):
+        """Aggregate principal amount is not the per-note notional."""
+        pairs = [{
+            "label": "Aggregate principal amount",
+            "value": parse_value("$5,000,000"),
+            "pattern": "2col",
+            "table_index": 0,
+            "row_index": 0,
+        }]
+        assert "notional" not in match_labels_to_fields(pairs)
+
     def test_custom_label_map(self):
         """Should work with a custom label map."""
         custom_map = {
@@ -328,6 +392,34 @@ class TestMatchLabelsToFields:
         assert matched["my_field"]["value"]["dollar"] == 237.52
 
 
+class TestLabelPrefilter:
+    def test_required_literal(self):
+        from structured_products.table_extractor import _required_literal
+
+        assert _required_literal(r"(?:stated\s+)?principal\s+amount") == "principal"
+        assert _required_literal(r"cusip") == "cusip"
+        assert _required_literal(r"sept?") == "sep"
+        assert _required_literal(r"(?:knock[- ]?in)\s+level") == "level"
+        assert _required_literal(r"price|value") is None
+
+    def test_prefilter_matches_full_scan(self, monkeypatch):
+        """Results are the same with and without the Aho-Corasick prefilter."""
+        from structured_products import table_extractor
+
+        labels = [
+            "Initial share price", "Trigger value", "CUSIP / ISIN",
+            "Aggregate principal amount", "Knock-in level", "Pr\u0131cing date",
+        ]
+        pairs = [
+            {"label": label, "value": parse_value("$1.00"), "pattern": "2col",
+             "table_index": 0, "row_index": i}
+            for i, label in enumerate(labels)
+        ]
+        expected = match_labels_to_fields(pairs)
+        monkeypatch.setattr(table_extractor, "_LABEL_AUTOMATON", None)
+        assert match_labels_to_fields(pairs) == expected
+        assert "pricing_date" in expected
+
 # ---------------------------------------------------------------------------
 # Integration: full pipeline from HTML to matched fields
 # ---------------------------------------------------------------------------